@@ -6,6 +6,8 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, TYPE_CHECKING
 
 import config
+from audio_bus import AudioBus
+from audio_preroll import PreRollBuffer
 
 if TYPE_CHECKING:
     from streaming_translation import SmartTargetLanguageSelector
@@ -27,7 +29,14 @@ class AppState:
         self.resampler = None             # AudioResampler | None
         self.debug_pre_audio_recorder = None   # WaveDebugRecorder | None
         self.debug_audio_recorder = None       # WaveDebugRecorder | None
+        self.capture_ring = None               # AudioRingBuffer | None（回调采集模式）
+        self.capture_ready_event: Optional[asyncio.Event] = None
         self.audio_closing: bool = False
+        self.asr_send_stats: dict = {}         # 采集任务的发送队列统计（见 audio_capture_task）
+        # 采集总线：audio_bus 发布每一块处理后的音频，speech_bus 只发布通过 VAD 门控、
+        # 需要送往识别器的音频；新的消费者（电平表、第二识别器等）直接订阅即可
+        self.audio_bus = AudioBus()
+        self.speech_bus = AudioBus()
 
         # ---- 线程 / 异步 ----
         self.executor: ThreadPoolExecutor = ThreadPoolExecutor(
@@ -81,12 +90,13 @@ class AppState:
             "ongoing": False,
         }
 
-        # ---- 本地 VAD 发送门控 ----
-        self.vad_processor = None  # VADProcessor | None
+        # ---- 统一 VAD（在线发送门控 / 本地识别共用） ----
+        self.vad_stream = None  # VADStream | None：唯一运行 VAD 模型的地方
         self.vad_enabled: bool = False
-        self._vad_pending_samples = None  # np.ndarray | None, 累积未处理的音频帧
         self._vad_was_speaking: bool = False  # 上一次检测的状态（用于记录状态变化）
         self._vad_drop_count: int = 0  # 门控丢弃音频帧计数器
+        # 门控关闭期间保留的最近音频，门控打开时先补发
+        self.vad_pre_roll = PreRollBuffer(config.VAD_GATE_PRE_ROLL_MS, config.SAMPLE_RATE)
 
     def update_subtitles(
         self,
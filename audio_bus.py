@@ -0,0 +1,261 @@
+"""
+采集管线的发布/订阅音频总线。
+
+发布方把 AudioFrame 写入共享的定长环形槽位，每个订阅者各自持有读游标，
+帧对象只存一份、按引用分发（AudioFrame 不可变），不会为订阅者复制。
+
+订阅方式：
+- 回调订阅：发布时在发布方线程内同步调用，适合廉价且不阻塞的消费者
+  （VAD 门控、调试录音、电平表）；异常被吞掉并计入该订阅的 errors；
+- 游标订阅：消费者在自己的任务里 ``await sub.get()`` 拉取，积压超过
+  ``max_pending`` 时按背压策略处理：
+  - ``drop_oldest``：跳过最旧的未读帧并计数，发布方永不等待；
+  - ``block``：``await bus.publish()`` 最多等待 ``block_timeout`` 秒让该订阅者
+    腾出空间，超时后仍按 drop_oldest 处理并计入 overruns，慢消费者对采集
+    循环的影响有上界。``publish_nowait`` 从不等待。
+
+总线只在单个事件循环线程内使用，不加锁。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from audio_frame import AudioFrame
+
+DEFAULT_CAPACITY = 256
+POLICY_DROP_OLDEST = 'drop_oldest'
+POLICY_BLOCK = 'block'
+_POLICIES = (POLICY_DROP_OLDEST, POLICY_BLOCK)
+
+
+class BusItem(NamedTuple):
+    """总线上的一条记录。"""
+
+    seq: int
+    frame: AudioFrame
+    tag: Any = None
+
+
+class BusSubscription:
+    """一个订阅者：回调订阅或带独立游标的拉取订阅。"""
+
+    def __init__(
+        self,
+        bus: "AudioBus",
+        name: str,
+        *,
+        callback: Optional[Callable[[AudioFrame], None]] = None,
+        policy: str = POLICY_DROP_OLDEST,
+        max_pending: Optional[int] = None,
+        block_timeout: float = 0.05,
+    ):
+        if policy not in _POLICIES:
+            raise ValueError(f"未知的背压策略: {policy}")
+        self.bus = bus
+        self.name = str(name)
+        self.callback = callback
+        self.policy = policy
+        limit = bus.capacity if max_pending is None else int(max_pending)
+        self.max_pending = max(1, min(limit, bus.capacity))
+        self.block_timeout = max(0.0, float(block_timeout))
+        self.closed = False
+        self._cursor = bus.next_seq
+        self._data_ready = asyncio.Event()
+        self._space_ready = asyncio.Event()
+        self._space_ready.set()
+
+        # ---- 统计 ----
+        self.delivered = 0          # 回调调用次数 / 被取走的帧数
+        self.dropped = 0            # 因积压被跳过的帧数
+        self.overruns = 0           # block 策略等待超时的次数
+        self.errors = 0             # 回调抛出的异常次数
+        self.max_lag = 0            # 积压帧数的高水位
+        self.blocked_seconds = 0.0  # 发布方为该订阅者等待的累计时长
+
+    @property
+    def is_callback(self) -> bool:
+        return self.callback is not None
+
+    @property
+    def lag(self) -> int:
+        """尚未取走的帧数。"""
+        return self.bus.next_seq - self._cursor
+
+    # ---- 发布方调用 ----
+
+    def _deliver(self, item: BusItem) -> None:
+        if self.callback is not None:
+            try:
+                self.callback(item.frame)
+                self.delivered += 1
+            except Exception:
+                self.errors += 1
+            return
+        lag = self.lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+        if lag >= self.max_pending:
+            self._space_ready.clear()
+        self._data_ready.set()
+
+    def _make_room(self) -> None:
+        """写入下一帧前调用：积压已满时跳过最旧的帧。"""
+        excess = self.lag + 1 - self.max_pending
+        if excess > 0:
+            self._cursor += excess
+            self.dropped += excess
+
+    # ---- 消费方调用 ----
+
+    def peek(self) -> Optional[BusItem]:
+        """返回下一条未读记录但不取走；没有时返回 None。"""
+        if self.lag <= 0:
+            return None
+        return self.bus._slot(self._cursor)
+
+    def get_nowait(self) -> Optional[BusItem]:
+        item = self.peek()
+        if item is None:
+            return None
+        self._cursor += 1
+        self.delivered += 1
+        if self.lag < self.max_pending:
+            self._space_ready.set()
+        if self.lag <= 0:
+            self._data_ready.clear()
+        return item
+
+    async def get(self) -> BusItem:
+        """等待并取走下一条记录。"""
+        while True:
+            item = self.get_nowait()
+            if item is not None:
+                return item
+            self._data_ready.clear()
+            await self._data_ready.wait()
+
+    def clear(self) -> int:
+        """丢弃全部未读记录，返回丢弃的条数（不计入 dropped）。"""
+        skipped = max(0, self.lag)
+        self._cursor = self.bus.next_seq
+        self._data_ready.clear()
+        self._space_ready.set()
+        return skipped
+
+    def close(self) -> None:
+        self.bus.unsubscribe(self)
+
+    def stats(self) -> dict:
+        data = {
+            'name': self.name,
+            'kind': 'callback' if self.is_callback else 'cursor',
+            'delivered': self.delivered,
+            'errors': self.errors,
+        }
+        if not self.is_callback:
+            data.update({
+                'policy': self.policy,
+                'max_pending': self.max_pending,
+                'lag': self.lag,
+                'max_lag': self.max_lag,
+                'dropped': self.dropped,
+                'overruns': self.overruns,
+                'blocked_ms': round(self.blocked_seconds * 1000.0, 3),
+            })
+        return data
+
+
+class AudioBus:
+    """单发布方、多订阅者的 AudioFrame 总线。
+
+    Parameters
+    ----------
+    capacity : int
+        共享环形槽位数，即任一游标订阅者最多可积压的帧数。
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if int(capacity) <= 0:
+            raise ValueError(f"capacity 必须为正数: {capacity}")
+        self.capacity = int(capacity)
+        self._slots: List[Optional[BusItem]] = [None] * self.capacity
+        self._seq = 0
+        self._subscribers: List[BusSubscription] = []
+        self.published = 0
+
+    @property
+    def next_seq(self) -> int:
+        return self._seq
+
+    def _slot(self, seq: int) -> BusItem:
+        return self._slots[seq % self.capacity]
+
+    def subscribe(
+        self,
+        name: str,
+        *,
+        callback: Optional[Callable[[AudioFrame], None]] = None,
+        policy: str = POLICY_DROP_OLDEST,
+        max_pending: Optional[int] = None,
+        block_timeout: float = 0.05,
+    ) -> BusSubscription:
+        """新增订阅者；只会收到订阅之后发布的帧。回调订阅按订阅顺序调用。"""
+        sub = BusSubscription(
+            self, name,
+            callback=callback,
+            policy=policy,
+            max_pending=max_pending,
+            block_timeout=block_timeout,
+        )
+        self._subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: BusSubscription) -> None:
+        sub.closed = True
+        sub._space_ready.set()
+        try:
+            self._subscribers.remove(sub)
+        except ValueError:
+            pass
+
+    @property
+    def subscribers(self) -> List[BusSubscription]:
+        return list(self._subscribers)
+
+    async def publish(self, frame: AudioFrame, tag: Any = None) -> int:
+        """发布一帧；block 订阅者积压已满时最多等待其 block_timeout。"""
+        for sub in self._subscribers:
+            if sub.policy != POLICY_BLOCK or sub.is_callback or sub.lag < sub.max_pending:
+                continue
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(sub._space_ready.wait(), timeout=sub.block_timeout)
+            except asyncio.TimeoutError:
+                sub.overruns += 1
+            sub.blocked_seconds += time.perf_counter() - started
+        return self.publish_nowait(frame, tag)
+
+    def publish_nowait(self, frame: AudioFrame, tag: Any = None) -> int:
+        """发布一帧且从不等待，返回该帧的序号。"""
+        seq = self._seq
+        subscribers = self._subscribers
+        for sub in subscribers:
+            if not sub.is_callback:
+                sub._make_room()
+        item = BusItem(seq, frame, tag)
+        self._slots[seq % self.capacity] = item
+        self._seq = seq + 1
+        self.published += 1
+        for sub in list(subscribers):
+            sub._deliver(item)
+        return seq
+
+    def stats(self) -> dict:
+        return {
+            'capacity': self.capacity,
+            'published': self.published,
+            'subscribers': [sub.stats() for sub in self._subscribers],
+        }
@@ -8,18 +8,48 @@ import time
 from typing import Optional
 
 import numpy as np
-import pyaudio
+
+try:
+    import pyaudio
+except ImportError as exc:  # pragma: no cover - 无声卡环境（离线回放）下允许缺失
+    pyaudio = None
+    _PYAUDIO_IMPORT_ERROR = exc
+else:
+    _PYAUDIO_IMPORT_ERROR = None
 
 import config
+from audio_bus import POLICY_DROP_OLDEST
+from audio_frame import AudioFrame
 from audio_resampler import AudioResampler
 from audio_debug_recorder import WaveDebugRecorder
+from audio_ring_buffer import AudioRingBuffer
 from audio_runtime_guard import hold_portaudio, _suppress_stderr
+from latency_trace import latency_tracer
+from speech_recognizers.base_speech_recognizer import SpeechRecognizer
+from vad_stream import VAD_CHUNK_SAMPLES, VADStream
 
 logger = logging.getLogger(__name__)
 
 RECOGNIZER_CHANNELS = 1
 ASR_SEND_QUEUE_SECONDS = 3.0
 ASR_SEND_QUEUE_MIN_FRAMES = 10
+CALLBACK_READ_TIMEOUT_SECONDS = 0.5
+VAD_DIAG_INTERVAL_SECONDS = 5.0
+
+
+def _is_callback_capture_mode() -> bool:
+    return str(getattr(config, 'AUDIO_CAPTURE_MODE', 'blocking')).strip().lower() == 'callback'
+
+
+def _make_stream_callback(ring: AudioRingBuffer):
+    """PortAudio 回调：仅把数据写入环形缓冲区，不做任何其它处理。"""
+    def _callback(in_data, frame_count, time_info, status_flags):
+        if status_flags & pyaudio.paInputOverflow:
+            ring.note_input_overflow()
+        ring.write(in_data)
+        return (None, pyaudio.paContinue)
+
+    return _callback
 
 
 async def init_audio_stream(state):
@@ -31,8 +61,23 @@ async def init_audio_stream(state):
     loop = asyncio.get_event_loop()
     state.ensure_audio_executor()
     state.audio_closing = False
+    use_callback = _is_callback_capture_mode()
+    state.capture_ring = None
+    state.capture_ready_event = asyncio.Event() if use_callback else None
+
+    def _notify_ready():
+        event = state.capture_ready_event
+        if event is None:
+            return
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # 事件循环已关闭（服务停止过程中），忽略即可
+            pass
 
     def _init():
+        if pyaudio is None:
+            raise RuntimeError('缺少 pyaudio 依赖，无法打开麦克风') from _PYAUDIO_IMPORT_ERROR
         with hold_portaudio("init_audio_stream"):
             with _suppress_stderr():
                 state.mic = pyaudio.PyAudio()
@@ -79,6 +124,15 @@ async def init_audio_stream(state):
                 )
                 if idx is not None:
                     kwargs['input_device_index'] = int(idx)
+                if use_callback:
+                    ring_seconds = float(getattr(config, 'AUDIO_CALLBACK_RING_SECONDS', 2.0) or 2.0)
+                    ring = AudioRingBuffer(
+                        capacity_frames=max(int(frames_per_buffer) * 2, int(rate * ring_seconds)),
+                        channels=int(channels),
+                    )
+                    ring.set_notifier(_notify_ready, min_frames=int(frames_per_buffer))
+                    state.capture_ring = ring
+                    kwargs['stream_callback'] = _make_stream_callback(ring)
                 return state.mic.open(**kwargs)
 
             def _get_device_default_rate(idx: Optional[int]) -> Optional[int]:
@@ -90,15 +144,7 @@ async def init_audio_stream(state):
                 return None
 
             def _init_resampler(in_rate: int, out_rate: int):
-                if in_rate != out_rate:
-                    state.resampler = AudioResampler(
-                        input_rate=in_rate,
-                        output_rate=out_rate,
-                        channels=target_channels,
-                        sample_width=2,
-                    )
-                else:
-                    state.resampler = None
+                state.resampler = create_resampler(in_rate, out_rate, target_channels)
 
             def _init_debug_audio_recorders(in_rate: int, out_rate: int):
                 if state.debug_pre_audio_recorder is not None:
@@ -195,6 +241,8 @@ async def init_audio_stream(state):
                         raise
 
             print(f'[Audio] 实际采集格式: {state.input_sample_rate}Hz / {state.capture_channels}ch / 16-bit')
+            if state.capture_ring is not None:
+                print(f'[Audio] 回调采集模式：环形缓冲区 {state.capture_ring.capacity} 帧')
             if state.capture_channels != target_channels:
                 print(f'[Audio] 发送给识别器前将转换为: {target_rate}Hz / {target_channels}ch / 16-bit')
 
@@ -204,10 +252,26 @@ async def init_audio_stream(state):
     return await loop.run_in_executor(state.audio_executor, _init)
 
 
+def _close_debug_recorder(recorder: WaveDebugRecorder, label: str) -> None:
+    recorder.close()
+    print(f'[Audio] {label}的音频已保存到: {recorder.file_path}')
+    stats = recorder.stats()
+    if stats['error']:
+        print(f"[Audio] {label}调试录音写盘失败，录音不完整: {stats['error']}")
+    elif stats['dropped_blocks']:
+        print(
+            f"[Audio] {label}调试录音写盘跟不上，丢弃 {stats['dropped_blocks']} 块 "
+            f"({stats['dropped_bytes']} 字节)"
+        )
+
+
 async def close_audio_stream(state):
     """异步关闭音频流。"""
     loop = asyncio.get_event_loop()
     state.audio_closing = True
+    if state.capture_ready_event is not None:
+        # 唤醒正在等待回调数据的读取方
+        state.capture_ready_event.set()
 
     def _close():
         with hold_portaudio("close_audio_stream"):
@@ -216,15 +280,20 @@ async def close_audio_stream(state):
                 state.stream.close()
             if state.mic:
                 state.mic.terminate()
+            if state.capture_ring is not None:
+                stats = state.capture_ring.stats()
+                print(
+                    f"[Audio] 回调采集统计: overruns={stats['overruns']}, "
+                    f"dropped_frames={stats['dropped_frames']}, "
+                    f"input_overflows={stats['input_overflows']}, "
+                    f"max_depth={stats['max_depth_frames']}/{stats['capacity_frames']}"
+                )
+                state.capture_ring = None
             if state.debug_pre_audio_recorder:
-                saved_file = state.debug_pre_audio_recorder.file_path
-                state.debug_pre_audio_recorder.close()
-                print(f'[Audio] 重采样前的音频已保存到: {saved_file}')
+                _close_debug_recorder(state.debug_pre_audio_recorder, '重采样前')
                 state.debug_pre_audio_recorder = None
             if state.debug_audio_recorder:
-                saved_file = state.debug_audio_recorder.file_path
-                state.debug_audio_recorder.close()
-                print(f'[Audio] 重采样后的音频已保存到: {saved_file}')
+                _close_debug_recorder(state.debug_audio_recorder, '重采样后')
                 state.debug_audio_recorder = None
             state.stream = None
             state.mic = None
@@ -232,11 +301,150 @@ async def close_audio_stream(state):
     await loop.run_in_executor(state.audio_executor, _close)
 
 
+def create_resampler(in_rate: int, out_rate: int, channels: int = RECOGNIZER_CHANNELS):
+    """按配置的重采样引擎创建 AudioResampler；采样率相同时返回 None。"""
+    if int(in_rate) == int(out_rate):
+        return None
+    engine = getattr(config, 'AUDIO_RESAMPLER_ENGINE', 'auto')
+    try:
+        resampler = AudioResampler(
+            input_rate=in_rate,
+            output_rate=out_rate,
+            channels=channels,
+            sample_width=2,
+            engine=engine,
+        )
+    except ValueError as e:
+        print(f"[Audio] 重采样引擎 {engine} 不可用（{e}），改用 auto")
+        resampler = AudioResampler(
+            input_rate=in_rate,
+            output_rate=out_rate,
+            channels=channels,
+            sample_width=2,
+        )
+    print(f"[Audio] 重采样: {in_rate}Hz -> {out_rate}Hz ({resampler.engine})")
+    return resampler
+
+
+def create_vad_stream(gating: bool = True) -> VADStream:
+    """按统一 VAD 配置创建共享 VAD 流（唯一运行 VAD 模型的 VADProcessor）。
+
+    gating=True 用于在线发送门控：沿用 silero / cascade，energy 回退为 silero；
+    gating=False 用于本地识别：沿用 LOCAL_VAD_MODE，不做门控，本地识别器
+    订阅逐块流并复用其置信度。
+    """
+    from local_asr.model_manager import is_silero_cached, download_silero
+    from local_asr.vad_processor import VADProcessor
+
+    mode = getattr(config, 'LOCAL_VAD_MODE', 'silero')
+    if gating and mode not in ('silero', 'cascade'):
+        mode = 'silero'
+    if mode in ('silero', 'cascade'):
+        if not is_silero_cached():
+            print('[VAD] Silero ONNX 模型未下载，正在自动下载...')
+            download_silero()
+        print('[VAD] Silero ONNX 模型就绪，正在初始化...')
+
+    processor = VADProcessor(
+        sample_rate=config.SAMPLE_RATE,
+        threshold=config.LOCAL_VAD_THRESHOLD,
+        min_speech_duration=config.LOCAL_VAD_MIN_SPEECH_DURATION,
+        chunk_duration=VAD_CHUNK_SAMPLES / config.SAMPLE_RATE,
+        pre_speech_duration=config.LOCAL_VAD_PRE_SPEECH_DURATION,
+    )
+    processor.update_settings({
+        'vad_mode': mode,
+        'vad_threshold': config.LOCAL_VAD_THRESHOLD,
+        'min_speech_duration': config.LOCAL_VAD_MIN_SPEECH_DURATION,
+        'silence_duration': config.LOCAL_VAD_SILENCE_DURATION,
+        'pre_speech_duration': config.LOCAL_VAD_PRE_SPEECH_DURATION,
+        'adaptive_endpoint': getattr(config, 'LOCAL_VAD_ADAPTIVE_ENDPOINT', False),
+    })
+    stream = VADStream(processor, sample_rate=config.SAMPLE_RATE)
+    stream.gating = bool(gating)
+    return stream
+
+
+def _downmix_pcm16(data: bytes, channels: int) -> bytes:
+    samples = np.frombuffer(data, dtype=np.int16)
+    num_frames = len(samples) // channels
+    if num_frames <= 0:
+        return b''
+    frames = samples[: num_frames * channels].reshape(num_frames, channels)
+    mono = np.rint(frames.sum(axis=1, dtype=np.int32) / channels)
+    return np.clip(mono, -32768, 32767).astype(np.int16).tobytes()
+
+
+def _process_captured_block(state, data: bytes):
+    """采集管线唯一的转换阶段：下混、重采样，并生成共享的 AudioFrame。
+
+    返回的帧发布到 state.audio_bus，各订阅者共享同一帧，不再重复转换；
+    重采样前的调试录音需要设备原始格式，仍在此处写入。
+    """
+    if state.debug_pre_audio_recorder is not None:
+        state.debug_pre_audio_recorder.write(data)
+
+    capture_data = data
+    if state.capture_channels != RECOGNIZER_CHANNELS:
+        capture_data = _downmix_pcm16(data, int(state.capture_channels))
+        if not capture_data:
+            return b''
+
+    processed_data = (
+        state.resampler.resample(capture_data)
+        if state.resampler is not None
+        else capture_data
+    )
+    if not processed_data:
+        return b''
+    return AudioFrame.from_pcm16(processed_data, int(config.SAMPLE_RATE))
+
+
+async def _read_from_capture_ring(state):
+    """回调模式：等待环形缓冲区积满一个块后在事件循环线程内直接处理。
+
+    由回调线程的唤醒驱动，不做定时轮询；积压时直接取走数据，仅让出一次
+    事件循环，保证发送等其它任务不被追赶积压的循环饿死。
+    """
+    ring = state.capture_ring
+    event = state.capture_ready_event
+    block = int(state.input_block_size)
+
+    data = ring.read(block)
+    if data is not None:
+        await asyncio.sleep(0)
+    else:
+        event.clear()
+        # clear 之后再检查一次，避免错过回调线程在两者之间发出的唤醒
+        data = ring.read(block)
+    if data is None:
+        # 超时用定时器置位同一个事件，避免 wait_for 每块额外创建一个 Task
+        timer = asyncio.get_running_loop().call_later(CALLBACK_READ_TIMEOUT_SECONDS, event.set)
+        try:
+            await event.wait()
+        finally:
+            timer.cancel()
+        if state.audio_closing or state.stream is None:
+            return None
+        data = ring.read(block)
+        if data is None:
+            return b''
+
+    try:
+        return _process_captured_block(state, data)
+    except Exception as e:
+        print(f'Error reading audio data: {e}')
+        return None
+
+
 async def read_audio_data(state):
     """异步读取音频数据。"""
     if state.audio_closing or not state.stream:
         return None
 
+    if state.capture_ring is not None and state.capture_ready_event is not None:
+        return await _read_from_capture_ring(state)
+
     loop = asyncio.get_event_loop()
 
     def _read():
@@ -246,32 +454,7 @@ async def read_audio_data(state):
             data = state.stream.read(state.input_block_size, exception_on_overflow=False)
             if not data:
                 return None
-            if state.debug_pre_audio_recorder is not None:
-                state.debug_pre_audio_recorder.write(data)
-
-            capture_data = data
-            if state.capture_channels != RECOGNIZER_CHANNELS:
-                samples = np.frombuffer(data, dtype=np.int16)
-                num_frames = len(samples) // int(state.capture_channels)
-                if num_frames <= 0:
-                    return b''
-                frames = (
-                    samples[: num_frames * int(state.capture_channels)]
-                    .reshape(num_frames, int(state.capture_channels))
-                    .astype(np.int32)
-                )
-                mono = np.rint(np.mean(frames, axis=1))
-                mono = np.clip(mono, -32768, 32767).astype(np.int16)
-                capture_data = mono.tobytes()
-
-            processed_data = (
-                state.resampler.resample(capture_data)
-                if state.resampler is not None
-                else capture_data
-            )
-            if state.debug_audio_recorder is not None and processed_data:
-                state.debug_audio_recorder.write(processed_data)
-            return processed_data
+            return _process_captured_block(state, data)
         except Exception as e:
             print(f'Error reading audio data: {e}')
             return None
@@ -279,12 +462,19 @@ async def read_audio_data(state):
     return await loop.run_in_executor(state.audio_executor, _read)
 
 
-async def send_audio_frame_async(state, recognizer, data: bytes):
-    """异步发送音频帧。"""
+async def send_audio_frame_async(state, recognizer, data):
+    """异步发送音频帧（AudioFrame 或 PCM 字节）。"""
     loop = asyncio.get_event_loop()
     state.ensure_asr_send_executor()
+    if isinstance(data, AudioFrame):
+        if isinstance(recognizer, SpeechRecognizer):
+            send, payload = recognizer.send_audio, data
+        else:
+            send, payload = recognizer.send_audio_frame, data.pcm
+    else:
+        send, payload = recognizer.send_audio_frame, data
     try:
-        await loop.run_in_executor(state.asr_send_executor, recognizer.send_audio_frame, data)
+        await loop.run_in_executor(state.asr_send_executor, send, payload)
     except Exception:
         pass
 
@@ -296,132 +486,210 @@ def _asr_send_queue_maxsize() -> int:
     return max(ASR_SEND_QUEUE_MIN_FRAMES, int(ASR_SEND_QUEUE_SECONDS / block_seconds))
 
 
-def _drop_oldest_queue_item(queue: asyncio.Queue) -> None:
-    try:
-        queue.get_nowait()
-        queue.task_done()
-    except asyncio.QueueEmpty:
-        pass
+def _coalesce_limit_bytes(recognizer) -> int:
+    """合并发送的字节上限，0 表示不合并。
 
+    只有声明了 max_audio_append_bytes 的识别器才合并（其余后端对单次发送大小的
+    承受能力未知）；全局配置大于 0 时再与之取较小值。
+    """
+    if not isinstance(recognizer, SpeechRecognizer):
+        return 0
+    backend_limit = recognizer.max_audio_append_bytes
+    if backend_limit is None:
+        return 0
+    limit = max(0, int(backend_limit))
+    cap = max(0, int(getattr(config, 'ASR_SEND_COALESCE_MAX_BYTES', 0) or 0))
+    return min(limit, cap) if cap > 0 else limit
 
-async def audio_capture_task(state, recognizer):
-    """异步音频捕获任务。"""
-    print('Starting audio capture...')
-    send_queue: asyncio.Queue = asyncio.Queue(maxsize=_asr_send_queue_maxsize())
-    last_queue_warning_at = 0.0
 
-    async def _sender_worker():
-        while True:
-            generation, frame = await send_queue.get()
-            try:
-                if (
-                    state.recognition_active
-                    and generation == getattr(state, 'audio_send_generation', 0)
-                ):
-                    await send_audio_frame_async(state, recognizer, frame)
-            finally:
-                send_queue.task_done()
+def _frame_nbytes(frame) -> int:
+    return len(frame.pcm) if isinstance(frame, AudioFrame) else len(frame)
+
+
+def _coalesce_frames(frames: list):
+    if len(frames) == 1:
+        return frames[0]
+    if all(isinstance(frame, AudioFrame) for frame in frames):
+        return AudioFrame.concat(frames)
+    return b''.join(frame.pcm if isinstance(frame, AudioFrame) else frame for frame in frames)
 
-    sender_task = asyncio.create_task(_sender_worker())
 
-    # VAD 侧路 chunk 大小（Silero 16kHz 固定）
-    _vad_chunk_samples = 512
-    _vad_chunk_count = 0
-    _vad_last_diag_at = 0.0
-    _vad_verbose_raw = (
+def _subscribe_capture_consumers(state, send_stats: dict):
+    """把采集任务自带的消费者挂到总线上，返回订阅列表（任务结束时注销）。
+
+    - 调试录音（重采样后）：audio_bus 回调订阅；
+    - VAD 门控：audio_bus 回调订阅，推送共享 VAD 流分析语音状态，门控打开时先把
+      起声前缓存、再把实时帧发布到 speech_bus（tag 为发送代次）；VAD 流不做门控
+      （本地识别）时音频随逐块流送达识别器，不再发布到 speech_bus；
+    - ASR 发送：speech_bus 游标订阅，由 _sender_worker 拉取。
+    """
+    audio_bus = state.audio_bus
+    speech_bus = state.speech_bus
+    subscriptions = []
+
+    recorder = state.debug_audio_recorder
+    if recorder is not None:
+        subscriptions.append(audio_bus.subscribe(
+            'debug_post_resample', callback=lambda frame: recorder.write(frame.pcm),
+        ))
+
+    vad_chunk_count = 0
+    vad_last_diag_at = 0.0
+    vad_verbose_raw = (
         os.environ.get('ENABLE_VAD_GATING_VERBOSE')
         or os.environ.get('ENABLE_LOCAL_VAD_GATING_VERBOSE')
         or ''
     )
-    _vad_verbose = _vad_verbose_raw.strip().lower() in ('1', 'true', 'yes', 'on')
+    vad_verbose = vad_verbose_raw.strip().lower() in ('1', 'true', 'yes', 'on')
+
+    def _analyze_vad(data: AudioFrame) -> None:
+        nonlocal vad_chunk_count, vad_last_diag_at
+        try:
+            for result in state.vad_stream.push(data.samples):
+                vad_chunk_count += 1
+                # 检测 VAD 内部状态变化
+                is_speaking = result.is_speaking
+                if is_speaking != state._vad_was_speaking:
+                    state._vad_was_speaking = is_speaking
+                    conf = result.confidence
+                    if is_speaking:
+                        latency_tracer.mark(latency_tracer.current(), 'speech_start')
+                        print(f'[VAD] ▶ SPEECH 开始 (chunk=#{vad_chunk_count}, 置信度={conf:.3f})')
+                    else:
+                        latency_tracer.mark_current('speech_end')
+                        print(f'[VAD] ■ SILENCE (chunk=#{vad_chunk_count}, 置信度={conf:.3f})')
+                # 定期诊断（仅在 verbose 模式下显示）
+                if vad_verbose:
+                    now = time.monotonic()
+                    if now - vad_last_diag_at > VAD_DIAG_INTERVAL_SECONDS:
+                        vad_last_diag_at = now
+                        conf = result.confidence
+                        label = 'SPEECH' if is_speaking else 'SILENCE'
+                        print(f'[VAD] diag: chunks={vad_chunk_count}, state={label}, conf={conf:.3f}')
+        except Exception:
+            # VAD 错误不应中断音频流
+            import traceback
+            if vad_verbose:
+                now = time.monotonic()
+                if now - vad_last_diag_at > VAD_DIAG_INTERVAL_SECONDS:
+                    vad_last_diag_at = now
+                    print('[VAD] ⚠ 处理异常（静默）')
+                    traceback.print_exc()
+
+    def _vad_gate(data: AudioFrame) -> None:
+        # 只有在识别激活时才发送音频数据,否则丢弃
+        if not state.recognition_active:
+            state.vad_pre_roll.clear()
+            return
+        stream = state.vad_stream
+        vad_active = state.vad_enabled and stream is not None
+        # VAD 侧路分析（仅在识别激活时进行）
+        if vad_active:
+            _analyze_vad(data)
+            if not stream.gating:
+                # 本地识别器直接订阅逐块 VAD 流，音频随块送达，不再经 speech_bus 转发
+                return
+        # VAD 门控：静音时不发送音频到 ASR（省流），说话时正常发送；
+        # 门控打开时先补发起声前缓存的音频
+        if not vad_active or stream.is_speaking:
+            generation = getattr(state, 'audio_send_generation', 0)
+            for frame in state.vad_pre_roll.drain():
+                speech_bus.publish_nowait(frame, generation)
+            speech_bus.publish_nowait(data, generation)
+        else:
+            state.vad_pre_roll.push(data)
+            if vad_verbose:
+                state._vad_drop_count += 1
+                if state._vad_drop_count == 1 or state._vad_drop_count % 100 == 0:
+                    is_sp = stream.is_speaking if stream is not None else 'N/A'
+                    print(f'[VAD-gate] 丢弃音频帧 (累计={state._vad_drop_count}, is_speaking={is_sp})')
+
+    subscriptions.append(audio_bus.subscribe('vad_gate', callback=_vad_gate))
+    subscriptions.append(speech_bus.subscribe(
+        'asr_send', policy=POLICY_DROP_OLDEST, max_pending=_asr_send_queue_maxsize(),
+    ))
+    send_stats['queue_capacity'] = subscriptions[-1].max_pending
+    return subscriptions
+
+
+async def audio_capture_task(state, recognizer):
+    """异步音频捕获任务：读取、转换后发布到 state.audio_bus，消费者各自订阅。"""
+    print('Starting audio capture...')
+    last_drop_warning_at = 0.0
+    reported_drops = 0
+
+    coalesce_limit = _coalesce_limit_bytes(recognizer)
+    send_stats = {
+        'sends': 0,
+        'frames': 0,
+        'coalesced_sends': 0,
+        'max_frames_per_send': 0,
+        'queue_capacity': 0,
+        'queue_high_water': 0,
+        'queue_dropped_frames': 0,
+    }
+    state.asr_send_stats = send_stats
+    subscriptions = _subscribe_capture_consumers(state, send_stats)
+    asr_sub = subscriptions[-1]
+
+    async def _sender_worker():
+        # 取出一帧后，把已积压的同代帧一并合并发送（不超过字节上限），
+        # 网络卡顿后可一次追上而不是逐帧排队丢弃
+        while True:
+            item = await asr_sub.get()
+            generation = item.tag
+            if not (
+                state.recognition_active
+                and generation == getattr(state, 'audio_send_generation', 0)
+            ):
+                continue
+            frames = [item.frame]
+            batch_bytes = _frame_nbytes(item.frame)
+            while coalesce_limit > 0:
+                next_item = asr_sub.peek()
+                if next_item is None or next_item.tag != generation:
+                    break
+                next_bytes = _frame_nbytes(next_item.frame)
+                if batch_bytes + next_bytes > coalesce_limit:
+                    break
+                asr_sub.get_nowait()
+                frames.append(next_item.frame)
+                batch_bytes += next_bytes
+            send_stats['sends'] += 1
+            send_stats['frames'] += len(frames)
+            if len(frames) > 1:
+                send_stats['coalesced_sends'] += 1
+                send_stats['max_frames_per_send'] = max(send_stats['max_frames_per_send'], len(frames))
+            latency_tracer.mark_current('audio_sent')
+            await send_audio_frame_async(state, recognizer, _coalesce_frames(frames))
+
+    sender_task = asyncio.create_task(_sender_worker())
 
     # 一次性报告 VAD 状态
-    if state.vad_enabled and state.vad_processor is not None:
+    if state.vad_enabled and state.vad_stream is not None:
         print(f'[VAD] capture loop 已激活，等待语音...')
     else:
-        print(f'[VAD] capture loop — VAD 未启用 (enabled={state.vad_enabled}, proc={state.vad_processor is not None})')
+        print(f'[VAD] capture loop — VAD 未启用 (enabled={state.vad_enabled}, stream={state.vad_stream is not None})')
 
     try:
         while not state.stop_event.is_set():
-            # 始终读取音频数据,避免缓冲区积压
+            # 始终读取音频数据,避免缓冲区积压；读取本身会等待音频源就绪，
+            # 循环中没有定时 sleep
             data = await read_audio_data(state)
             if data is None:
                 break
             if not data:
-                await asyncio.sleep(0.001)
                 continue
 
-            # ── VAD 侧路分析（不阻塞主通道，且仅在识别激活时进行） ──
-            if state.recognition_active and state.vad_enabled and state.vad_processor is not None:
-                try:
-                    samples = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
-                    pending = state._vad_pending_samples
-                    if pending is not None and len(pending) > 0:
-                        samples = np.concatenate([pending, samples])
-                    offset = 0
-                    while offset + _vad_chunk_samples <= len(samples):
-                        chunk = samples[offset:offset + _vad_chunk_samples]
-                        state.vad_processor.process_chunk(chunk)
-                        offset += _vad_chunk_samples
-                        _vad_chunk_count += 1
-                        # 检测 VAD 内部状态变化
-                        is_speaking = state.vad_processor.is_speaking
-                        if is_speaking != state._vad_was_speaking:
-                            state._vad_was_speaking = is_speaking
-                            conf = state.vad_processor.last_confidence
-                            if is_speaking:
-                                print(f'[VAD] ▶ SPEECH 开始 (chunk=#{_vad_chunk_count}, 置信度={conf:.3f})')
-                            else:
-                                print(f'[VAD] ■ SILENCE (chunk=#{_vad_chunk_count}, 置信度={conf:.3f})')
-                        # 定期诊断（仅在 verbose 模式下显示）
-                        if _vad_verbose:
-                            now = time.monotonic()
-                            if now - _vad_last_diag_at > _vad_diag_interval:
-                                _vad_last_diag_at = now
-                                conf = state.vad_processor.last_confidence
-                                label = 'SPEECH' if is_speaking else 'SILENCE'
-                                print(f'[VAD] diag: chunks={_vad_chunk_count}, state={label}, conf={conf:.3f}')
-                    # 保留不足一个 chunk 的剩余帧
-                    state._vad_pending_samples = np.array(
-                        samples[offset:], dtype=np.float32, copy=True
-                    )
-                except Exception:
-                    # VAD 错误不应中断音频流
-                    import traceback
-                    if _vad_verbose:
-                        now = time.monotonic()
-                        if now - _vad_last_diag_at > _vad_diag_interval:
-                            _vad_last_diag_at = now
-                            print('[VAD] ⚠ 处理异常（静默）')
-                            traceback.print_exc()
-
-            # 只有在识别激活时才发送音频数据,否则丢弃
-            # VAD 门控：静音时不发送音频到 ASR（省流），说话时正常发送
-            if state.recognition_active:
-                _should_send = True
-                if state.vad_enabled and state.vad_processor is not None:
-                    _should_send = state.vad_processor.is_speaking
-                if _should_send:
-                    item = (getattr(state, 'audio_send_generation', 0), data)
-                    try:
-                        send_queue.put_nowait(item)
-                    except asyncio.QueueFull:
-                        _drop_oldest_queue_item(send_queue)
-                        send_queue.put_nowait(item)
-                        now = time.monotonic()
-                        if now - last_queue_warning_at > 5.0:
-                            print('[Audio] ASR发送队列已满，丢弃最旧音频帧以保持实时采集')
-                            last_queue_warning_at = now
-                elif _vad_verbose:
-                    state._vad_drop_count += 1
-                    if state._vad_drop_count == 1 or state._vad_drop_count % 100 == 0:
-                        is_sp = state.vad_processor.is_speaking if state.vad_processor else 'N/A'
-                        print(f'[VAD-gate] 丢弃音频帧 (累计={state._vad_drop_count}, is_speaking={is_sp})')
-            elif not send_queue.empty():
-                while not send_queue.empty():
-                    _drop_oldest_queue_item(send_queue)
-
-            await asyncio.sleep(0.001)  # 避免阻塞事件循环
+            await state.audio_bus.publish(data)
+
+            send_stats['queue_high_water'] = asr_sub.max_lag
+            if asr_sub.dropped != reported_drops:
+                send_stats['queue_dropped_frames'] = reported_drops = asr_sub.dropped
+                now = time.monotonic()
+                if now - last_drop_warning_at > 5.0:
+                    print('[Audio] ASR发送队列已满，丢弃最旧音频帧以保持实时采集')
+                    last_drop_warning_at = now
     except asyncio.CancelledError:
         print('Audio capture task cancelled.')
     except Exception as e:
@@ -432,4 +700,21 @@ async def audio_capture_task(state, recognizer):
             await sender_task
         except asyncio.CancelledError:
             pass
+        for sub in subscriptions:
+            sub.close()
+            if sub.errors:
+                print(f'[Audio] 总线订阅者 {sub.name} 处理异常 {sub.errors} 次')
+        send_stats['queue_high_water'] = asr_sub.max_lag
+        send_stats['queue_dropped_frames'] = asr_sub.dropped
+        if send_stats['coalesced_sends']:
+            print(
+                f"[Audio] ASR发送合并统计: sends={send_stats['sends']}, frames={send_stats['frames']}, "
+                f"coalesced={send_stats['coalesced_sends']}, max_frames={send_stats['max_frames_per_send']}"
+            )
+        pre_roll = state.vad_pre_roll.stats()
+        if pre_roll['flushes']:
+            print(
+                f"[VAD-gate] 起声前补发统计: flushes={pre_roll['flushes']}, "
+                f"frames={pre_roll['replayed_frames']}, audio={pre_roll['replayed_ms']}ms"
+            )
         print('Audio capture stopped.')
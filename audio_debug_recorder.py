@@ -2,20 +2,39 @@
 调试用 PCM/WAV 录制器。
 
 用于把发送给识别器之前的音频落盘，便于人工试听。
+
+采集线程只把数据块放进有界队列，由后台线程批量写盘并定期 flush；
+队列满时丢弃新块并计数，磁盘抖动不会传导到采集延迟。
+写盘出错（磁盘满、I/O 错误）后录制器标记为失败：后台线程继续清空队列但不再写入，
+close() 也不会因此卡住。
 """
 
 from __future__ import annotations
 
 import os
+import queue
 import threading
+import time
 import wave
 from datetime import datetime
 
 from resource_path import ensure_dir, get_user_data_path
 
+_STOP = object()
+
 
 class WaveDebugRecorder:
-    """把 PCM 数据持续写入本地 WAV 文件。"""
+    """把 PCM 数据持续写入本地 WAV 文件（后台线程批量写入）。
+
+    Parameters
+    ----------
+    max_queue_blocks : int
+        待写队列最多容纳的数据块数，超出时丢弃新块。
+    flush_interval : float
+        后台线程 flush 文件的最短间隔（秒）。
+    close_timeout : float
+        close() 等待后台线程写完剩余数据的最长时间（秒）。
+    """
 
     def __init__(
         self,
@@ -25,6 +44,9 @@ class WaveDebugRecorder:
         channels: int = 1,
         sample_width: int = 2,
         file_prefix: str = 'post_resample',
+        max_queue_blocks: int = 256,
+        flush_interval: float = 1.0,
+        close_timeout: float = 5.0,
     ):
         normalized_dir = output_dir.strip() if str(output_dir).strip() else 'debug_audio'
         if not os.path.isabs(normalized_dir):
@@ -42,23 +64,152 @@ class WaveDebugRecorder:
         self._wave.setsampwidth(int(sample_width))
         self._wave.setframerate(int(sample_rate))
 
+        self._flush_interval = max(0.05, float(flush_interval))
+        self._close_timeout = max(0.0, float(close_timeout))
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, int(max_queue_blocks)))
+
+        # ---- 统计 ----
+        self.written_blocks = 0
+        self.written_bytes = 0
+        self.dropped_blocks = 0
+        self.dropped_bytes = 0
+        self.batches = 0
+        self.flushes = 0
+        self.max_queue_depth = 0
+        # 首次写盘错误；非 None 表示录制器已失败，之后的数据只计入丢弃
+        self.error: str | None = None
+
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            name=f'yakutan-wav-{file_prefix}',
+            daemon=True,
+        )
+        self._writer.start()
+
     def write(self, data: bytes) -> None:
+        """把数据块交给后台线程；不阻塞调用方。"""
         if not data:
             return
-
+        if not isinstance(data, bytes):
+            data = bytes(data)
         with self._lock:
             if self._closed:
                 return
-            self._wave.writeframesraw(data)
-            self._file.flush()
+            if self.error is not None:
+                self.dropped_blocks += 1
+                self.dropped_bytes += len(data)
+                return
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            with self._lock:
+                self.dropped_blocks += 1
+                self.dropped_bytes += len(data)
+            return
+        depth = self._queue.qsize()
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+
+    def _writer_loop(self) -> None:
+        last_flush = time.monotonic()
+        pending_flush = False
+        stopping = False
+        while not stopping:
+            timeout = max(0.0, self._flush_interval - (time.monotonic() - last_flush))
+            try:
+                first = self._queue.get(timeout=timeout if pending_flush else None)
+            except queue.Empty:
+                first = None
+
+            batch = []
+            if first is _STOP:
+                stopping = True
+            elif first is not None:
+                batch.append(first)
+            # 把已排队的块一次取完，合并为一次写入
+            while not stopping:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+
+            if batch:
+                payload = b''.join(batch)
+                if self.error is not None:
+                    # 已失败：只清空队列，不再碰文件
+                    with self._lock:
+                        self.dropped_blocks += len(batch)
+                        self.dropped_bytes += len(payload)
+                    continue
+                # 文件只由本线程访问（close 等本线程退出后才关闭），写盘不持锁，write() 不会被磁盘拖住
+                try:
+                    self._wave.writeframesraw(payload)
+                except Exception as exc:
+                    self._fail(exc, len(batch), len(payload))
+                    continue
+                with self._lock:
+                    self.written_blocks += len(batch)
+                    self.written_bytes += len(payload)
+                    self.batches += 1
+                pending_flush = True
+
+            if pending_flush and (stopping or time.monotonic() - last_flush >= self._flush_interval):
+                try:
+                    self._file.flush()
+                except Exception as exc:
+                    self._fail(exc, 0, 0)
+                    continue
+                with self._lock:
+                    self.flushes += 1
+                last_flush = time.monotonic()
+                pending_flush = False
+
+    def _fail(self, exc: Exception, blocks: int, size: int) -> None:
+        with self._lock:
+            self.error = f'{type(exc).__name__}: {exc}'
+            self.dropped_blocks += blocks
+            self.dropped_bytes += size
+        print(f'[Audio] 调试录音写入失败，停止录制: {self.file_path} ({self.error})')
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'written_blocks': self.written_blocks,
+                'written_bytes': self.written_bytes,
+                'dropped_blocks': self.dropped_blocks,
+                'dropped_bytes': self.dropped_bytes,
+                'batches': self.batches,
+                'flushes': self.flushes,
+                'max_queue_depth': self.max_queue_depth,
+                'error': self.error,
+            }
 
     def close(self) -> None:
+        """写完队列中剩余的数据并关闭文件（会等待后台线程结束）。"""
         with self._lock:
             if self._closed:
                 return
-
             self._closed = True
+
+        # 队列可能已满：等后台线程腾出空间，但最多等 close_timeout
+        if self._writer.is_alive():
             try:
-                self._wave.close()
-            finally:
-                self._file.close()
\ No newline at end of file
+                self._queue.put(_STOP, timeout=self._close_timeout)
+            except queue.Full:
+                pass
+            self._writer.join(timeout=self._close_timeout)
+        if self._writer.is_alive():
+            print(f'[Audio] 调试录音后台线程未在 {self._close_timeout:.0f}s 内结束，放弃关闭文件: {self.file_path}')
+            return
+        try:
+            self._wave.close()
+        except Exception as exc:
+            with self._lock:
+                if self.error is None:
+                    self.error = f'{type(exc).__name__}: {exc}'
+        finally:
+            self._file.close()
@@ -0,0 +1,114 @@
+"""
+采集管线中流转的不可变音频帧。
+
+每个采集块只转换一次：同时持有发送给识别器的 int16 PCM 字节和供 VAD /
+本地识别使用的 float32 只读视图，各消费方共享同一份数据，不再各自转换。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+
+PCM16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def pcm16_to_float32(pcm: bytes) -> np.ndarray:
+    """int16 PCM 字节 -> [-1, 1) float32（单次分配）。"""
+    samples = np.frombuffer(pcm, dtype=np.int16)
+    out = samples.astype(np.float32)
+    out *= PCM16_SCALE
+    return out
+
+
+@dataclass(frozen=True, slots=True)
+class AudioFrame:
+    """一块已下混、已重采样的单声道音频。
+
+    Attributes
+    ----------
+    pcm : bytes
+        int16 小端 PCM。
+    samples : np.ndarray
+        与 pcm 对应的 float32 只读数组。
+    sample_rate : int
+        采样率 (Hz)。
+    """
+
+    pcm: bytes
+    samples: np.ndarray
+    sample_rate: int
+
+    @classmethod
+    def from_pcm16(cls, pcm: bytes, sample_rate: int) -> "AudioFrame":
+        samples = pcm16_to_float32(pcm)
+        samples.flags.writeable = False
+        return cls(pcm=bytes(pcm), samples=samples, sample_rate=int(sample_rate))
+
+    @classmethod
+    def concat(cls, frames: "list[AudioFrame]") -> "AudioFrame":
+        if len(frames) == 1:
+            return frames[0]
+        samples = np.concatenate([frame.samples for frame in frames])
+        samples.flags.writeable = False
+        return cls(
+            pcm=b''.join(frame.pcm for frame in frames),
+            samples=samples,
+            sample_rate=frames[0].sample_rate,
+        )
+
+    def tail(self, num_samples: int) -> "AudioFrame":
+        """返回只含最后 num_samples 个采样的帧（float32 部分为视图）。"""
+        num_samples = max(0, int(num_samples))
+        if num_samples >= len(self.samples):
+            return self
+        start = len(self.samples) - num_samples
+        return AudioFrame(
+            pcm=self.pcm[start * 2:],
+            samples=self.samples[start:],
+            sample_rate=self.sample_rate,
+        )
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / float(self.sample_rate or 1)
+
+
+class FixedChunker:
+    """把任意长度的 float32 流切成定长块，跨调用保留不足一块的尾部。
+
+    完整落在输入数组内的块以视图返回，不复制；只有跨越两次输入的那一块
+    会拼接出新数组。
+    """
+
+    def __init__(self, chunk_size: int):
+        self.chunk_size = int(chunk_size)
+        self._pending = np.zeros(0, dtype=np.float32)
+
+    @property
+    def pending(self) -> np.ndarray:
+        return self._pending
+
+    def reset(self) -> None:
+        self._pending = np.zeros(0, dtype=np.float32)
+
+    def push(self, samples: np.ndarray) -> Iterator[np.ndarray]:
+        size = self.chunk_size
+        offset = 0
+        if len(self._pending):
+            need = size - len(self._pending)
+            if len(samples) < need:
+                self._pending = np.concatenate([self._pending, samples])
+                return
+            yield np.concatenate([self._pending, samples[:need]])
+            offset = need
+        end = len(samples) - (len(samples) - offset) % size
+        while offset < end:
+            yield samples[offset:offset + size]
+            offset += size
+        self._pending = np.array(samples[offset:], dtype=np.float32, copy=True)
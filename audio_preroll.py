@@ -0,0 +1,90 @@
+"""
+VAD 门控的起声前回放缓冲。
+
+门控关闭期间保留最近 N 毫秒已处理的 AudioFrame；门控打开时先把这段音频
+按原顺序补发给在线 ASR，再接上实时帧，避免识别端漏掉第一个音节。
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, List
+
+from audio_frame import AudioFrame
+
+
+class PreRollBuffer:
+    """按时长截断的 AudioFrame 队列。
+
+    Parameters
+    ----------
+    duration_ms : int
+        保留的最长音频时长（毫秒）；0 表示禁用。
+    sample_rate : int
+        帧采样率 (Hz)，用于把时长换算成采样数。
+    """
+
+    def __init__(self, duration_ms: int, sample_rate: int):
+        self.duration_ms = max(0, int(duration_ms))
+        self.sample_rate = max(1, int(sample_rate))
+        self.max_samples = self.duration_ms * self.sample_rate // 1000
+        self._frames: Deque[AudioFrame] = deque()
+        self._samples = 0
+
+        # ---- 统计 ----
+        self.flushes = 0            # 门控打开时补发的次数
+        self.replayed_frames = 0    # 补发的帧数
+        self.replayed_samples = 0   # 补发的采样数
+        self.discarded_samples = 0  # 超出时长被淘汰的采样数
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_samples > 0
+
+    @property
+    def depth_samples(self) -> int:
+        return self._samples
+
+    def push(self, frame: AudioFrame) -> None:
+        """追加一帧，并从头部淘汰超出时长的部分。"""
+        if not self.enabled or not frame:
+            return
+        self._frames.append(frame)
+        self._samples += len(frame)
+        excess = self._samples - self.max_samples
+        while excess > 0:
+            oldest = self._frames[0]
+            if len(oldest) <= excess:
+                self._frames.popleft()
+                removed = len(oldest)
+            else:
+                self._frames[0] = oldest.tail(len(oldest) - excess)
+                removed = excess
+            self._samples -= removed
+            self.discarded_samples += removed
+            excess -= removed
+
+    def drain(self) -> List[AudioFrame]:
+        """取出全部缓存帧（从旧到新）并清空缓冲。"""
+        if not self._frames:
+            return []
+        frames = list(self._frames)
+        self.flushes += 1
+        self.replayed_frames += len(frames)
+        self.replayed_samples += self._samples
+        self.clear()
+        return frames
+
+    def clear(self) -> None:
+        self._frames.clear()
+        self._samples = 0
+
+    def stats(self) -> dict:
+        return {
+            'duration_ms': self.duration_ms,
+            'depth_ms': self._samples * 1000 // self.sample_rate,
+            'flushes': self.flushes,
+            'replayed_frames': self.replayed_frames,
+            'replayed_ms': self.replayed_samples * 1000 // self.sample_rate,
+            'discarded_ms': self.discarded_samples * 1000 // self.sample_rate,
+        }
@@ -0,0 +1,351 @@
+"""
+离线回放：用 WAV 文件驱动真实的采集管线（无需麦克风 / PortAudio）。
+
+- ``WavReplayStream`` 实现 audio_capture 使用的 ``state.stream.read`` 接口，
+  可按 1x 实时或更快的速度回放，支持多声道与 44.1k/48k 等输入采样率，
+  从而覆盖下混与 AudioResampler 路径；
+- ``run_replay`` 按 init_audio_stream 的规则配置 AppState，运行
+  ``audio_capture_task``，并统计各阶段 CPU、丢帧与队列高水位。
+
+命令行入口见 benchmarks/replay_capture.py。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import wave
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+import config
+from speech_recognizers.base_speech_recognizer import SpeechRecognitionCallback, SpeechRecognizer
+
+# 模拟声卡驱动侧缓冲：消费端落后超过该时长时丢弃最旧的数据（对应 PortAudio 输入溢出）
+DEFAULT_DEVICE_BUFFER_SECONDS = 0.5
+
+
+def load_wav_pcm16(path: str) -> tuple[np.ndarray, int]:
+    """读取 PCM WAV，返回 ((frames, channels) int16, 采样率)。支持 8/16/24/32-bit。"""
+    with wave.open(str(path), 'rb') as wf:
+        channels = wf.getnchannels()
+        width = wf.getsampwidth()
+        rate = wf.getframerate()
+        raw = wf.readframes(wf.getnframes())
+
+    if width == 2:
+        samples = np.frombuffer(raw, dtype='<i2')
+    elif width == 1:
+        samples = ((np.frombuffer(raw, dtype=np.uint8).astype(np.int16) - 128) << 8)
+    elif width == 3:
+        b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+        samples = (b[:, 2].astype(np.int8).astype(np.int16) << 8) | b[:, 1]
+    elif width == 4:
+        samples = (np.frombuffer(raw, dtype='<i4') >> 16).astype(np.int16)
+    else:
+        raise ValueError(f"不支持的 WAV 采样位宽: {width * 8}-bit")
+
+    num_frames = len(samples) // channels
+    frames = samples[: num_frames * channels].astype(np.int16, copy=False).reshape(num_frames, channels)
+    return np.ascontiguousarray(frames), int(rate)
+
+
+class WavReplayStream:
+    """按时钟回放 PCM 的伪输入流，接口与 pyaudio.Stream 的阻塞读取一致。
+
+    Parameters
+    ----------
+    frames : np.ndarray
+        (frames, channels) int16 采样。
+    sample_rate : int
+        采样率 (Hz)。
+    speed : float
+        回放倍速；1.0 为实时，<=0 表示不做节流、尽快读完。
+    device_buffer_seconds : float
+        节流模式下模拟的驱动缓冲时长，消费端落后超过它时丢弃最旧数据并计数。
+    """
+
+    def __init__(
+        self,
+        frames: np.ndarray,
+        sample_rate: int,
+        speed: float = 1.0,
+        device_buffer_seconds: float = DEFAULT_DEVICE_BUFFER_SECONDS,
+    ):
+        if frames.ndim == 1:
+            frames = frames.reshape(-1, 1)
+        self._frames = np.ascontiguousarray(frames, dtype=np.int16)
+        self.sample_rate = int(sample_rate)
+        self.channels = int(self._frames.shape[1])
+        self.speed = float(speed)
+        self._buffer_frames = max(1, int(device_buffer_seconds * self.sample_rate))
+        self._pos = 0
+        self._started_at: Optional[float] = None
+        self._active = True
+        self._lock = threading.Lock()
+
+        # ---- 统计 ----
+        self.reads = 0
+        self.frames_read = 0
+        self.dropped_frames = 0
+        self.overflows = 0
+
+    @classmethod
+    def from_wav(cls, path: str, **kwargs) -> "WavReplayStream":
+        frames, rate = load_wav_pcm16(path)
+        return cls(frames, rate, **kwargs)
+
+    @property
+    def num_frames(self) -> int:
+        return len(self._frames)
+
+    @property
+    def duration(self) -> float:
+        return self.num_frames / float(self.sample_rate)
+
+    @property
+    def finished(self) -> bool:
+        return self._pos >= self.num_frames
+
+    def _available_frames(self, now: float) -> int:
+        return int((now - self._started_at) * self.sample_rate * self.speed)
+
+    def read(self, num_frames: int, exception_on_overflow: bool = True) -> bytes:
+        """读取 num_frames 帧交错 int16 PCM；回放结束后返回 b''。
+
+        最后不足一块的部分补零，与声卡总是返回整块的行为一致。
+        """
+        num_frames = int(num_frames)
+        with self._lock:
+            if not self._active or self.finished or num_frames <= 0:
+                return b''
+            if self._started_at is None:
+                self._started_at = time.perf_counter()
+
+            if self.speed > 0:
+                lag = self._available_frames(time.perf_counter()) - self._pos
+                if lag > self._buffer_frames:
+                    dropped = min(lag - self._buffer_frames, self.num_frames - self._pos)
+                    self._pos += dropped
+                    self.dropped_frames += dropped
+                    self.overflows += 1
+                    if exception_on_overflow:
+                        raise IOError('[Replay] Input overflowed')
+                due = self._started_at + (self._pos + num_frames) / (self.sample_rate * self.speed)
+                wait = due - time.perf_counter()
+                if wait > 0:
+                    time.sleep(wait)
+
+            start = self._pos
+            end = min(start + num_frames, self.num_frames)
+            block = self._frames[start:end]
+            if end - start < num_frames:
+                pad = np.zeros((num_frames - (end - start), self.channels), dtype=np.int16)
+                block = np.concatenate([block, pad])
+            self._pos = start + num_frames
+            self.reads += 1
+            self.frames_read += end - start
+            return block.tobytes()
+
+    def is_active(self) -> bool:
+        return self._active and not self.finished
+
+    def stop_stream(self) -> None:
+        self._active = False
+
+    def close(self) -> None:
+        self._active = False
+
+    def stats(self) -> dict:
+        return {
+            'sample_rate': self.sample_rate,
+            'channels': self.channels,
+            'duration_seconds': round(self.duration, 3),
+            'reads': self.reads,
+            'frames_read': self.frames_read,
+            'dropped_frames': self.dropped_frames,
+            'overflows': self.overflows,
+        }
+
+
+class StageTimer:
+    """按阶段累计调用线程的 CPU 时间（time.thread_time）。"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.cpu_seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+
+    def wrap(self, stage: str, fn: Callable) -> Callable:
+        def _timed(*args, **kwargs):
+            t0 = time.thread_time()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.thread_time() - t0
+                with self._lock:
+                    self.cpu_seconds[stage] = self.cpu_seconds.get(stage, 0.0) + elapsed
+                    self.calls[stage] = self.calls.get(stage, 0) + 1
+        return _timed
+
+
+class ReplayRecognizer(SpeechRecognizer):
+    """只统计收到音频的识别器；send_delay 模拟网络发送耗时。"""
+
+    def __init__(self, send_delay: float = 0.0):
+        self.send_delay = max(0.0, float(send_delay))
+        self.sends = 0
+        self.bytes_received = 0
+        self._callback: Optional[SpeechRecognitionCallback] = None
+
+    def set_callback(self, callback: SpeechRecognitionCallback) -> None:
+        self._callback = callback
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def send_audio_frame(self, data: bytes) -> None:
+        self.sends += 1
+        self.bytes_received += len(data)
+        if self.send_delay:
+            time.sleep(self.send_delay)
+
+    def pause(self) -> None:
+        pass
+
+    def resume(self) -> None:
+        pass
+
+    def get_last_request_id(self) -> Optional[str]:
+        return None
+
+    def get_first_package_delay(self) -> Optional[int]:
+        return None
+
+    def get_last_package_delay(self) -> Optional[int]:
+        return None
+
+
+@dataclass
+class ReplayReport:
+    """一次回放的结果。"""
+
+    source: dict
+    wall_seconds: float
+    process_cpu_seconds: float
+    stage_cpu_seconds: Dict[str, float]
+    stage_calls: Dict[str, int]
+    send: dict
+    recognizer: dict
+    pre_roll: dict = field(default_factory=dict)
+
+    @property
+    def audio_seconds(self) -> float:
+        return float(self.source.get('duration_seconds') or 0.0)
+
+    def to_dict(self) -> dict:
+        audio = max(self.audio_seconds, 1e-9)
+        return {
+            'source': self.source,
+            'wall_seconds': round(self.wall_seconds, 3),
+            'realtime_factor': round(self.wall_seconds / audio, 4),
+            'process_cpu_ms_per_audio_second': round(self.process_cpu_seconds * 1000.0 / audio, 3),
+            'stages': {
+                stage: {
+                    'calls': self.stage_calls.get(stage, 0),
+                    'cpu_ms': round(seconds * 1000.0, 3),
+                    'cpu_ms_per_audio_second': round(seconds * 1000.0 / audio, 3),
+                }
+                for stage, seconds in sorted(self.stage_cpu_seconds.items())
+            },
+            'send': self.send,
+            'recognizer': self.recognizer,
+            'pre_roll': self.pre_roll,
+        }
+
+
+def configure_replay_state(state, stream: WavReplayStream) -> None:
+    """按 init_audio_stream 的规则把回放流挂到 AppState 上。"""
+    from audio_capture import create_resampler
+
+    target_rate = int(config.SAMPLE_RATE)
+    state.stream = stream
+    state.audio_closing = False
+    state.capture_ring = None
+    state.capture_ready_event = None
+    state.input_sample_rate = stream.sample_rate
+    state.capture_channels = stream.channels
+    if stream.sample_rate == target_rate:
+        state.input_block_size = int(config.BLOCK_SIZE)
+    else:
+        state.input_block_size = max(256, int(round(config.BLOCK_SIZE * (stream.sample_rate / target_rate))))
+    state.resampler = create_resampler(stream.sample_rate, target_rate)
+
+
+async def run_replay(
+    stream: WavReplayStream,
+    *,
+    vad: bool = False,
+    recognizer: Optional[SpeechRecognizer] = None,
+    state=None,
+) -> ReplayReport:
+    """用回放流运行一次完整的 audio_capture_task 并返回统计。"""
+    import audio_capture
+    from app_state import AppState
+
+    state = state or AppState()
+    recognizer = recognizer or ReplayRecognizer()
+    configure_replay_state(state, stream)
+    state.stop_event = asyncio.Event()
+    state.recognition_active = True
+    state.bump_audio_send_generation()
+
+    timer = StageTimer()
+    state.vad_enabled = False
+    state.vad_stream = None
+    if vad:
+        state.vad_stream = audio_capture.create_vad_stream()
+        processor = state.vad_stream.processor
+        processor.process_chunk = timer.wrap('vad', processor.process_chunk)
+        state.vad_enabled = True
+    state.vad_pre_roll.clear()
+
+    original_read = stream.read
+    original_process = audio_capture._process_captured_block
+    original_send = recognizer.send_audio
+    stream.read = timer.wrap('read', original_read)
+    audio_capture._process_captured_block = timer.wrap('process', original_process)
+    recognizer.send_audio = timer.wrap('send', original_send)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        await audio_capture.audio_capture_task(state, recognizer)
+    finally:
+        audio_capture._process_captured_block = original_process
+        stream.read = original_read
+        recognizer.send_audio = original_send
+        state.recognition_active = False
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    recognizer_stats = {}
+    if isinstance(recognizer, ReplayRecognizer):
+        recognizer_stats = {'sends': recognizer.sends, 'bytes_received': recognizer.bytes_received}
+
+    return ReplayReport(
+        source=stream.stats(),
+        wall_seconds=wall,
+        process_cpu_seconds=cpu,
+        stage_cpu_seconds=dict(timer.cpu_seconds),
+        stage_calls=dict(timer.calls),
+        send=dict(getattr(state, 'asr_send_stats', {}) or {}),
+        recognizer=recognizer_stats,
+        pre_roll=state.vad_pre_roll.stats() if vad else {},
+    )
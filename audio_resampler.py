@@ -1,9 +1,15 @@
 """
 有状态的实时音频重采样器。
 
-基于第三方库 soxr 的流式重采样实现，适用于实时音频输入。
+提供两种流式引擎：
+- ``fir``：整数倍降采样（如 48k -> 16k）的向量化多相 FIR 抽取器，跨块保留滤波器状态；
+- ``soxr``：基于第三方库 soxr 的通用流式重采样，处理任意比例。
+
+默认 ``auto`` 对 16-bit 整数倍降采样使用 fir，其余情况回退 soxr。
 """
 
+from typing import Optional
+
 import numpy as np
 
 try:
@@ -14,11 +20,90 @@ except ImportError as exc:  # pragma: no cover - 运行时依赖保护
 else:
     _SOXR_IMPORT_ERROR = None
 
+RESAMPLER_ENGINES = ('auto', 'fir', 'soxr')
 
-class AudioResampler:
-    """有状态的 PCM 音频重采样器。
 
-    使用 `soxr.ResampleStream` 保持跨音频块的连续性，适用于实时流式场景。
+def design_lowpass_fir(
+    decimation: int,
+    taps_per_phase: int = 48,
+    cutoff_ratio: float = 0.95,
+    kaiser_beta: float = 8.0,
+) -> np.ndarray:
+    """为 decimation 倍抽取设计 Kaiser 窗 sinc 低通滤波器（单位直流增益）。
+
+    截止频率为输出奈奎斯特频率的 cutoff_ratio 倍。
+    """
+    decimation = int(decimation)
+    num_taps = int(taps_per_phase) * decimation + 1
+    cutoff = float(cutoff_ratio) / decimation  # 以输入奈奎斯特归一化
+    n = np.arange(num_taps, dtype=np.float64) - (num_taps - 1) / 2.0
+    h = cutoff * np.sinc(cutoff * n) * np.kaiser(num_taps, kaiser_beta)
+    h /= h.sum()
+    return h
+
+
+class _FirDecimator:
+    """整数倍多相 FIR 抽取：只计算需要保留的输出点，跨块保留输入尾部。
+
+    滤波器按抽取倍数 M 拆成 Q 个相位行，输入按 M 分行后一次矩阵乘得到
+    各相位的部分和，再沿对角线求和得到输出，避免逐点卷积。
+    """
+
+    def __init__(self, decimation: int, channels: int, taps_per_phase: int = 48):
+        self.decimation = int(decimation)
+        self.channels = int(channels)
+        taps = design_lowpass_fir(self.decimation, taps_per_phase)
+        self.num_taps = len(taps)
+        self._phases = -(-self.num_taps // self.decimation)
+        kernel = np.zeros(self._phases * self.decimation, dtype=np.float32)
+        # 翻转后即可用「窗口 · 核」的点积实现卷积
+        kernel[: self.num_taps] = taps[::-1]
+        self._poly = kernel.reshape(self._phases, self.decimation)  # (phases, M)
+        self.reset()
+
+    def reset(self) -> None:
+        # 以 num_taps - 1 个零作为初始历史，使首个输出对齐首个输入采样
+        self._history = np.zeros((self.num_taps - 1, self.channels), dtype=np.float32)
+
+    def output_frames(self, num_input_frames: int) -> int:
+        total = len(self._history) + int(num_input_frames)
+        if total < self.num_taps:
+            return 0
+        return (total - self.num_taps) // self.decimation + 1
+
+    def _filter_channel(self, buf: np.ndarray, n_out: int) -> np.ndarray:
+        m = self.decimation
+        rows = n_out + self._phases - 1
+        need = rows * m
+        if len(buf) < need:
+            buf = np.concatenate([buf, np.zeros(need - len(buf), dtype=np.float32)])
+        # partial[q, r] = 第 q 个相位行与第 r 行输入的点积；y[k] = Σ_q partial[q, k + q]
+        partial = self._poly @ buf[:need].reshape(rows, m).T  # (phases, rows)
+        row_stride, col_stride = partial.strides
+        diagonal = np.lib.stride_tricks.as_strided(
+            partial,
+            shape=(self._phases, n_out),
+            strides=(row_stride + col_stride, col_stride),
+            writeable=False,
+        )
+        return diagonal.sum(axis=0)
+
+    def process(self, frames: np.ndarray, out: np.ndarray) -> int:
+        """frames: (n, channels) 整数采样；结果写入 out[:k]，返回 k。"""
+        buf = np.concatenate([self._history, frames.astype(np.float32, copy=False)])
+        n_out = (len(buf) - self.num_taps) // self.decimation + 1 if len(buf) >= self.num_taps else 0
+        if n_out > 0:
+            for ch in range(self.channels):
+                acc = self._filter_channel(np.ascontiguousarray(buf[:, ch]), n_out)
+                np.rint(acc, out=acc)
+                np.clip(acc, -32768, 32767, out=acc)
+                out[:n_out, ch] = acc
+        self._history = buf[n_out * self.decimation:].copy()
+        return n_out
+
+
+class AudioResampler:
+    """有状态的 PCM 音频重采样器，保持跨音频块的连续性，适用于实时流式场景。
 
     Parameters
     ----------
@@ -30,6 +115,8 @@ class AudioResampler:
         声道数，默认 1（单声道）。
     sample_width : int
         每个采样的字节数，默认 2（16-bit PCM）。
+    engine : str
+        'auto' / 'fir' / 'soxr'。'fir' 仅支持 16-bit 整数倍降采样。
     """
 
     _DTYPE_MAP = {1: np.int8, 2: np.int16, 4: np.int32}
@@ -41,20 +128,40 @@ class AudioResampler:
         output_rate: int,
         channels: int = 1,
         sample_width: int = 2,
+        engine: str = 'auto',
     ):
         if sample_width not in self._DTYPE_MAP:
             raise ValueError(f"不支持的 sample_width: {sample_width}，仅支持 1/2/4")
+        engine = str(engine or 'auto').strip().lower()
+        if engine not in RESAMPLER_ENGINES:
+            raise ValueError(f"未知的重采样引擎: {engine}，可选 {'/'.join(RESAMPLER_ENGINES)}")
+        self.input_rate = int(input_rate)
+        self.output_rate = int(output_rate)
+        self.channels = int(channels)
+        self.sample_width = int(sample_width)
+        self._dtype = self._DTYPE_MAP[self.sample_width]
+
+        fir_capable = self._fir_capable()
+        if engine == 'fir' and not fir_capable:
+            raise ValueError(
+                f"fir 引擎仅支持 16-bit 整数倍降采样，当前 {self.input_rate}->{self.output_rate}Hz"
+            )
+        if engine == 'auto':
+            engine = 'fir' if fir_capable else 'soxr'
+        self.engine = engine
+
+        self._fir: Optional[_FirDecimator] = None
+        self._stream = None
+        if engine == 'fir':
+            self._fir = _FirDecimator(self.input_rate // self.output_rate, self.channels)
+            return
+
         if sample_width not in self._SOXR_DTYPE_MAP:
             raise ValueError(f"soxr 不支持 sample_width={sample_width}，当前仅支持 2/4")
         if soxr is None:
             raise RuntimeError(
                 '缺少 soxr 依赖，请先安装 requirements.txt 中的 soxr'
             ) from _SOXR_IMPORT_ERROR
-        self.input_rate = int(input_rate)
-        self.output_rate = int(output_rate)
-        self.channels = int(channels)
-        self.sample_width = int(sample_width)
-        self._dtype = self._DTYPE_MAP[self.sample_width]
         self._stream = soxr.ResampleStream(
             self.input_rate,
             self.output_rate,
@@ -63,6 +170,14 @@ class AudioResampler:
             quality='QQ',
         )
 
+    def _fir_capable(self) -> bool:
+        return (
+            self.sample_width == 2
+            and self.output_rate > 0
+            and self.input_rate > self.output_rate
+            and self.input_rate % self.output_rate == 0
+        )
+
     @property
     def needs_resample(self) -> bool:
         """输入输出采样率不同时返回 True。"""
@@ -70,7 +185,52 @@ class AudioResampler:
 
     def reset(self) -> None:
         """重置内部状态（切换音频源/重新初始化时调用）。"""
-        self._stream.clear()
+        if self._fir is not None:
+            self._fir.reset()
+        else:
+            self._stream.clear()
+
+    def max_output_frames(self, num_input_frames: int) -> int:
+        """处理 num_input_frames 帧输入时最多产生的输出帧数，用于预分配输出缓冲区。"""
+        if self._fir is not None:
+            return self._fir.output_frames(num_input_frames)
+        return int(np.ceil(num_input_frames * self.output_rate / self.input_rate)) + 16
+
+    def resample_array(self, samples: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """对交错采样数组重采样。
+
+        Parameters
+        ----------
+        samples : np.ndarray
+            输入采样（1-D 交错或 (frames, channels)）。
+        out : np.ndarray, optional
+            调用方提供的输出缓冲区（与采样同 dtype，容量不少于
+            ``max_output_frames``），结果写入其头部并返回该视图。
+
+        Returns
+        -------
+        np.ndarray
+            1-D 交错的输出采样。
+        """
+        if not self.needs_resample:
+            return samples
+        flat = samples.reshape(-1)
+        num_frames = len(flat) // self.channels
+        frames = flat[: num_frames * self.channels].reshape(num_frames, self.channels)
+
+        if self._fir is not None:
+            if out is None:
+                out = np.empty(self._fir.output_frames(num_frames) * self.channels, dtype=self._dtype)
+            n_out = self._fir.process(frames, out.reshape(-1, self.channels))
+            return out[: n_out * self.channels]
+
+        input_chunk = frames[:, 0] if self.channels == 1 else frames
+        result = self._stream.resample_chunk(input_chunk, last=False)
+        result = result.reshape(-1)
+        if out is None:
+            return np.ascontiguousarray(result, dtype=self._dtype)
+        out[: len(result)] = result
+        return out[: len(result)]
 
     def resample(self, data: bytes) -> bytes:
         """对一段 PCM 数据进行重采样。
@@ -89,14 +249,6 @@ class AudioResampler:
             return data
 
         samples = np.frombuffer(data, dtype=self._dtype)
-        num_frames = len(samples) // self.channels
-        if num_frames == 0:
+        if len(samples) // self.channels == 0:
             return data
-        frame_samples = samples[: num_frames * self.channels]
-        if self.channels == 1:
-            input_chunk = frame_samples
-        else:
-            input_chunk = frame_samples.reshape(num_frames, self.channels)
-
-        result = self._stream.resample_chunk(input_chunk, last=False)
-        return np.ascontiguousarray(result, dtype=self._dtype).tobytes()
+        return self.resample_array(samples).tobytes()
@@ -0,0 +1,143 @@
+"""
+预分配的 PCM 环形缓冲区。
+
+供回调模式采集使用：PortAudio 回调线程写入，asyncio 消费端按块读取。
+写满时丢弃最旧的数据并计数，保证回调线程永远不会等待。
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Optional
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """按帧（frame = 每声道一个采样）存储 PCM 的定长环形缓冲区。
+
+    Parameters
+    ----------
+    capacity_frames : int
+        缓冲区能容纳的最大帧数。
+    channels : int
+        声道数，写入的字节流按交错 PCM 解释。
+    dtype
+        采样类型，默认 int16。
+    """
+
+    def __init__(self, capacity_frames: int, channels: int = 1, dtype=np.int16):
+        if int(capacity_frames) <= 0:
+            raise ValueError(f"capacity_frames 必须为正数: {capacity_frames}")
+        self.channels = max(1, int(channels))
+        self.capacity = int(capacity_frames)
+        self._dtype = np.dtype(dtype)
+        self._buf = np.zeros((self.capacity, self.channels), dtype=self._dtype)
+        self._lock = threading.Lock()
+        self._read_pos = 0
+        self._size = 0
+        self._notifier: Optional[Callable[[], None]] = None
+        self._notify_frames = 1
+
+        # ---- 统计 ----
+        self.overruns = 0          # 因写满而丢弃旧数据的次数
+        self.dropped_frames = 0    # 被丢弃的帧数
+        self.input_overflows = 0   # PortAudio 报告的输入溢出次数
+        self.writes = 0
+        self.max_depth = 0         # 积压帧数的高水位
+
+    def set_notifier(self, notifier: Optional[Callable[[], None]], min_frames: int = 1) -> None:
+        """设置写入后的唤醒回调；积压达到 min_frames 时在写线程中调用。"""
+        with self._lock:
+            self._notifier = notifier
+            self._notify_frames = max(1, int(min_frames))
+
+    @property
+    def depth(self) -> int:
+        """当前积压的帧数。"""
+        with self._lock:
+            return self._size
+
+    def note_input_overflow(self) -> None:
+        with self._lock:
+            self.input_overflows += 1
+
+    def write(self, data: bytes) -> int:
+        """写入交错 PCM 字节，返回写入的帧数。写满时覆盖最旧数据。"""
+        if not data:
+            return 0
+        frames = np.frombuffer(data, dtype=self._dtype)
+        num_frames = len(frames) // self.channels
+        if num_frames <= 0:
+            return 0
+        frames = frames[: num_frames * self.channels].reshape(num_frames, self.channels)
+
+        notifier = None
+        with self._lock:
+            self.writes += 1
+            if num_frames > self.capacity:
+                dropped = num_frames - self.capacity
+                frames = frames[dropped:]
+                num_frames = self.capacity
+                self.dropped_frames += dropped
+                self.overruns += 1
+
+            overflow = self._size + num_frames - self.capacity
+            if overflow > 0:
+                self._read_pos = (self._read_pos + overflow) % self.capacity
+                self._size -= overflow
+                self.dropped_frames += overflow
+                self.overruns += 1
+
+            write_pos = (self._read_pos + self._size) % self.capacity
+            first = min(num_frames, self.capacity - write_pos)
+            self._buf[write_pos:write_pos + first] = frames[:first]
+            if first < num_frames:
+                self._buf[: num_frames - first] = frames[first:]
+            self._size += num_frames
+            if self._size > self.max_depth:
+                self.max_depth = self._size
+            if self._notifier is not None and self._size >= self._notify_frames:
+                notifier = self._notifier
+
+        if notifier is not None:
+            notifier()
+        return num_frames
+
+    def read(self, num_frames: int) -> Optional[bytes]:
+        """读取恰好 num_frames 帧；数据不足时返回 None 且不消耗数据。"""
+        num_frames = int(num_frames)
+        if num_frames <= 0:
+            return b''
+        with self._lock:
+            if self._size < num_frames:
+                return None
+            start = self._read_pos
+            first = min(num_frames, self.capacity - start)
+            if first == num_frames:
+                out = self._buf[start:start + num_frames].tobytes()
+            else:
+                out = b''.join((
+                    self._buf[start:].tobytes(),
+                    self._buf[: num_frames - first].tobytes(),
+                ))
+            self._read_pos = (start + num_frames) % self.capacity
+            self._size -= num_frames
+            return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._read_pos = 0
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'capacity_frames': self.capacity,
+                'depth_frames': self._size,
+                'max_depth_frames': self.max_depth,
+                'overruns': self.overruns,
+                'dropped_frames': self.dropped_frames,
+                'input_overflows': self.input_overflows,
+                'writes': self.writes,
+            }
@@ -0,0 +1,304 @@
+"""
+采集循环调度基准：比较事件驱动读取与旧实现（每轮固定 sleep 1ms）的事件循环开销。
+
+指标：
+- 每秒事件循环迭代次数（_run_once 调用数，即唤醒次数）；
+- 事件循环利用率（非 select 等待时间占墙钟时间的比例）；
+- 回调模式下从回调线程写入环形缓冲区到帧发布到 audio_bus 的延迟分布；
+- 相邻两次发布间隔相对块周期的抖动（标准差）。
+
+旧实现通过在 read_audio_data 外包一层 ``await asyncio.sleep(0.001)`` 模拟，
+与此前 audio_capture_task 每轮末尾的固定 sleep 等价。
+
+``--asr-load`` 在采集的同时持续运行本地识别负载，比较引擎在本进程线程中运行（thread）
+与在独立子进程中运行（process，LOCAL_ASR_WORKER_PROCESS）时的抖动。默认负载为纯 Python
+计算的假引擎（按音频时长持有 GIL，模拟特征提取与解码循环），``--asr-engine`` 可换成真实引擎。
+
+用法：
+    python benchmarks/bench_capture_loop.py
+    python benchmarks/bench_capture_loop.py --block 320 --seconds 10 --source callback --json
+    python benchmarks/bench_capture_loop.py --source callback --asr-load all
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import audio_capture  # noqa: E402
+import config  # noqa: E402
+from app_state import AppState  # noqa: E402
+from audio_replay import ReplayRecognizer, WavReplayStream, configure_replay_state  # noqa: E402
+from audio_ring_buffer import AudioRingBuffer  # noqa: E402
+from local_asr.asr_worker_process import ENGINE_FACTORIES, ASRWorkerProcess  # noqa: E402
+
+BUSY_ENGINE_FACTORY = 'bench_capture_loop:BusyEngine'
+
+
+class BusyEngine:
+    """假识别引擎：每秒音频用纯 Python 计算持有 GIL ``cost`` 秒。"""
+
+    def __init__(self, cost: float = 0.1):
+        self.cost = float(cost)
+
+    def set_language(self, language):
+        pass
+
+    def transcribe(self, audio, *, cancel=None):
+        deadline = time.perf_counter() + self.cost * len(audio) / 16000.0
+        acc = 0
+        while time.perf_counter() < deadline:
+            for i in range(500):
+                acc += i * i
+        return {'text': str(acc % 7)}
+
+    def unload(self):
+        pass
+
+
+def _make_engine(mode: str, name: str, cost: float):
+    """构造识别负载：thread 在本进程内加载，process 经子进程代理。"""
+    factory = BUSY_ENGINE_FACTORY if name == 'busy' else ENGINE_FACTORIES[name]
+    kwargs = {'cost': cost} if name == 'busy' else {}
+    if mode == 'process':
+        return ASRWorkerProcess(name, factory=factory, kwargs=kwargs)
+    if name == 'busy':
+        return BusyEngine(**kwargs)
+    module_name, _, attr = factory.partition(':')
+    return getattr(__import__(module_name, fromlist=[attr]), attr)(**kwargs)
+
+
+def _asr_load_loop(engine, stop: threading.Event, counter: list) -> None:
+    """持续转写 5 秒音频，模拟连续说话时的中间结果与最终识别。"""
+    audio = (np.random.default_rng(0).standard_normal(5 * 16000) * 0.05).astype(np.float32)
+    while not stop.is_set():
+        engine.transcribe(audio)
+        counter[0] += 1
+
+
+class _InstrumentedLoop(asyncio.SelectorEventLoop):
+    """统计迭代次数与 select 等待时长的事件循环。"""
+
+    def __init__(self):
+        super().__init__()
+        self.iterations = 0
+        self.idle_seconds = 0.0
+        select = self._selector.select
+
+        def _timed_select(timeout=None):
+            t0 = time.perf_counter()
+            try:
+                return select(timeout)
+            finally:
+                self.idle_seconds += time.perf_counter() - t0
+
+        self._selector.select = _timed_select
+
+    def _run_once(self):
+        self.iterations += 1
+        super()._run_once()
+
+
+def _tone(rate: int, seconds: float) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / float(rate)
+    return np.rint(8000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+
+
+def _callback_feeder(ring: AudioRingBuffer, samples: np.ndarray, block: int, rate: int,
+                     write_times: deque, stop: threading.Event) -> None:
+    """按实时节奏模拟 PortAudio 回调线程。"""
+    period = block / float(rate)
+    start = time.perf_counter()
+    for index, offset in enumerate(range(0, len(samples) - block + 1, block)):
+        due = start + (index + 1) * period
+        wait = due - time.perf_counter()
+        if wait > 0 and stop.wait(wait):
+            return
+        write_times.append(time.perf_counter())
+        ring.write(samples[offset:offset + block].tobytes())
+
+
+async def _run_capture(source: str, legacy: bool, seconds: float, asr_load: str = 'none', engine=None) -> dict:
+    loop = asyncio.get_running_loop()
+    rate = int(config.SAMPLE_RATE)
+    block = int(config.BLOCK_SIZE)
+    samples = _tone(rate, seconds)
+
+    state = AppState()
+    state.stop_event = asyncio.Event()
+    state.recognition_active = True
+    state.vad_enabled = False
+    state.vad_stream = None
+    state.bump_audio_send_generation()
+
+    write_times: deque = deque()
+    feeder_stop = threading.Event()
+    feeder = None
+    if source == 'callback':
+        ring = AudioRingBuffer(capacity_frames=rate * 2)
+        event = asyncio.Event()
+        ring.set_notifier(lambda: loop.call_soon_threadsafe(event.set), min_frames=block)
+        state.capture_ring = ring
+        state.capture_ready_event = event
+        state.stream = object()
+        state.input_block_size = block
+        state.capture_channels = 1
+        state.resampler = None
+        feeder = threading.Thread(
+            target=_callback_feeder,
+            args=(ring, samples, block, rate, write_times, feeder_stop),
+            daemon=True,
+        )
+    else:
+        configure_replay_state(state, WavReplayStream(samples.reshape(-1, 1), rate, speed=1.0))
+
+    publish_times = []
+    latencies = []
+
+    def _on_frame(_frame):
+        now = time.perf_counter()
+        publish_times.append(now)
+        if write_times:
+            latencies.append(now - write_times.popleft())
+
+    probe = state.audio_bus.subscribe('bench_probe', callback=_on_frame)
+
+    original_read = audio_capture.read_audio_data
+
+    async def _legacy_read(st):
+        data = await original_read(st)
+        await asyncio.sleep(0.001)  # 旧实现每轮末尾的固定 sleep
+        return data
+
+    async def _stop_after_source():
+        await asyncio.sleep(seconds + 0.2)
+        state.stop_event.set()
+        state.audio_closing = True
+        if state.capture_ready_event is not None:
+            state.capture_ready_event.set()
+
+    load_stop = threading.Event()
+    decodes = [0]
+    load_thread = None
+    if engine is not None:
+        load_thread = threading.Thread(target=_asr_load_loop, args=(engine, load_stop, decodes), daemon=True)
+        load_thread.start()
+
+    if legacy:
+        audio_capture.read_audio_data = _legacy_read
+    stopper = asyncio.create_task(_stop_after_source()) if source == 'callback' else None
+    iterations0, idle0 = loop.iterations, loop.idle_seconds
+    wall0 = time.perf_counter()
+    try:
+        if feeder is not None:
+            feeder.start()
+        await audio_capture.audio_capture_task(state, ReplayRecognizer())
+    finally:
+        audio_capture.read_audio_data = original_read
+        feeder_stop.set()
+        load_stop.set()
+        if load_thread is not None:
+            load_thread.join()
+        if stopper is not None:
+            stopper.cancel()
+        probe.close()
+    wall = time.perf_counter() - wall0
+    iterations = loop.iterations - iterations0
+    idle = loop.idle_seconds - idle0
+    state.audio_executor.shutdown(wait=False)
+    state.asr_send_executor.shutdown(wait=False)
+    state.executor.shutdown(wait=False)
+
+    intervals_ms = np.diff(publish_times) * 1000.0 if len(publish_times) > 1 else np.zeros(0)
+    result = {
+        'source': source,
+        'variant': 'legacy_sleep' if legacy else 'event_driven',
+        'asr_load': asr_load,
+        'asr_decodes': decodes[0],
+        'wall_seconds': round(wall, 3),
+        'frames': len(publish_times),
+        'loop_iterations_per_second': round(iterations / wall, 1),
+        'loop_utilization_pct': round(100.0 * max(0.0, wall - idle) / wall, 2),
+        'publish_interval_jitter_ms': round(float(np.std(intervals_ms)), 3) if len(intervals_ms) else 0.0,
+        'publish_interval_max_ms': round(float(intervals_ms.max()), 3) if len(intervals_ms) else 0.0,
+    }
+    if latencies:
+        lat_ms = np.asarray(latencies) * 1000.0
+        result['callback_to_publish_ms'] = {
+            'p50': round(float(np.percentile(lat_ms, 50)), 3),
+            'p95': round(float(np.percentile(lat_ms, 95)), 3),
+            'max': round(float(lat_ms.max()), 3),
+        }
+    return result
+
+
+def _run(source: str, legacy: bool, seconds: float, asr_load: str = 'none', engine=None) -> dict:
+    loop = _InstrumentedLoop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(_run_capture(source, legacy, seconds, asr_load, engine))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='采集循环事件循环开销基准')
+    parser.add_argument('--seconds', type=float, default=5.0, help='每种配置采集的音频时长')
+    parser.add_argument('--source', choices=('callback', 'blocking', 'all'), default='all')
+    parser.add_argument('--block', type=int, default=None, help='覆盖 config.BLOCK_SIZE（16k 下的采样数）')
+    parser.add_argument('--asr-load', choices=('none', 'thread', 'process', 'all'), default='none',
+                        help='采集同时运行的本地识别负载；给出时只测事件驱动实现')
+    parser.add_argument('--asr-engine', default='busy', help='识别负载：busy（假引擎）/ sensevoice / qwen3-asr')
+    parser.add_argument('--busy-cost', type=float, default=0.1, help='假引擎每秒音频的 CPU 秒数')
+    parser.add_argument('--json', action='store_true', help='以 JSON 输出结果')
+    args = parser.parse_args()
+    if args.block:
+        config.BLOCK_SIZE = int(args.block)
+
+    sources = ('callback', 'blocking') if args.source == 'all' else (args.source,)
+    results = []
+    if args.asr_load == 'none':
+        for source in sources:
+            for legacy in (True, False):
+                results.append(_run(source, legacy, args.seconds))
+    else:
+        loads = ('none', 'thread', 'process') if args.asr_load == 'all' else ('none', args.asr_load)
+        for load in loads:
+            engine = None if load == 'none' else _make_engine(load, args.asr_engine, args.busy_cost)
+            try:
+                for source in sources:
+                    results.append(_run(source, False, args.seconds, load, engine))
+            finally:
+                if isinstance(engine, ASRWorkerProcess):
+                    engine.shutdown()
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return 0
+
+    block_ms = 1000.0 * config.BLOCK_SIZE / config.SAMPLE_RATE
+    print(f"块大小 {config.BLOCK_SIZE} ({block_ms:.0f} ms)，每种配置 {args.seconds:.1f}s 音频")
+    print(f"{'source':<9} {'variant':<13} {'asr':<8} {'wakeups/s':>10} {'loop util':>10} {'jitter':>9} "
+          f"{'max gap':>9} {'cb->pub p50/p95':>18}")
+    for r in results:
+        lat = r.get('callback_to_publish_ms')
+        lat_text = f"{lat['p50']:.2f}/{lat['p95']:.2f} ms" if lat else '-'
+        print(
+            f"{r['source']:<9} {r['variant']:<13} {r['asr_load']:<8} {r['loop_iterations_per_second']:>10.1f} "
+            f"{r['loop_utilization_pct']:>9.2f}% {r['publish_interval_jitter_ms']:>7.3f}ms "
+            f"{r['publish_interval_max_ms']:>7.1f}ms {lat_text:>18}"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+重采样引擎基准：比较 fir 与 soxr 两条流式路径。
+
+指标：
+- 每秒音频消耗的 CPU 时间（按实时采集的块大小逐块送入）；
+- 通带内各频点的增益误差（dB）；
+- 输出奈奎斯特以上频点折叠回通带后的混叠抑制（dB）。
+
+用法：
+    python benchmarks/bench_resampler.py
+    python benchmarks/bench_resampler.py --input-rate 48000 --block 4800 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from audio_resampler import AudioResampler  # noqa: E402
+
+PASSBAND_TONES_HZ = (100, 1000, 3000, 5000, 6500, 7000)
+STOPBAND_TONES_HZ = (9000, 12000, 20000)
+AMPLITUDE = 0.5
+
+
+def _tone(freq: float, rate: int, seconds: float) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / float(rate)
+    return np.rint(AMPLITUDE * 32767 * np.sin(2 * np.pi * freq * t)).astype(np.int16)
+
+
+def _run_stream(resampler: AudioResampler, samples: np.ndarray, block: int) -> np.ndarray:
+    out = np.empty(resampler.max_output_frames(block), dtype=np.int16)
+    parts = []
+    for start in range(0, len(samples), block):
+        parts.append(resampler.resample_array(samples[start:start + block], out=out).copy())
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int16)
+
+
+def _steady_rms(samples: np.ndarray, rate: int) -> float:
+    # 丢弃首尾 0.25s，避开滤波器建立/拖尾
+    trim = rate // 4
+    body = samples[trim:-trim].astype(np.float64)
+    return float(np.sqrt(np.mean(body * body))) if len(body) else 0.0
+
+
+def _db(ratio: float) -> float:
+    # 残留低于 int16 量化噪声时按 -120 dB 计
+    return 20.0 * np.log10(max(ratio, 1e-6))
+
+
+def measure_cpu(engine: str, in_rate: int, out_rate: int, block: int, seconds: float) -> float:
+    rng = np.random.default_rng(0)
+    noise = np.clip(rng.normal(0, 6000, int(in_rate * seconds)), -32768, 32767).astype(np.int16)
+    resampler = AudioResampler(in_rate, out_rate, engine=engine)
+    out = np.empty(resampler.max_output_frames(block), dtype=np.int16)
+    t0 = time.process_time()
+    for start in range(0, len(noise), block):
+        resampler.resample_array(noise[start:start + block], out=out)
+    return (time.process_time() - t0) / seconds
+
+
+def measure_response(engine: str, in_rate: int, out_rate: int, block: int) -> dict:
+    reference = AMPLITUDE * 32767 / np.sqrt(2)
+    passband = {}
+    for freq in PASSBAND_TONES_HZ:
+        if freq >= out_rate / 2:
+            continue
+        y = _run_stream(AudioResampler(in_rate, out_rate, engine=engine), _tone(freq, in_rate, 2.0), block)
+        passband[freq] = round(_db(_steady_rms(y, out_rate) / reference), 3)
+    stopband = {}
+    for freq in STOPBAND_TONES_HZ:
+        if freq >= in_rate / 2 or freq <= out_rate / 2:
+            continue
+        y = _run_stream(AudioResampler(in_rate, out_rate, engine=engine), _tone(freq, in_rate, 2.0), block)
+        stopband[freq] = round(-_db(_steady_rms(y, out_rate) / reference), 1)
+    return {'passband_gain_db': passband, 'alias_rejection_db': stopband}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='重采样引擎基准')
+    parser.add_argument('--input-rate', type=int, default=48000)
+    parser.add_argument('--output-rate', type=int, default=16000)
+    parser.add_argument('--block', type=int, default=4800, help='每块输入帧数（默认 100ms @48k）')
+    parser.add_argument('--seconds', type=float, default=30.0, help='CPU 测量使用的音频时长')
+    parser.add_argument('--json', action='store_true', help='以 JSON 输出结果')
+    args = parser.parse_args()
+
+    engines = ['soxr']
+    if args.input_rate > args.output_rate and args.input_rate % args.output_rate == 0:
+        engines.insert(0, 'fir')
+
+    results = {}
+    for engine in engines:
+        cpu = measure_cpu(engine, args.input_rate, args.output_rate, args.block, args.seconds)
+        entry = {'cpu_ms_per_audio_second': round(cpu * 1000.0, 4)}
+        entry.update(measure_response(engine, args.input_rate, args.output_rate, args.block))
+        results[engine] = entry
+
+    if args.json:
+        print(json.dumps({
+            'input_rate': args.input_rate,
+            'output_rate': args.output_rate,
+            'block': args.block,
+            'engines': results,
+        }, indent=2))
+        return 0
+
+    print(f'{args.input_rate}Hz -> {args.output_rate}Hz, block={args.block}')
+    for engine, entry in results.items():
+        print(f'\n[{engine}] CPU: {entry["cpu_ms_per_audio_second"]:.3f} ms / 秒音频')
+        for freq, gain in entry['passband_gain_db'].items():
+            print(f'  通带 {freq:>6} Hz: {gain:+.3f} dB')
+        for freq, rejection in entry['alias_rejection_db'].items():
+            print(f'  混叠 {freq:>6} Hz: 抑制 {rejection:.1f} dB')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
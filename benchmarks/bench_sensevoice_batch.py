@@ -0,0 +1,128 @@
+"""
+SenseVoice 批量推理基准：把一组已切好的终句分别用逐句 transcribe 与
+transcribe_batch（按长度排序后每 --batch 句一组，减少填充）识别，比较吞吐。
+
+吞吐以「音频秒数 / CPU 秒数」计（process_time，含 ORT 线程池的全部 CPU 时间），
+同时给出墙钟时间与两种路径结果文本是否一致。
+句段取自 vad_dataset 的标注语音区间（--manifest 指定真实录音，否则用合成语音）。
+需要 onnxruntime 与已下载的 SenseVoice 本地模型。
+
+用法：
+    python benchmarks/bench_sensevoice_batch.py
+    python benchmarks/bench_sensevoice_batch.py --batch 2 4 8 --threads 4 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from vad_dataset import SAMPLE_RATE, load_clips  # noqa: E402
+
+
+def _segments(args) -> list:
+    clips = load_clips(args.manifest, count=args.clips, seconds=args.seconds, seed=args.seed)
+    segments = []
+    for clip in clips:
+        for start, end in clip.speech:
+            segment = clip.samples[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]
+            if segment.size:
+                segments.append(segment)
+    return segments
+
+
+def _measure(fn) -> tuple:
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    texts = fn()
+    return texts, time.process_time() - cpu0, time.perf_counter() - wall0
+
+
+def _texts(results) -> list:
+    return [(result or {}).get('text', '') for result in results]
+
+
+def _run_single(engine, segments) -> list:
+    return _texts(engine.transcribe(segment) for segment in segments)
+
+
+def _run_batched(engine, segments, size: int) -> list:
+    order = sorted(range(len(segments)), key=lambda i: segments[i].size)
+    texts = [''] * len(segments)
+    for offset in range(0, len(order), size):
+        group = order[offset:offset + size]
+        for index, text in zip(group, _texts(engine.transcribe_batch([segments[i] for i in group]))):
+            texts[index] = text
+    return texts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='SenseVoice 逐句与批量推理吞吐对比')
+    parser.add_argument('--manifest', default='', help='真实录音清单（见 vad_dataset.load_manifest）')
+    parser.add_argument('--clips', type=int, default=4, help='合成集的回放段数')
+    parser.add_argument('--seconds', type=float, default=30.0, help='每段合成回放的时长（秒）')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--batch', type=int, nargs='+', default=[2, 4, 8], help='批大小（可给多个）')
+    parser.add_argument('--threads', type=int, default=4, help='ORT intra-op 线程数')
+    parser.add_argument('--json', action='store_true', help='以 JSON 输出结果')
+    args = parser.parse_args()
+
+    try:
+        from local_asr.asr_sensevoice import SenseVoiceEngine
+
+        engine = SenseVoiceEngine(num_threads=args.threads)
+    except Exception as exc:
+        print(f'SenseVoice 加载失败: {exc}', file=sys.stderr)
+        return 1
+
+    segments = _segments(args)
+    if not segments:
+        print('没有可用的语音句段', file=sys.stderr)
+        return 1
+    audio_seconds = sum(segment.size for segment in segments) / SAMPLE_RATE
+    _run_single(engine, segments[:2])  # 预热
+
+    reference, cpu, wall = _measure(lambda: _run_single(engine, segments))
+    results = [{
+        'mode': 'single',
+        'batch': 1,
+        'cpu_s': round(cpu, 3),
+        'wall_s': round(wall, 3),
+        'audio_s_per_cpu_s': round(audio_seconds / max(cpu, 1e-9), 2),
+        'same_text': True,
+    }]
+    for size in args.batch:
+        texts, cpu, wall = _measure(lambda size=size: _run_batched(engine, segments, size))
+        results.append({
+            'mode': 'batch',
+            'batch': size,
+            'cpu_s': round(cpu, 3),
+            'wall_s': round(wall, 3),
+            'audio_s_per_cpu_s': round(audio_seconds / max(cpu, 1e-9), 2),
+            'same_text': texts == reference,
+        })
+    engine.unload()
+
+    if args.json:
+        print(json.dumps({
+            'segments': len(segments),
+            'audio_seconds': round(audio_seconds, 1),
+            'threads': args.threads,
+            'results': results,
+        }, indent=2, ensure_ascii=False))
+        return 0
+
+    print(f"{len(segments)} 句，共 {audio_seconds:.1f}s 音频，ORT {args.threads} 线程")
+    print(f"{'mode':<8}{'batch':>6}{'cpu':>10}{'wall':>10}{'audio s/cpu s':>15}{'same text':>11}")
+    for r in results:
+        print(
+            f"{r['mode']:<8}{r['batch']:>6}{r['cpu_s']:>9.2f}s{r['wall_s']:>9.2f}s"
+            f"{r['audio_s_per_cpu_s']:>15.2f}{str(r['same_text']):>11}"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
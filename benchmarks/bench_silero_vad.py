@@ -0,0 +1,112 @@
+"""
+Silero VAD 单块推理基准：比较旧实现（每块构造输入/feeds、session.run 返回新张量）、
+预分配缓冲 + session.run 回退路径、以及 IOBinding 路径的逐块耗时。
+
+输出每块耗时分位数，以及按 32ms 块周期折算的单核可承载流数（块周期 / 平均耗时）。
+需要 onnxruntime 与 local_asr/models 下的 Silero ONNX 模型。
+
+用法：
+    python benchmarks/bench_silero_vad.py
+    python benchmarks/bench_silero_vad.py --chunks 5000 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from local_asr.model_manager import silero_onnx_path  # noqa: E402
+from local_asr.vad_processor import _SileroOnnxVAD  # noqa: E402
+
+SAMPLE_RATE = 16000
+CHUNK = 512
+
+
+class _LegacySilero:
+    """旧实现的逐块路径：补齐、拼接上下文、构造 feeds，session.run 返回新状态。"""
+
+    def __init__(self, model_path: str):
+        import onnxruntime as ort
+
+        opts = ort.SessionOptions()
+        opts.inter_op_num_threads = 1
+        opts.intra_op_num_threads = 1
+        self._session = ort.InferenceSession(model_path, providers=['CPUExecutionProvider'], sess_options=opts)
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._context = np.zeros((1, 64), dtype=np.float32)
+
+    def probability(self, audio_chunk, sample_rate):
+        chunk = audio_chunk[:CHUNK]
+        if len(chunk) < CHUNK:
+            chunk = np.pad(chunk, (0, CHUNK - len(chunk)))
+        x = np.asarray(chunk.astype(np.float32, copy=False), dtype=np.float32).reshape(1, -1)
+        inp = np.concatenate([self._context, x], axis=1)
+        prob, self._state = self._session.run(None, {
+            'input': inp.astype(np.float32, copy=False),
+            'state': self._state,
+            'sr': np.array(sample_rate, dtype=np.int64),
+        })
+        self._context = inp[..., -64:]
+        return float(prob.reshape(-1)[0])
+
+
+def _run(variant: str, model_path: str, chunks: np.ndarray) -> dict:
+    if variant == 'legacy':
+        vad = _LegacySilero(model_path)
+    else:
+        vad = _SileroOnnxVAD(model_path, use_io_binding=(variant == 'iobinding'))
+    for chunk in chunks[:50]:  # 预热
+        vad.probability(chunk, SAMPLE_RATE)
+    times_us = np.empty(len(chunks))
+    for index, chunk in enumerate(chunks):
+        t0 = time.perf_counter()
+        vad.probability(chunk, SAMPLE_RATE)
+        times_us[index] = (time.perf_counter() - t0) * 1e6
+    mean_us = float(times_us.mean())
+    period_us = CHUNK / SAMPLE_RATE * 1e6
+    return {
+        'variant': variant,
+        'chunks': len(chunks),
+        'mean_us': round(mean_us, 2),
+        'p50_us': round(float(np.percentile(times_us, 50)), 2),
+        'p95_us': round(float(np.percentile(times_us, 95)), 2),
+        'streams_per_core': round(period_us / mean_us, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Silero VAD 单块推理开销基准')
+    parser.add_argument('--chunks', type=int, default=3000, help='每种实现推理的块数（每块 32ms）')
+    parser.add_argument('--json', action='store_true', help='以 JSON 输出结果')
+    args = parser.parse_args()
+
+    model_path = silero_onnx_path()
+    if not model_path.is_file():
+        print(f'Silero ONNX 未找到: {model_path}', file=sys.stderr)
+        return 1
+
+    rng = np.random.default_rng(0)
+    chunks = (rng.standard_normal((args.chunks, CHUNK)) * 0.05).astype(np.float32)
+    results = [_run(variant, str(model_path), chunks) for variant in ('legacy', 'run', 'iobinding')]
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return 0
+
+    print(f"{args.chunks} 块 × {CHUNK} 采样，单线程")
+    print(f"{'variant':<11}{'mean':>10}{'p50':>10}{'p95':>10}{'streams/core':>14}")
+    for r in results:
+        print(
+            f"{r['variant']:<11}{r['mean_us']:>8.1f}us{r['p50_us']:>8.1f}us"
+            f"{r['p95_us']:>8.1f}us{r['streams_per_core']:>14.1f}"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
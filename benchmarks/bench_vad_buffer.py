@@ -0,0 +1,109 @@
+"""
+VAD 语音缓冲基准：比较连续缓冲（当前实现）与旧实现（块列表 + 每次 np.concatenate）
+在长句中的逐块开销。
+
+模拟 LocalSpeechRecognizer 说话期间的真实调用模式：每个 32ms 块先
+``process_chunk``，随后 ``_maybe_emit_partial`` 调用一次 ``peek_buffer``。
+VAD 使用 disabled 模式（置信度恒为 1.0），无需 ONNX 模型。
+
+旧实现在本脚本内以 ``_LegacyVAD`` 复刻：块列表 + 置信度列表，peek 时拼接整段。
+
+用法：
+    python benchmarks/bench_vad_buffer.py
+    python benchmarks/bench_vad_buffer.py --seconds 60 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from local_asr.vad_processor import VADProcessor  # noqa: E402
+
+SAMPLE_RATE = 16000
+CHUNK = 512
+
+
+class _LegacyVAD:
+    """旧实现的缓冲部分：块列表 + 置信度列表，peek 每次整段拼接。"""
+
+    def __init__(self):
+        self._speech_buffer = []
+        self._confidence_history = []
+        self._speech_samples = 0
+
+    def process_chunk(self, chunk):
+        self._speech_buffer.append(chunk)
+        self._confidence_history.append(1.0)
+        self._speech_samples += len(chunk)
+        return None
+
+    def peek_buffer(self):
+        return np.concatenate(self._speech_buffer), self._speech_samples / SAMPLE_RATE
+
+
+def _make_vad(variant: str):
+    if variant == 'legacy':
+        return _LegacyVAD()
+    vad = VADProcessor(sample_rate=SAMPLE_RATE, pre_speech_duration=0.0)
+    vad.update_settings({'vad_mode': 'disabled'})
+    return vad
+
+
+def _run(variant: str, seconds: float, checkpoints) -> dict:
+    vad = _make_vad(variant)
+    rng = np.random.default_rng(0)
+    chunk = (rng.standard_normal(CHUNK) * 0.1).astype(np.float32)
+    total_chunks = int(seconds * SAMPLE_RATE / CHUNK)
+    per_chunk_us = np.empty(total_chunks)
+    for index in range(total_chunks):
+        t0 = time.perf_counter()
+        vad.process_chunk(chunk)
+        vad.peek_buffer()
+        per_chunk_us[index] = (time.perf_counter() - t0) * 1e6
+
+    window = max(1, int(SAMPLE_RATE / CHUNK))  # 每个检查点取其前 1s 的块
+    at = {}
+    for point in checkpoints:
+        end = min(total_chunks, int(point * SAMPLE_RATE / CHUNK))
+        if end <= 0:
+            continue
+        at[f'{point:g}s'] = round(float(np.median(per_chunk_us[max(0, end - window):end])), 2)
+    return {
+        'variant': variant,
+        'utterance_seconds': seconds,
+        'chunks': total_chunks,
+        'total_ms': round(float(per_chunk_us.sum()) / 1000.0, 2),
+        'per_chunk_us_at': at,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='VAD 语音缓冲逐块开销基准')
+    parser.add_argument('--seconds', type=float, default=30.0, help='模拟的单句时长')
+    parser.add_argument('--json', action='store_true', help='以 JSON 输出结果')
+    args = parser.parse_args()
+
+    checkpoints = [p for p in (1, 5, 10, 20, 30, 60, 120) if p <= args.seconds]
+    results = [_run(variant, args.seconds, checkpoints) for variant in ('legacy', 'contiguous')]
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return 0
+
+    print(f"单句 {args.seconds:.0f}s，块 {CHUNK} 采样；每块 process_chunk + peek_buffer 的中位耗时（µs）")
+    header = ''.join(f"{f'@{p}s':>10}" for p in checkpoints)
+    print(f"{'variant':<12}{header}{'total':>12}")
+    for r in results:
+        cells = ''.join(f"{r['per_chunk_us_at'].get(f'{p:g}s', 0.0):>10.1f}" for p in checkpoints)
+        print(f"{r['variant']:<12}{cells}{r['total_ms']:>10.1f}ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
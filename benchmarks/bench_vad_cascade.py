@@ -0,0 +1,127 @@
+"""
+级联 VAD 基准：在带标注回放集上比较 silero 与 cascade（能量/过零预筛 + Silero）模式。
+
+对每段回放逐块（512 采样）调用 VADProcessor.process_chunk，统计：
+- CPU 时间（process_time）与 Silero 实际推理次数占比；
+- 逐块判决（confidence >= 阈值）相对标注的准确率、精确率、召回率；
+- cascade 与 silero 判决的一致率。
+结果按背景类型汇总（合成集为 digital / quiet / room / hum，清单可自带 background 字段）。
+
+用法：
+    python benchmarks/bench_vad_cascade.py
+    python benchmarks/bench_vad_cascade.py --manifest data/vad/labels.jsonl --floor -45 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from vad_dataset import load_clips  # noqa: E402
+from local_asr.vad_processor import VADProcessor  # noqa: E402
+
+
+def _run_clip(clip, mode: str, floor: int):
+    vad = VADProcessor(sample_rate=16000, pre_speech_duration=0.2)
+    vad.update_settings({'vad_mode': mode, 'cascade_silence_dbfs': floor})
+    threshold = vad._effective_threshold()
+    decisions = []
+    t0 = time.process_time()
+    for chunk in clip.chunks():
+        vad.process_chunk(chunk)
+        decisions.append(vad.last_confidence >= threshold)
+    cpu = time.process_time() - t0
+    return np.asarray(decisions, dtype=bool), cpu, vad.silero_runs
+
+
+def _scores(decisions: np.ndarray, labels: np.ndarray) -> dict:
+    tp = int(np.sum(decisions & labels))
+    fp = int(np.sum(decisions & ~labels))
+    fn = int(np.sum(~decisions & labels))
+    return {
+        'accuracy': round(float(np.mean(decisions == labels)), 4),
+        'precision': round(tp / (tp + fp), 4) if tp + fp else 0.0,
+        'recall': round(tp / (tp + fn), 4) if tp + fn else 0.0,
+    }
+
+
+def evaluate(clips, floor: int) -> list:
+    groups = defaultdict(lambda: {'chunks': 0, 'labels': [], 'silero': [], 'cascade': [],
+                                  'cpu': defaultdict(float), 'runs': defaultdict(int)})
+    for clip in clips:
+        labels = clip.chunk_labels()
+        for key in (clip.background or 'unlabeled', 'all'):
+            group = groups[key]
+            group['chunks'] += len(labels)
+            group['labels'].append(labels)
+        for mode in ('silero', 'cascade'):
+            decisions, cpu, runs = _run_clip(clip, mode, floor)
+            for key in (clip.background or 'unlabeled', 'all'):
+                groups[key][mode].append(decisions)
+                groups[key]['cpu'][mode] += cpu
+                groups[key]['runs'][mode] += runs
+
+    results = []
+    for key, group in groups.items():
+        labels = np.concatenate(group['labels'])
+        silero = np.concatenate(group['silero'])
+        cascade = np.concatenate(group['cascade'])
+        results.append({
+            'background': key,
+            'chunks': group['chunks'],
+            'speech_fraction': round(float(labels.mean()), 3),
+            'silero': {
+                'cpu_ms': round(group['cpu']['silero'] * 1000.0, 1),
+                'model_runs_fraction': round(group['runs']['silero'] / group['chunks'], 3),
+                **_scores(silero, labels),
+            },
+            'cascade': {
+                'cpu_ms': round(group['cpu']['cascade'] * 1000.0, 1),
+                'model_runs_fraction': round(group['runs']['cascade'] / group['chunks'], 3),
+                **_scores(cascade, labels),
+            },
+            'agreement': round(float(np.mean(silero == cascade)), 4),
+        })
+    results.sort(key=lambda r: (r['background'] == 'all', r['background']))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='级联 VAD（静音预筛 + Silero）CPU 与准确率基准')
+    parser.add_argument('--manifest', default='', help='带标注的 JSONL 清单；缺省时使用合成集')
+    parser.add_argument('--clips', type=int, default=12, help='合成集段数')
+    parser.add_argument('--seconds', type=float, default=20.0, help='合成集每段时长')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--floor', type=int, default=-50, help='cascade 静音底（dBFS）')
+    parser.add_argument('--json', action='store_true', help='以 JSON 输出结果')
+    args = parser.parse_args()
+
+    clips = load_clips(args.manifest, count=args.clips, seconds=args.seconds, seed=args.seed)
+    results = evaluate(clips, args.floor)
+
+    if args.json:
+        print(json.dumps({'floor_dbfs': args.floor, 'results': results}, indent=2, ensure_ascii=False))
+        return 0
+
+    print(f"{len(clips)} 段回放，cascade 静音底 {args.floor} dBFS")
+    print(f"{'background':<11}{'mode':<9}{'cpu':>9}{'runs':>7}{'acc':>8}{'prec':>8}{'recall':>8}{'agree':>8}")
+    for r in results:
+        for mode in ('silero', 'cascade'):
+            m = r[mode]
+            agree = f"{r['agreement']:>8.4f}" if mode == 'cascade' else ''
+            print(
+                f"{r['background'] if mode == 'silero' else '':<11}{mode:<9}{m['cpu_ms']:>7.0f}ms"
+                f"{m['model_runs_fraction']:>7.2f}{m['accuracy']:>8.4f}{m['precision']:>8.4f}{m['recall']:>8.4f}{agree}"
+            )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""
+VAD 分段（端点检测）评测：把带标注的回放逐块送入 VADProcessor，衡量参数
+（阈值、静音时长 silence_duration、最短语音 min_speech_duration、_flush_segment
+的语音密度过滤等）对分段质量与句尾延迟的影响。
+
+逐段回放统计：
+- 逐块 CPU 耗时（process_chunk，均值 / p95，µs）；
+- 起声延迟：标注句子开始 → VAD 首次进入说话状态（该块结束时刻）；
+- 句尾延迟：标注句子结束 → 分段被交出（本地识别开始转写的时刻）；
+- 误切分率：被切成多段的标注句子占比；
+- 误合并率：跨越多个标注句子的分段占比；
+- 漏检率（未被任何分段覆盖的句子）与误报率（不覆盖任何句子的分段）。
+结果按背景类型与 all 汇总。
+
+回归门控：``--baseline`` 指向先前 ``--json`` 的输出，all 组的延迟或比率比基线
+差出容差时以退出码 1 结束，可直接用于 CI。CPU 耗时受机器影响，默认不参与门控。
+JSON 中记录回放集参数（清单或合成集的段数、时长、种子、迟疑概率），与基线不一致时
+拒绝比较并以退出码 2 结束，免得换了数据集的结果被当成退化或改进。
+
+用法：
+    python benchmarks/bench_vad_endpointing.py
+    python benchmarks/bench_vad_endpointing.py --manifest data/vad/labels.jsonl --json > baseline.json
+    python benchmarks/bench_vad_endpointing.py --manifest data/vad/labels.jsonl --baseline baseline.json
+    python benchmarks/bench_vad_endpointing.py --mode energy --silence 0.5   # 无需模型
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from vad_dataset import CHUNK, SAMPLE_RATE, load_clips  # noqa: E402
+from local_asr.vad_processor import VADProcessor  # noqa: E402
+
+# 门控比较的指标：(名称, 容差类型)；数值越大越差
+GATED_METRICS = (
+    ('onset_p50_ms', 'latency'),
+    ('onset_p95_ms', 'latency'),
+    ('offset_p50_ms', 'latency'),
+    ('offset_p95_ms', 'latency'),
+    ('split_rate', 'rate'),
+    ('merge_rate', 'rate'),
+    ('miss_rate', 'rate'),
+    ('false_alarm_rate', 'rate'),
+)
+
+
+def make_vad(settings: dict) -> VADProcessor:
+    vad = VADProcessor(
+        sample_rate=SAMPLE_RATE,
+        chunk_duration=CHUNK / SAMPLE_RATE,
+        pre_speech_duration=float(settings.get('pre_speech_duration', 0.2)),
+    )
+    vad.update_settings(settings)
+    return vad
+
+
+def run_clip(clip, settings: dict, vad_factory=make_vad) -> dict:
+    """逐块回放一段音频，记录每块说话状态、交出的分段区间与逐块耗时（秒）。"""
+    vad = vad_factory(settings)
+    speaking = []
+    segments = []          # (start_s, emit_s, 结尾静音 s)
+    chunk_seconds = []
+    start = None
+    position = 0
+    for chunk in clip.chunks():
+        was_empty = vad._speech_samples == 0
+        silence_before = vad._silence_counter
+        t0 = time.perf_counter()
+        segment = vad.process_chunk(chunk)
+        chunk_seconds.append(time.perf_counter() - t0)
+        position += len(chunk)
+        if was_empty and vad._speech_samples:
+            # 缓冲从空变为非空：起点含起声前缓存
+            start = (position - vad._speech_samples) / SAMPLE_RATE
+        if segment is not None:
+            segments.append((start if start is not None else (position - len(segment)) / SAMPLE_RATE,
+                             position / SAMPLE_RATE, (silence_before + 1) * CHUNK / SAMPLE_RATE))
+            start = None
+        elif start is not None and vad._speech_samples == 0:
+            start = None  # 被密度过滤丢弃
+        speaking.append(vad.is_speaking)
+    trailing = vad._silence_counter * CHUNK / SAMPLE_RATE
+    tail = vad.flush()
+    if tail is not None and start is not None:
+        segments.append((start, position / SAMPLE_RATE, trailing))
+    return {
+        'speaking': np.asarray(speaking, dtype=bool),
+        'segments': segments,
+        'chunk_seconds': np.asarray(chunk_seconds),
+    }
+
+
+def _overlaps(a_start, a_end, b_start, b_end) -> bool:
+    return min(a_end, b_end) > max(a_start, b_start)
+
+
+def score_clip(clip, run: dict) -> dict:
+    """把一次回放结果与标注对齐，返回原始计数与延迟样本。"""
+    chunk_s = CHUNK / SAMPLE_RATE
+    speaking = run['speaking']
+    # 分段中真正的语音部分：交出时刻减去结尾的静音等待
+    spans = [(s, max(s, e - trailing), e) for s, e, trailing in run['segments']]
+    onsets, offsets = [], []
+    split = missed = 0
+    for label_start, label_end in clip.speech:
+        first = int(label_start / chunk_s)
+        last = min(len(speaking), int(np.ceil(label_end / chunk_s)))
+        hits = np.flatnonzero(speaking[first:last])
+        if hits.size:
+            onsets.append((first + hits[0] + 1) * chunk_s - label_start)
+        covering = [span for span in spans if _overlaps(span[0], span[1], label_start, label_end)]
+        if not covering:
+            missed += 1
+        elif len(covering) > 1:
+            split += 1
+    merged = false_alarm = 0
+    for seg_start, speech_end, emit in spans:
+        labels = [(s, e) for s, e in clip.speech if _overlaps(seg_start, speech_end, s, e)]
+        if not labels:
+            false_alarm += 1
+            continue
+        if len(labels) > 1:
+            merged += 1
+        offsets.append(emit - labels[-1][1])
+    return {
+        'utterances': len(clip.speech),
+        'segments': len(spans),
+        'split': split,
+        'merged': merged,
+        'missed': missed,
+        'false_alarm': false_alarm,
+        'onsets': onsets,
+        'offsets': offsets,
+        'chunk_seconds': run['chunk_seconds'],
+    }
+
+
+def _ms(values, q) -> float:
+    return round(float(np.percentile(values, q)) * 1000.0, 1) if len(values) else 0.0
+
+
+def summarize(scores) -> dict:
+    utterances = sum(s['utterances'] for s in scores)
+    segments = sum(s['segments'] for s in scores)
+    onsets = [v for s in scores for v in s['onsets']]
+    offsets = [v for s in scores for v in s['offsets']]
+    chunk_us = np.concatenate([s['chunk_seconds'] for s in scores]) * 1e6
+    return {
+        'utterances': utterances,
+        'segments': segments,
+        'chunk_cpu_mean_us': round(float(chunk_us.mean()), 2) if chunk_us.size else 0.0,
+        'chunk_cpu_p95_us': round(float(np.percentile(chunk_us, 95)), 2) if chunk_us.size else 0.0,
+        'onset_p50_ms': _ms(onsets, 50),
+        'onset_p95_ms': _ms(onsets, 95),
+        'offset_p50_ms': _ms(offsets, 50),
+        'offset_p95_ms': _ms(offsets, 95),
+        'split_rate': round(sum(s['split'] for s in scores) / utterances, 4) if utterances else 0.0,
+        'merge_rate': round(sum(s['merged'] for s in scores) / segments, 4) if segments else 0.0,
+        'miss_rate': round(sum(s['missed'] for s in scores) / utterances, 4) if utterances else 0.0,
+        'false_alarm_rate': round(sum(s['false_alarm'] for s in scores) / segments, 4) if segments else 0.0,
+    }
+
+
+def evaluate(clips, settings: dict, vad_factory=make_vad) -> list:
+    groups = defaultdict(list)
+    for clip in clips:
+        score = score_clip(clip, run_clip(clip, settings, vad_factory))
+        groups[clip.background or 'unlabeled'].append(score)
+        groups['all'].append(score)
+    results = [{'background': key, **summarize(scores)} for key, scores in groups.items()]
+    results.sort(key=lambda r: (r['background'] == 'all', r['background']))
+    return results
+
+
+def check_regressions(results: list, baseline: dict, latency_ms: float, rate: float, cpu_ratio: float) -> list:
+    """与基线的 all 组比较，返回超出容差的指标说明列表（空表示通过）。"""
+    current = next(r for r in results if r['background'] == 'all')
+    base = next(r for r in baseline['results'] if r['background'] == 'all')
+    failures = []
+    for name, kind in GATED_METRICS:
+        allowed = base[name] + (latency_ms if kind == 'latency' else rate)
+        if current[name] > allowed:
+            failures.append(f'{name}: {current[name]} > 基线 {base[name]} + 容差')
+    if cpu_ratio > 0 and current['chunk_cpu_mean_us'] > base['chunk_cpu_mean_us'] * (1.0 + cpu_ratio):
+        failures.append(f"chunk_cpu_mean_us: {current['chunk_cpu_mean_us']} > 基线 {base['chunk_cpu_mean_us']} × {1.0 + cpu_ratio:g}")
+    return failures
+
+
+def dataset_params(args) -> dict:
+    """回放集的标识参数；使用清单时合成集参数不起作用。"""
+    if args.manifest:
+        return {'manifest': args.manifest}
+    return {'clips': args.clips, 'seconds': args.seconds, 'seed': args.seed, 'hesitation': args.hesitation}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='VAD 分段与句尾延迟评测')
+    parser.add_argument('--manifest', default='', help='带标注的 JSONL 清单；缺省时使用合成集')
+    parser.add_argument('--clips', type=int, default=12, help='合成集段数')
+    parser.add_argument('--seconds', type=float, default=30.0, help='合成集每段时长')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--hesitation', type=float, default=0.0,
+                        help='合成集句内迟疑停顿概率（每音节，如 0.08），用于暴露误切分；0 表示不插入')
+    parser.add_argument('--mode', default='silero', help='VAD 模式（silero / cascade / energy）')
+    parser.add_argument('--threshold', type=float, default=0.5)
+    parser.add_argument('--silence', type=float, default=0.8, help='句尾静音时长（秒）')
+    parser.add_argument('--min-speech', type=float, default=1.0, help='最短语音时长（秒）')
+    parser.add_argument('--pre-speech', type=float, default=0.2, help='起声前缓存（秒）')
+    parser.add_argument('--adaptive', action='store_true', help='启用自适应句尾判定')
+    parser.add_argument('--json', action='store_true', help='以 JSON 输出结果')
+    parser.add_argument('--baseline', default='', help='基线 JSON（先前 --json 的输出）；退化时退出码为 1')
+    parser.add_argument('--latency-tolerance-ms', type=float, default=40.0)
+    parser.add_argument('--rate-tolerance', type=float, default=0.02)
+    parser.add_argument('--cpu-tolerance', type=float, default=0.0,
+                        help='逐块 CPU 允许的相对增幅（如 0.25）；0 表示不门控')
+    args = parser.parse_args()
+
+    settings = {
+        'vad_mode': args.mode,
+        'vad_threshold': args.threshold,
+        'silence_duration': args.silence,
+        'min_speech_duration': args.min_speech,
+        'pre_speech_duration': args.pre_speech,
+        'adaptive_endpoint': args.adaptive,
+    }
+    dataset = dataset_params(args)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('dataset') != dataset:
+            print(f"基线回放集参数 {baseline.get('dataset')} 与本次 {dataset} 不一致，拒绝比较", file=sys.stderr)
+            return 2
+
+    clips = load_clips(args.manifest, count=args.clips, seconds=args.seconds, seed=args.seed,
+                       hesitation=args.hesitation)
+    results = evaluate(clips, settings)
+
+    failures = []
+    if baseline is not None:
+        failures = check_regressions(results, baseline, args.latency_tolerance_ms,
+                                     args.rate_tolerance, args.cpu_tolerance)
+
+    if args.json:
+        print(json.dumps({'dataset': dataset, 'settings': settings, 'results': results, 'regressions': failures},
+                         indent=2, ensure_ascii=False))
+    else:
+        print(f"{len(clips)} 段回放，mode={args.mode} threshold={args.threshold:g} "
+              f"silence={args.silence:g}s min_speech={args.min_speech:g}s adaptive={args.adaptive}")
+        print(f"{'background':<11}{'utt':>5}{'seg':>5}{'cpu':>9}{'onset50':>9}{'offset50':>10}"
+              f"{'offset95':>10}{'split':>7}{'merge':>7}{'miss':>7}{'false':>7}")
+        for r in results:
+            print(
+                f"{r['background']:<11}{r['utterances']:>5}{r['segments']:>5}{r['chunk_cpu_mean_us']:>7.0f}us"
+                f"{r['onset_p50_ms']:>7.0f}ms{r['offset_p50_ms']:>8.0f}ms{r['offset_p95_ms']:>8.0f}ms"
+                f"{r['split_rate']:>7.3f}{r['merge_rate']:>7.3f}{r['miss_rate']:>7.3f}{r['false_alarm_rate']:>7.3f}"
+            )
+        for failure in failures:
+            print(f'退化: {failure}', file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
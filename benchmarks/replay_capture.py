@@ -0,0 +1,85 @@
+"""
+离线回放采集管线：用 WAV 文件代替麦克风运行 audio_capture_task。
+
+报告各阶段 CPU（读取 / 下混+重采样 / VAD / 发送）、模拟声卡溢出丢帧、
+发送队列高水位与合并统计。
+
+用法：
+    python benchmarks/replay_capture.py speech_48k_stereo.wav
+    python benchmarks/replay_capture.py a.wav b.wav --speed 0 --vad --json
+    python benchmarks/replay_capture.py a.wav --speed 1 --send-delay-ms 150
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from audio_replay import ReplayRecognizer, WavReplayStream, run_replay  # noqa: E402
+
+
+def _print_report(path: str, report: dict) -> None:
+    src = report['source']
+    print(f"\n=== {path} ===")
+    print(
+        f"输入: {src['sample_rate']}Hz / {src['channels']}ch / {src['duration_seconds']:.2f}s, "
+        f"耗时 {report['wall_seconds']:.2f}s (RTF {report['realtime_factor']:.3f})"
+    )
+    print(f"进程 CPU: {report['process_cpu_ms_per_audio_second']:.2f} ms / 秒音频")
+    for stage, entry in report['stages'].items():
+        print(
+            f"  {stage:<8} calls={entry['calls']:<6} cpu={entry['cpu_ms']:.1f}ms "
+            f"({entry['cpu_ms_per_audio_second']:.3f} ms / 秒音频)"
+        )
+    print(f"声卡溢出: overflows={src['overflows']}, dropped_frames={src['dropped_frames']}")
+    send = report['send']
+    if send:
+        print(
+            f"发送队列: high_water={send['queue_high_water']}/{send['queue_capacity']}, "
+            f"dropped={send['queue_dropped_frames']}, sends={send['sends']}, "
+            f"frames={send['frames']}, coalesced={send['coalesced_sends']}"
+        )
+    if report['recognizer']:
+        print(f"识别器: {report['recognizer']}")
+    if report['pre_roll']:
+        print(f"起声前补发: {report['pre_roll']}")
+
+
+async def _run(args) -> list:
+    results = []
+    for path in args.wav:
+        stream = WavReplayStream.from_wav(
+            path,
+            speed=args.speed,
+            device_buffer_seconds=args.device_buffer_ms / 1000.0,
+        )
+        recognizer = ReplayRecognizer(send_delay=args.send_delay_ms / 1000.0)
+        report = await run_replay(stream, vad=args.vad, recognizer=recognizer)
+        results.append((path, report.to_dict()))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='用 WAV 文件离线回放采集管线')
+    parser.add_argument('wav', nargs='+', help='PCM WAV 文件（任意声道数 / 采样率）')
+    parser.add_argument('--speed', type=float, default=1.0, help='回放倍速，1 为实时，0 为不节流')
+    parser.add_argument('--vad', action='store_true', help='启用 Silero 发送门控')
+    parser.add_argument('--send-delay-ms', type=float, default=0.0, help='模拟每次发送的网络耗时')
+    parser.add_argument('--device-buffer-ms', type=float, default=500.0, help='模拟声卡缓冲时长')
+    parser.add_argument('--json', action='store_true', help='以 JSON 输出结果')
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args))
+    if args.json:
+        print(json.dumps({path: report for path, report in results}, indent=2, ensure_ascii=False))
+    else:
+        for path, report in results:
+            _print_report(path, report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+VAD 评测用的带标注回放集。
+
+两种来源：
+- 清单文件（JSONL）：每行 ``{"wav": "a.wav", "speech": [[0.8, 2.4], [3.1, 5.0]]}``，
+  wav 路径相对清单所在目录，speech 为人工标注的语音区间（秒）。音频会被下混为
+  单声道并重采样到 16kHz。
+- 合成集（默认）：共振峰合成的音节串组成的「句子」，间以随机停顿，叠加数字静音、
+  低噪声、房间噪声、工频哼声等背景；标注即合成时的句子区间。hesitation > 0 时
+  句内词间会随机插入 0.15~0.7s 的迟疑停顿（仍属同一标注句），每段的停顿概率在
+  0~2×hesitation 间随机（模拟说话流利程度不同的人），用于评测句尾判定是否会把
+  犹豫的句子切开。合成集不能替代真实
+  录音，但可以在没有数据的机器上复现、比较不同 VAD 配置。
+
+供 benchmarks 下的 VAD 相关脚本共用。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+SAMPLE_RATE = 16000
+CHUNK = 512
+
+# 元音前三个共振峰（Hz）
+_VOWEL_FORMANTS = (
+    (730, 1090, 2440),
+    (270, 2290, 3010),
+    (300, 870, 2240),
+    (530, 1840, 2480),
+    (570, 840, 2410),
+    (660, 1720, 2410),
+)
+_FORMANT_BANDWIDTHS = (90, 110, 150)
+_FORMANT_GAINS = (1.0, 0.6, 0.3)
+
+BACKGROUNDS = ('digital', 'quiet', 'room', 'hum')
+
+
+@dataclass
+class LabeledClip:
+    name: str
+    samples: np.ndarray                       # float32，16kHz 单声道
+    speech: List[Tuple[float, float]] = field(default_factory=list)
+    background: str = ''
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / SAMPLE_RATE
+
+    def chunk_labels(self, chunk: int = CHUNK) -> np.ndarray:
+        """逐块真值：与语音区间重叠超过半块的块记为语音。"""
+        count = len(self.samples) // chunk
+        covered = np.zeros(len(self.samples), dtype=bool)
+        for start, end in self.speech:
+            covered[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)] = True
+        blocks = covered[: count * chunk].reshape(count, chunk)
+        return blocks.sum(axis=1) * 2 > chunk
+
+    def chunks(self, chunk: int = CHUNK):
+        for offset in range(0, len(self.samples) - chunk + 1, chunk):
+            yield self.samples[offset:offset + chunk]
+
+
+# ---------------------------------------------------------------------------
+# 清单加载
+# ---------------------------------------------------------------------------
+
+def _to_mono_16k(frames: np.ndarray, rate: int) -> np.ndarray:
+    mono = frames.astype(np.float32).mean(axis=1) / 32768.0
+    if rate == SAMPLE_RATE:
+        return mono.astype(np.float32)
+    from audio_resampler import AudioResampler
+
+    pcm = np.clip(np.rint(mono * 32768.0), -32768, 32767).astype(np.int16)
+    resampler = AudioResampler(rate, SAMPLE_RATE, channels=1)
+    out = resampler.resample_array(pcm)
+    return (out.astype(np.float32) / 32768.0).astype(np.float32)
+
+
+def load_manifest(path: str) -> List[LabeledClip]:
+    from audio_replay import load_wav_pcm16
+
+    base = os.path.dirname(os.path.abspath(path))
+    clips = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            entry = json.loads(line)
+            wav = entry['wav']
+            if not os.path.isabs(wav):
+                wav = os.path.join(base, wav)
+            frames, rate = load_wav_pcm16(wav)
+            clips.append(LabeledClip(
+                name=entry.get('name') or os.path.basename(wav),
+                samples=_to_mono_16k(frames, rate),
+                speech=[(float(s), float(e)) for s, e in entry.get('speech', [])],
+                background=str(entry.get('background', '')),
+            ))
+    return clips
+
+
+# ---------------------------------------------------------------------------
+# 合成集
+# ---------------------------------------------------------------------------
+
+def _formant_filter(source: np.ndarray, formants: Sequence[int]) -> np.ndarray:
+    """在频域对声源施加二阶谐振器组（等价于并联 IIR 共振峰滤波，便于向量化）。"""
+    n = len(source)
+    size = 1 << int(np.ceil(np.log2(max(2, n) + 512)))
+    w = 2 * np.pi * np.fft.rfftfreq(size, 1.0 / SAMPLE_RATE) / SAMPLE_RATE
+    z1 = np.exp(-1j * w)
+    response = np.zeros_like(z1)
+    for fc, bw, gain in zip(formants, _FORMANT_BANDWIDTHS, _FORMANT_GAINS):
+        r = np.exp(-np.pi * bw / SAMPLE_RATE)
+        theta = 2 * np.pi * fc / SAMPLE_RATE
+        response += gain / (1 - 2 * r * np.cos(theta) * z1 + r * r * z1 * z1)
+    return np.fft.irfft(np.fft.rfft(source, size) * response, size)[:n]
+
+
+def _syllable(rng: np.random.Generator, f0: float) -> np.ndarray:
+    n = int(rng.uniform(0.12, 0.28) * SAMPLE_RATE)
+    t = np.arange(n) / SAMPLE_RATE
+    pitch = f0 * (1 + rng.uniform(-0.15, 0.15) * t / t[-1])
+    phase = np.cumsum(pitch) / SAMPLE_RATE
+    source = (np.diff(np.floor(phase), prepend=0) > 0).astype(np.float64)
+    source += 0.02 * rng.standard_normal(n)
+    formants = _VOWEL_FORMANTS[rng.integers(len(_VOWEL_FORMANTS))]
+    voiced = _formant_filter(source, formants) * np.sqrt(np.hanning(n))
+    voiced /= np.max(np.abs(voiced)) + 1e-9
+    if rng.random() < 0.4:  # 清辅音（擦音）前缀
+        k = int(rng.uniform(0.04, 0.09) * SAMPLE_RATE)
+        fric = np.diff(rng.standard_normal(k), prepend=0) * np.hanning(k)
+        return np.concatenate([0.25 * fric / np.max(np.abs(fric)), voiced])
+    return voiced
+
+
+def _utterance(rng: np.random.Generator, seconds: float, hesitation: float = 0.0) -> np.ndarray:
+    f0 = rng.uniform(95, 220)
+    parts = []
+    total = 0
+    while total < seconds * SAMPLE_RATE:
+        syl = _syllable(rng, f0 * rng.uniform(0.9, 1.1))
+        if hesitation > 0 and rng.random() < hesitation:
+            gap = np.zeros(int(rng.uniform(0.15, 0.7) * SAMPLE_RATE))
+        else:
+            gap = np.zeros(int(rng.uniform(0.01, 0.06) * SAMPLE_RATE))
+        parts.extend((syl, gap))
+        total += len(syl) + len(gap)
+    return rng.uniform(0.1, 0.4) * np.concatenate(parts[:-1])
+
+
+def _background(rng: np.random.Generator, kind: str, n: int) -> np.ndarray:
+    if kind == 'digital':
+        return np.zeros(n)
+    if kind == 'quiet':
+        return 10 ** (-65 / 20) * rng.standard_normal(n)
+    if kind == 'room':
+        white = rng.standard_normal(n)
+        brown = np.cumsum(white)
+        brown -= np.convolve(brown, np.ones(400) / 400, mode='same')
+        noise = white + 0.1 * brown
+        return 10 ** (-50 / 20) * noise / (np.std(noise) + 1e-12)
+    if kind == 'hum':
+        t = np.arange(n) / SAMPLE_RATE
+        hum = np.sin(2 * np.pi * 50 * t) + 0.3 * np.sin(2 * np.pi * 150 * t)
+        return 10 ** (-42 / 20) * hum + 10 ** (-65 / 20) * rng.standard_normal(n)
+    raise ValueError(f'未知背景类型: {kind}')
+
+
+def synthetic_clips(
+    count: int = 8, seconds: float = 20.0, seed: int = 0, hesitation: float = 0.0
+) -> List[LabeledClip]:
+    """生成 count 段带标注的合成回放，背景类型按 BACKGROUNDS 轮换。
+
+    hesitation 为每个音节后插入迟疑停顿的平均概率（0 表示不插入）。
+    """
+    rng = np.random.default_rng(seed)
+    clips = []
+    for index in range(count):
+        kind = BACKGROUNDS[index % len(BACKGROUNDS)]
+        rate = hesitation * rng.uniform(0.0, 2.0) if hesitation > 0 else 0.0
+        pieces = []
+        speech = []
+        cursor = int(rng.uniform(0.5, 1.5) * SAMPLE_RATE)
+        pieces.append(np.zeros(cursor))
+        while cursor < seconds * SAMPLE_RATE:
+            utt = _utterance(rng, rng.uniform(0.8, 4.0), rate)
+            speech.append((cursor / SAMPLE_RATE, (cursor + len(utt)) / SAMPLE_RATE))
+            pause = np.zeros(int(rng.uniform(0.4, 3.0) * SAMPLE_RATE))
+            pieces.extend((utt, pause))
+            cursor += len(utt) + len(pause)
+        signal = np.concatenate(pieces)
+        signal += _background(rng, kind, len(signal))
+        # 模拟 16-bit 采集的量化
+        pcm = np.clip(np.rint(signal * 32768.0), -32768, 32767)
+        clips.append(LabeledClip(
+            name=f'synthetic-{index:02d}-{kind}',
+            samples=(pcm / 32768.0).astype(np.float32),
+            speech=speech,
+            background=kind,
+        ))
+    return clips
+
+
+def load_clips(
+    manifest: str = '', count: int = 8, seconds: float = 20.0, seed: int = 0, hesitation: float = 0.0
+) -> List[LabeledClip]:
+    """有清单时读取清单，否则生成合成集。"""
+    if manifest:
+        return load_manifest(manifest)
+    return synthetic_clips(count=count, seconds=seconds, seed=seed, hesitation=hesitation)
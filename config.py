@@ -104,18 +104,43 @@ if LOCAL_ASR_ENGINE not in _VALID_LOCAL_ASR_ENGINES:
 # 一个总开关 + 一组参数，既用于在线 API 后端的发送门控（静音时不向 ASR
 # 发送音频以省流），也用于本地 ASR 的分段断句。
 VAD_ENABLED = _get_env_bool('VAD_ENABLED', True)
-LOCAL_VAD_MODE = 'silero'  # 可选: 'silero', 'energy'；在线门控固定使用 Silero
+LOCAL_VAD_MODE = 'silero'  # 可选: 'silero', 'cascade'（能量/过零预筛 + Silero）, 'energy'；在线门控沿用 silero / cascade，选 energy 时回退为 silero
 LOCAL_VAD_THRESHOLD = 0.50
 LOCAL_VAD_MIN_SPEECH_DURATION = 1.0
-# 单段口语送入 VAD 的最长时长（秒）；超过后对本段仅送入静音块直至 VAD 静音或闭麦结束本段（不按时长强制切句）
+# 单次送入本地识别的最长语音时长（秒）；连续说话超过后，在末尾 3 秒内置信度最低处切出一个窗口
+# 立即识别，其余音频（含重叠部分）继续累积，各窗口文本按重叠去重后依次作为最终结果交出
 LOCAL_VAD_MAX_SPEECH_DURATION = 30.0
+# 相邻窗口的重叠时长（秒），用于补全切点附近的字并在文本合并时去重
+LOCAL_ASR_WINDOW_OVERLAP = 0.8
 LOCAL_VAD_SILENCE_DURATION = 0.8
+# 自适应句尾：按本次会话的句内停顿统计与静音段置信度轨迹伸缩静音等待（流利时缩短，犹豫时延长）
+# 参数尚未调优（合成集上句尾更快但误切分增加），默认关闭
+LOCAL_VAD_ADAPTIVE_ENDPOINT = _get_env_bool('LOCAL_VAD_ADAPTIVE_ENDPOINT', False)
 # 起声时拼接的预缓冲音频时长（秒），用于避免漏掉第一个字
 LOCAL_VAD_PRE_SPEECH_DURATION = 0.2
+# Silero 推理是否通过 ONNX Runtime IOBinding 复用预分配的输入/状态/输出张量（每 32ms 一次，免分配）
+LOCAL_VAD_IO_BINDING = _get_env_bool('LOCAL_VAD_IO_BINDING', True)
+# cascade 模式的静音底（dBFS）：低于它的块直接判为静音、不跑 Silero（说话中始终跑 Silero）
+LOCAL_VAD_CASCADE_SILENCE_DBFS = _get_env_int('LOCAL_VAD_CASCADE_SILENCE_DBFS', -50, min_v=-90, max_v=-20)
+# 在线门控打开时补发的起声前音频时长（毫秒），0 表示不补发
+VAD_GATE_PRE_ROLL_MS = _get_env_int('VAD_GATE_PRE_ROLL_MS', 300, min_v=0, max_v=2000)
 
 # 本地增量识别（中间结果）
 LOCAL_INCREMENTAL_ASR = True
 LOCAL_INTERIM_INTERVAL = 2.0
+# 推测式最终识别：置信度首次跌破阈值时就对已缓冲的语音开始解码，静音确认后直接交出结果；
+# 若继续说话，该结果作为中间结果使用。把识别计算藏进句尾静音等待中
+LOCAL_SPECULATIVE_FINAL = _get_env_bool('LOCAL_SPECULATIVE_FINAL', True)
+# 本地识别引擎在独立子进程中运行：音频经共享内存传入、结果经管道返回，引擎的 Python 侧计算
+# （特征提取、解码循环）不再与采集循环争抢 GIL；子进程在停止/重新开始之间保持模型常驻
+LOCAL_ASR_WORKER_PROCESS = _get_env_bool('LOCAL_ASR_WORKER_PROCESS', False)
+# 首次构建 ONNX Runtime 会话时把优化后的图存入本地模型目录（按模型哈希与 ORT 版本区分），
+# 之后启动直接加载，省去 SenseVoice / Qwen 编码器 / Silero 的图优化耗时
+LOCAL_ASR_ORT_GRAPH_CACHE = _get_env_bool('LOCAL_ASR_ORT_GRAPH_CACHE', True)
+# 停止识别后引擎留在进程内保温，下次开始直接复用；空闲超过该秒数即卸载（0 表示停止即卸载）
+LOCAL_ASR_POOL_IDLE_SECONDS = _get_env_int('LOCAL_ASR_POOL_IDLE_SECONDS', 600, min_v=0, max_v=86400)
+# 保温引擎的内存预算（MB，按模型文件大小估算）：超出时先卸载最久未用的空闲引擎
+LOCAL_ASR_POOL_MEMORY_MB = _get_env_int('LOCAL_ASR_POOL_MEMORY_MB', 2048, min_v=0, max_v=65536)
 
 # Qwen3-ASR：GGUF 解码器 KV 上下文长度（token）；增大占显存/内存。
 LOCAL_QWEN_ASR_N_CTX = 2048
@@ -138,6 +163,35 @@ BITS = 16  # 每个采样的位数
 FORMAT_PCM = 'pcm'  # 音频数据格式
 BLOCK_SIZE = 1600  # 每个缓冲区的帧数
 
+# 采集模式：
+# 'blocking' - 在音频线程中阻塞读取 stream.read()（默认）
+# 'callback' - PortAudio 回调写入预分配环形缓冲区，由事件唤醒 asyncio 消费端
+AUDIO_CAPTURE_MODE = os.getenv('AUDIO_CAPTURE_MODE', 'blocking').strip().lower() or 'blocking'
+if AUDIO_CAPTURE_MODE not in {'blocking', 'callback'}:
+    AUDIO_CAPTURE_MODE = 'blocking'
+
+# 回调模式下环形缓冲区可容纳的音频时长（秒），超出时丢弃最旧数据
+AUDIO_CALLBACK_RING_SECONDS = 2.0
+
+# 重采样引擎：
+# 'auto' - 整数倍降采样（如 48k -> 16k）使用多相 FIR，其余情况使用 soxr（默认）
+# 'fir'  - 强制使用多相 FIR（仅支持整数倍降采样）
+# 'soxr' - 始终使用 soxr
+AUDIO_RESAMPLER_ENGINE = os.getenv('AUDIO_RESAMPLER_ENGINE', 'auto').strip().lower() or 'auto'
+if AUDIO_RESAMPLER_ENGINE not in {'auto', 'fir', 'soxr'}:
+    AUDIO_RESAMPLER_ENGINE = 'auto'
+
+# ASR 发送端合并：网络卡顿后把队列中积压的同一会话音频帧合并为一次发送。
+# 只对声明了单次发送上限（max_audio_append_bytes，如 DashScope）的识别器生效；
+# 此处可再收紧该上限（字节，16kHz 单声道 int16 下 32000 字节约 1 秒），0 表示不额外限制
+ASR_SEND_COALESCE_MAX_BYTES = _get_env_int('ASR_SEND_COALESCE_MAX_BYTES', 0, min_v=0, max_v=1048576)
+
+# 端到端延迟追踪（采集 -> ASR -> 翻译 -> OSC），汇总见控制面板 /api/latency
+LATENCY_TRACE_ENABLED = _get_env_bool('LATENCY_TRACE_ENABLED', True)
+LATENCY_TRACE_WINDOW = 200  # 滚动分位数使用的最近句数
+# 非空时把每句的追踪按行写入该 JSONL 文件（相对路径位于用户数据目录）
+LATENCY_TRACE_EXPORT_PATH = os.getenv('LATENCY_TRACE_EXPORT_PATH', '').strip()
+
 # 是否将重采样后的音频保存到本地 WAV（调试用）
 SAVE_POST_RESAMPLE_AUDIO = _get_env_bool('SAVE_POST_RESAMPLE_AUDIO', False)
 
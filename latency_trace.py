@@ -0,0 +1,303 @@
+"""
+端到端延迟追踪：为每句话分配 trace id，在管线各阶段打单调时钟时间戳。
+
+阶段（按管线顺序）：
+- speech_start / speech_end：采集侧 VAD 门控打开 / 关闭
+- audio_sent：本句第一块音频交给识别器
+- asr_first_partial / asr_final：识别回调收到首个中间结果 / 最终结果
+- lang_detected：最终结果完成语言检测
+- translate_start / translate_done：终句翻译任务开始 / 结束
+- mt_request / mt_response：translate_with_backend 调用翻译后端
+- osc_enqueued / osc_sent：交给 OSCManager / 实际发出（差值即冷却等待）
+
+「当前句」由采集侧（门控打开）或识别回调（首个结果）按需创建，在识别出
+最终结果时脱离，之后的阶段通过显式传递的 trace id 打点。终句 OSC 发出
+时结束追踪；其余未走到 OSC 的追踪超时后以 incomplete 状态结束。
+结束的追踪按行写入 JSONL（可选），并进入按阶段的滚动窗口用于 p50/p95。
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+import config
+
+STAGES = (
+    'speech_start',
+    'audio_sent',
+    'asr_first_partial',
+    'speech_end',
+    'asr_final',
+    'lang_detected',
+    'translate_start',
+    'mt_request',
+    'mt_response',
+    'translate_done',
+    'osc_enqueued',
+    'osc_sent',
+)
+
+# 直方图桶上界（毫秒）
+HISTOGRAM_BUCKETS_MS = (50, 100, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000, 10000)
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    pos = (len(sorted_values) - 1) * q
+    lower = int(pos)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (pos - lower)
+
+
+class _Trace:
+    __slots__ = ('trace_id', 'created_at', 'wall_time', 'marks', 'attrs')
+
+    def __init__(self, trace_id: int):
+        self.trace_id = trace_id
+        self.created_at = time.monotonic()
+        self.wall_time = time.time()
+        self.marks: Dict[str, float] = {}
+        self.attrs: Dict[str, object] = {}
+
+    def origin(self) -> float:
+        return min(self.marks.values()) if self.marks else self.created_at
+
+    def to_record(self, status: str) -> dict:
+        origin = self.origin()
+        offsets = {
+            stage: round((t - origin) * 1000.0, 2)
+            for stage, t in sorted(self.marks.items(), key=lambda item: item[1])
+        }
+        record = {
+            'trace_id': self.trace_id,
+            'status': status,
+            'wall_time': round(self.wall_time, 3),
+            'stages_ms': offsets,
+        }
+        if self.attrs:
+            record['attrs'] = dict(self.attrs)
+        return record
+
+
+class LatencyTracer:
+    """线程安全的逐句延迟追踪器。
+
+    Parameters
+    ----------
+    enabled : bool
+        关闭时所有方法为空操作。
+    window : int
+        每个指标保留的最近样本数（用于滚动分位数）。
+    export_path : str, optional
+        非空时把结束的追踪逐行追加写入该 JSONL 文件。
+    stale_seconds : float
+        未结束的追踪超过该时长后以 incomplete 状态结束。
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        window: int = 200,
+        export_path: Optional[str] = None,
+        stale_seconds: float = 60.0,
+    ):
+        self.enabled = bool(enabled)
+        self.window = max(1, int(window))
+        self.export_path = export_path or None
+        self.stale_seconds = float(stale_seconds)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._inflight: Dict[int, _Trace] = {}
+        self._current: Optional[int] = None
+        self._samples: Dict[str, Deque[float]] = {}
+        self._recent: Deque[dict] = deque(maxlen=self.window)
+        self.completed = 0
+        self.incomplete = 0
+
+    # ---- 句子生命周期 ----
+
+    def current(self, create: bool = True) -> Optional[int]:
+        """返回当前句的 trace id；没有时按需创建。"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            if self._current is not None and self._current in self._inflight:
+                return self._current
+            if not create:
+                return None
+            expired = self._expire_stale_locked(time.monotonic())
+            trace = _Trace(next(self._ids))
+            self._inflight[trace.trace_id] = trace
+            self._current = trace.trace_id
+        # 采集线程也会走到这里：导出的文件 I/O 放在锁外
+        for record in expired:
+            self._export(record)
+        return trace.trace_id
+
+    def detach(self) -> Optional[int]:
+        """让当前句脱离（识别出最终结果后调用），返回其 trace id。"""
+        with self._lock:
+            trace_id, self._current = self._current, None
+            return trace_id
+
+    def mark(self, trace_id: Optional[int], stage: str, **attrs) -> None:
+        """记录阶段时间戳；同一阶段只保留第一次。"""
+        if not self.enabled or trace_id is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            trace = self._inflight.get(trace_id)
+            if trace is None:
+                return
+            trace.marks.setdefault(stage, now)
+            if attrs:
+                trace.attrs.update(attrs)
+
+    def mark_current(self, stage: str, **attrs) -> None:
+        """给当前句打点（不存在当前句时忽略）。"""
+        if not self.enabled:
+            return
+        self.mark(self._current, stage, **attrs)
+
+    def finish(self, trace_id: Optional[int], status: str = 'ok') -> None:
+        if not self.enabled or trace_id is None:
+            return
+        with self._lock:
+            trace = self._inflight.pop(trace_id, None)
+            if trace is None:
+                return
+            if self._current == trace_id:
+                self._current = None
+            record = self._complete_locked(trace, status)
+        self._export(record)
+
+    # ---- 内部 ----
+
+    def _complete_locked(self, trace: _Trace, status: str) -> dict:
+        record = trace.to_record(status)
+        if status == 'ok':
+            self.completed += 1
+            marks = trace.marks
+            origin = trace.origin()
+            for stage, t in marks.items():
+                self._add_sample_locked(stage, (t - origin) * 1000.0)
+            # 用户最关心的几个区间
+            for name, start, end in (
+                ('speech_end_to_osc', 'speech_end', 'osc_sent'),
+                ('asr_final_to_osc', 'asr_final', 'osc_sent'),
+                ('mt_roundtrip', 'mt_request', 'mt_response'),
+                ('osc_cooldown_wait', 'osc_enqueued', 'osc_sent'),
+            ):
+                if start in marks and end in marks:
+                    self._add_sample_locked(name, (marks[end] - marks[start]) * 1000.0)
+        else:
+            self.incomplete += 1
+        self._recent.append(record)
+        return record
+
+    def _add_sample_locked(self, name: str, value_ms: float) -> None:
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.window)
+        samples.append(value_ms)
+
+    def _expire_stale_locked(self, now: float) -> List[dict]:
+        """结束超时未完成的句子，返回其记录（由调用方在锁外导出）。"""
+        stale = [
+            trace for trace in self._inflight.values()
+            if now - trace.created_at > self.stale_seconds
+        ]
+        for trace in stale:
+            self._inflight.pop(trace.trace_id, None)
+            if self._current == trace.trace_id:
+                self._current = None
+        return [self._complete_locked(trace, 'incomplete') for trace in stale]
+
+    def _export(self, record: dict) -> None:
+        path = self.export_path
+        if not path:
+            return
+        try:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except OSError:
+            pass
+
+    # ---- 汇总 ----
+
+    def summary(self) -> dict:
+        """各阶段（相对本句起点）及关键区间的滚动 p50/p95 与直方图。"""
+        with self._lock:
+            samples = {name: sorted(values) for name, values in self._samples.items()}
+            result = {
+                'enabled': self.enabled,
+                'window': self.window,
+                'completed': self.completed,
+                'incomplete': self.incomplete,
+                'inflight': len(self._inflight),
+                'export_path': self.export_path,
+                'histogram_buckets_ms': list(HISTOGRAM_BUCKETS_MS),
+            }
+        metrics = {}
+        order = {stage: index for index, stage in enumerate(STAGES)}
+        for name in sorted(samples, key=lambda n: (order.get(n, len(order)), n)):
+            values = samples[name]
+            counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+            for value in values:
+                for index, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+                    if value <= bound:
+                        counts[index] += 1
+                        break
+                else:
+                    counts[-1] += 1
+            metrics[name] = {
+                'count': len(values),
+                'p50_ms': round(_percentile(values, 0.50), 1),
+                'p95_ms': round(_percentile(values, 0.95), 1),
+                'max_ms': round(values[-1], 1),
+                'histogram': counts,
+            }
+        result['metrics'] = metrics
+        return result
+
+    def recent(self, limit: int = 20) -> List[dict]:
+        limit = int(limit)
+        if limit <= 0:
+            return []
+        with self._lock:
+            return list(self._recent)[-limit:]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._inflight.clear()
+            self._current = None
+            self._samples.clear()
+            self._recent.clear()
+            self.completed = 0
+            self.incomplete = 0
+
+
+def _resolve_export_path(path: str) -> Optional[str]:
+    path = str(path or '').strip()
+    if not path:
+        return None
+    if not os.path.isabs(path):
+        from resource_path import get_user_data_path
+        path = get_user_data_path(path)
+    return path
+
+
+latency_tracer = LatencyTracer(
+    enabled=getattr(config, 'LATENCY_TRACE_ENABLED', True),
+    window=getattr(config, 'LATENCY_TRACE_WINDOW', 200),
+    export_path=_resolve_export_path(getattr(config, 'LATENCY_TRACE_EXPORT_PATH', '')),
+)
@@ -6,6 +6,7 @@ import sys
 import numpy as np
 
 import config
+from .asr_scheduler import CancelToken, TranscriptionCancelled
 from .model_manager import (
     MODELS_DIR,
     ensure_vendor_sources,
@@ -152,15 +153,27 @@ class Qwen3ASREngine:
         self._context = context
         self._context = self._truncate_context_to_tokens(self._context)
 
+    def commit_context(self, text: str) -> None:
+        """把已确认的识别原文追加到滚动上下文（用于未带 update_context 解码、事后才确认的结果）。"""
+        if text:
+            self._context = self._truncate_context_to_tokens(self._context + text)
+
     def to_device(self, device: str) -> bool:
         return False
 
+    def reset_session(self) -> None:
+        """Drop the rolling context and language; the model stays loaded (engine pool)."""
+        self.language = None
+        self._context = ""
+
     def unload(self) -> None:
         if hasattr(self, "_engine") and self._engine is not None:
             self._engine.shutdown()
             self._engine = None
 
-    def transcribe(self, audio: np.ndarray, *, update_context: bool = True) -> dict | None:
+    def transcribe(
+        self, audio: np.ndarray, *, update_context: bool = True, cancel: CancelToken | None = None
+    ) -> dict | None:
         if self._engine is None:
             return None
 
@@ -172,6 +185,8 @@ class Qwen3ASREngine:
         context = self._prompt_context()
 
         audio_embd, enc_s = self._engine.encoder.encode(audio)
+        if cancel is not None:
+            cancel.check()
         full_embd = self._engine._build_prompt_embd(
             audio_embd=audio_embd,
             prefix_text="",
@@ -184,7 +199,10 @@ class Qwen3ASREngine:
             rollback_num=5,
             is_last_chunk=True,
             temperature=0.4,
+            should_stop=(lambda: cancel.cancelled) if cancel is not None else None,
         )
+        if result.is_cancelled:
+            raise TranscriptionCancelled()
         if getattr(config, "LOCAL_QWEN_LOG_PIPELINE_TIMING", False):
             audio_sec = len(audio) / QWEN_SAMPLE_RATE
             pre_s = float(result.t_prefill)
@@ -0,0 +1,273 @@
+"""Priority scheduler for local ASR decodes.
+
+One worker thread runs every decode (the engines are not re-entrant). Jobs are
+ranked final > speculative final > partial, FIFO within a rank, so a final
+never queues behind interim work:
+
+- submitting a higher-ranked job cancels a running cancellable job (partials)
+  through its :class:`CancelToken`; engines poll the token between ORT stages /
+  inside the token loop and raise :class:`TranscriptionCancelled`;
+- a superseding submit drops queued jobs of the same rank (a newer partial
+  makes the older one stale);
+- jobs submitted with the same ``batch`` runner that are queued back to back
+  at one rank run as a single batched call (several finals waiting at once).
+
+Queue wait (submit -> start) is tracked per rank for ``stats()``.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_FINAL = 0
+PRIORITY_SPECULATIVE = 1
+PRIORITY_PARTIAL = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_FINAL: "final",
+    PRIORITY_SPECULATIVE: "speculative",
+    PRIORITY_PARTIAL: "partial",
+}
+
+
+class TranscriptionCancelled(Exception):
+    """Raised inside a decode whose :class:`CancelToken` was cancelled."""
+
+
+class CancelToken:
+    """Cooperative cancellation flag handed to each scheduled job."""
+
+    __slots__ = ("_event", "_callbacks", "_lock")
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._callbacks: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:  # pragma: no cover - runtime safety
+                logger.exception("ASR cancel callback failed")
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` on cancel (immediately if already cancelled), e.g. to terminate an ORT run."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def check(self) -> None:
+        if self._event.is_set():
+            raise TranscriptionCancelled()
+
+
+class _Job:
+    __slots__ = (
+        "priority", "seq", "fn", "future", "token", "cancellable", "submitted", "batch_fn", "batch_item"
+    )
+
+    def __init__(self, priority: int, seq: int, fn, cancellable: bool, batch=None) -> None:
+        self.priority = priority
+        self.seq = seq
+        self.fn = fn
+        self.batch_fn, self.batch_item = batch if batch is not None else (None, None)
+        self.future: Future = Future()
+        self.token = CancelToken()
+        self.cancellable = cancellable
+        self.submitted = time.monotonic()
+
+    def __lt__(self, other: "_Job") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class ASRScheduler:
+    """Single-worker priority queue for ASR decodes.
+
+    ``submit(fn, priority=...)`` returns a Future; ``fn`` is called with the
+    job's :class:`CancelToken`. A job cancelled while queued resolves as a
+    cancelled Future; one cancelled while running resolves with
+    :class:`TranscriptionCancelled`.
+
+    ``batch=(runner, item)`` makes a job batchable: when it starts, up to
+    ``max_batch - 1`` following queued jobs of the same rank and runner are
+    taken along and ``runner(items, token)`` must return one result per item.
+    """
+
+    def __init__(self, name: str = "yakutan-local-asr", window: int = 200, max_batch: int = 4) -> None:
+        self._name = name
+        self.max_batch = max(1, int(max_batch))
+        self._heap: list[_Job] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._running_job: _Job | None = None
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self._waits = {priority: deque(maxlen=window) for priority in PRIORITY_NAMES}
+        self.completed = 0
+        self.preempted = 0
+        self.superseded = 0
+        self.batches = 0
+        self.batched_jobs = 0
+
+    def submit(
+        self,
+        fn: Callable[[CancelToken], object],
+        *,
+        priority: int,
+        cancellable: bool = False,
+        supersede: bool = False,
+        batch: tuple[Callable[[list, CancelToken], list], object] | None = None,
+    ) -> Future:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("ASR scheduler is shut down")
+            dropped = self._drop_queued_locked(priority) if supersede else []
+            job = _Job(priority, next(self._seq), fn, cancellable, batch)
+            heapq.heappush(self._heap, job)
+            running = self._running_job
+            if running is not None and running.cancellable and priority < running.priority:
+                running.token.cancel()
+                self.preempted += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        # Future 的回调在取消处同步执行：放到锁外，回调可以安全地再调度
+        for stale in dropped:
+            stale.future.cancel()
+        return job.future
+
+    def cancel_queued(self, priority: int) -> int:
+        """Drop queued (not yet running) jobs of ``priority``; returns how many."""
+        with self._cond:
+            dropped = self._drop_queued_locked(priority)
+        for job in dropped:
+            job.future.cancel()
+        return len(dropped)
+
+    def _drop_queued_locked(self, priority: int) -> list[_Job]:
+        dropped = [job for job in self._heap if job.priority == priority]
+        if dropped:
+            self._heap = [job for job in self._heap if job.priority != priority]
+            heapq.heapify(self._heap)
+            self.superseded += len(dropped)
+        return dropped
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap and not self._closed:
+                    self._cond.wait()
+                if not self._heap:
+                    return
+                job = heapq.heappop(self._heap)
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                group = [job]
+                if job.batch_fn is not None:
+                    group.extend(self._take_batch_locked(job))
+                if len(group) > 1:
+                    self.batches += 1
+                    self.batched_jobs += len(group)
+                self._running_job = job
+                now = time.monotonic()
+                for member in group:
+                    self._waits[member.priority].append(now - member.submitted)
+            if len(group) == 1:
+                self._run_single(job)
+            else:
+                self._run_batch(group)
+            with self._cond:
+                self._running_job = None
+                self.completed += len(group)
+
+    def _take_batch_locked(self, leader: _Job) -> list[_Job]:
+        taken = []
+        while self._heap and len(taken) + 1 < self.max_batch:
+            head = self._heap[0]
+            if head.priority != leader.priority or head.batch_fn != leader.batch_fn:
+                break
+            heapq.heappop(self._heap)
+            if head.future.set_running_or_notify_cancel():
+                taken.append(head)
+        return taken
+
+    @staticmethod
+    def _run_single(job: _Job) -> None:
+        try:
+            result = job.fn(job.token)
+        except BaseException as exc:
+            job.future.set_exception(exc)
+        else:
+            job.future.set_result(result)
+
+    @staticmethod
+    def _run_batch(group: list[_Job]) -> None:
+        leader = group[0]
+        try:
+            results = list(leader.batch_fn([member.batch_item for member in group], leader.token))
+            if len(results) != len(group):
+                raise RuntimeError(f"batch runner returned {len(results)} results for {len(group)} jobs")
+        except BaseException as exc:
+            for member in group:
+                member.future.set_exception(exc)
+            return
+        # 按提交顺序逐个交付，回调（如最终结果的发出）保持先后
+        for member, result in zip(group, results):
+            member.future.set_result(result)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs; queued jobs still run (pending finals are not lost)."""
+        with self._cond:
+            self._closed = True
+            thread = self._thread
+            self._cond.notify_all()
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def stats(self) -> dict:
+        with self._cond:
+            waits = {priority: list(values) for priority, values in self._waits.items()}
+            result = {
+                "queued": len(self._heap),
+                "running": PRIORITY_NAMES.get(self._running_job.priority) if self._running_job else None,
+                "completed": self.completed,
+                "preempted": self.preempted,
+                "superseded": self.superseded,
+                "batches": self.batches,
+                "batched_jobs": self.batched_jobs,
+            }
+        queue_wait = {}
+        for priority, values in waits.items():
+            ms = np.asarray(values, dtype=np.float64) * 1000.0
+            queue_wait[PRIORITY_NAMES[priority]] = {
+                "count": int(ms.size),
+                "mean_ms": round(float(ms.mean()), 1) if ms.size else 0.0,
+                "p95_ms": round(float(np.percentile(ms, 95)), 1) if ms.size else 0.0,
+                "max_ms": round(float(ms.max()), 1) if ms.size else 0.0,
+            }
+        result["queue_wait"] = queue_wait
+        return result
@@ -5,9 +5,11 @@ import re
 from pathlib import Path
 
 import numpy as np
+import onnxruntime as ort
 
+from .asr_scheduler import CancelToken, TranscriptionCancelled
 from .model_manager import SENSEVOICE_ENCODER_ONNX, get_local_model_path
-from .vendor.sensevoice_onnx import SenseVoiceInferenceSession, WavFrontend
+from .vendor.sensevoice_onnx import SenseVoiceInferenceSession, StreamingFeatures, WavFrontend
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +46,9 @@ class SenseVoiceEngine:
                 raise FileNotFoundError(f"SenseVoice ONNX 资源缺失: {path}")
 
         self._frontend = WavFrontend(str(mvn))
+        # 中间结果每次送入整段增长中的缓冲：只为新增音频计算特征
+        self._features = StreamingFeatures(self._frontend)
+        self._batch_supported = True
         self._session: SenseVoiceInferenceSession | None = None
         self._load_session()
         logger.info("SenseVoice ONNX (INT8) loaded: %s", self._model_dir)
@@ -67,24 +72,111 @@ class SenseVoiceEngine:
         _ = device
         return True
 
+    def reset_session(self) -> None:
+        """Drop per-session state; the model stays loaded (engine pool)."""
+        self.language = None
+        if self._features is not None:
+            self._features.reset()
+
     def unload(self) -> None:
         self._session = None
         self._frontend = None
+        self._features = None
 
-    def transcribe(self, audio: np.ndarray) -> dict | None:
-        if self._session is None or self._frontend is None:
-            return None
+    @staticmethod
+    def _waveform(audio: np.ndarray) -> np.ndarray:
         waveform = np.asarray(audio, dtype=np.float32)
         if waveform.ndim > 1:
             waveform = waveform.mean(axis=1)
+        return waveform
+
+    def _language_id(self) -> int:
+        return _LANG_IDS.get((self.language or "auto").lower(), 0)
+
+    def _run(self, fn, cancel: CancelToken | None):
+        """Run one encoder call; a cancelled token terminates it early and raises TranscriptionCancelled."""
+        run_options = None
+        if cancel is not None:
+            cancel.check()
+            # 取消时让正在进行的 ORT 推理提前返回，而不是等它跑完
+            run_options = ort.RunOptions()
+            cancel.on_cancel(lambda: setattr(run_options, "terminate", True))
+        try:
+            result = fn(run_options)
+        except RuntimeError:
+            if cancel is not None and cancel.cancelled:
+                raise TranscriptionCancelled() from None
+            raise
+        if cancel is not None:
+            cancel.check()
+        return result
+
+    def transcribe(
+        self, audio: np.ndarray, *, cancel: CancelToken | None = None, incremental: bool = False
+    ) -> dict | None:
+        """Transcribe one segment.
+
+        ``incremental=True`` marks an interim pass over a still-growing
+        utterance: feature frames of the shared prefix are kept for the next
+        call. A final pass reuses them too, then drops the per-utterance state.
+        """
+        if self._session is None or self._frontend is None:
+            return None
+        waveform = self._waveform(audio)
         if waveform.size == 0:
             return None
 
-        feats = self._frontend.get_features(waveform)
-        lang_key = (self.language or "auto").lower()
-        lang_id = _LANG_IDS.get(lang_key, 0)
+        feats = self._features.features(waveform)
+        if not incremental:
+            self._features.reset()
+        lang_id = self._language_id()
+        raw_text = self._run(
+            lambda run_options: self._session(feats[None, ...], language=lang_id, use_itn=True, run_options=run_options),
+            cancel,
+        )
+        return self._parse(raw_text)
 
-        raw_text = self._session(feats[None, ...], language=lang_id, use_itn=True)
+    def transcribe_batch(self, audios, *, cancel: CancelToken | None = None) -> list[dict | None]:
+        """Transcribe several final segments with one padded encoder call; results keep input order."""
+        results: list[dict | None] = [None] * len(audios)
+        if self._session is None or self._frontend is None:
+            return results
+        rows, feats = [], []
+        for index, audio in enumerate(audios):
+            waveform = self._waveform(audio)
+            if waveform.size:
+                rows.append(index)
+                feats.append(self._frontend.get_features(waveform))
+        if not feats:
+            return results
+        self._features.reset()
+        lang_id = self._language_id()
+        if self._batch_supported and len(feats) > 1:
+            try:
+                raw_texts = self._run(
+                    lambda run_options: self._session.batch(feats, language=lang_id, use_itn=True, run_options=run_options),
+                    cancel,
+                )
+            except RuntimeError:
+                # 个别导出的编码器不支持 batch > 1：退回逐段推理
+                logger.warning("SenseVoice batched inference failed; falling back to one segment per call", exc_info=True)
+                self._batch_supported = False
+            else:
+                for index, raw_text in zip(rows, raw_texts):
+                    results[index] = self._parse(raw_text)
+                return results
+        for index, feat in zip(rows, feats):
+            raw_text = self._run(
+                lambda run_options, _feat=feat: self._session(
+                    _feat[None, ...], language=lang_id, use_itn=True, run_options=run_options
+                ),
+                cancel,
+            )
+            results[index] = self._parse(raw_text)
+        return results
+
+    @staticmethod
+    def _parse(raw_text) -> dict | None:
         if not raw_text or not str(raw_text).strip():
             return None
 
@@ -0,0 +1,319 @@
+"""Run a local ASR engine in a child process.
+
+In-process engines share the GIL with the capture loop, the Flask UI and the
+translation executors; their Python-side work (fbank, token loop, text
+decoding) shows up as capture jitter. :class:`ASRWorkerProcess` hosts the
+engine in a spawned child instead:
+
+- audio is written into a shared-memory block (header + float32 samples), so
+  only a small command tuple crosses the pipe;
+- results come back over the pipe;
+- cancellation (from :class:`~local_asr.asr_scheduler.CancelToken`) sets a
+  flag byte in the shared block that a watcher thread in the child turns into
+  a local token, so preempted partials stop inside the child as well;
+- the child keeps the model loaded across recognizer sessions:
+  :meth:`ASRWorkerProcess.reset_session` only resets per-session state, and
+  :mod:`local_asr.engine_pool` hands the same live process to the next
+  ``start()``; :meth:`ASRWorkerProcess.unload` stops the child.
+
+The proxy mirrors the engine interface (``transcribe`` / ``set_language`` /
+``set_corpus_text`` / ``commit_context`` / ``reset_session`` / ``unload``), so
+``LocalSpeechRecognizer`` uses it unchanged.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+import threading
+from typing import Any
+
+import numpy as np
+
+from .asr_scheduler import CancelToken, TranscriptionCancelled
+
+logger = logging.getLogger(__name__)
+
+ENGINE_FACTORIES = {
+    "sensevoice": "local_asr.asr_sensevoice:SenseVoiceEngine",
+    "qwen3-asr": "local_asr.asr_qwen3:Qwen3ASREngine",
+}
+
+WORKER_SAMPLE_RATE = 16000
+# 共享内存头部：第 0 字节为取消标志，其余保留
+_HEADER_BYTES = 8
+# 共享内存可容纳的音频时长；更长的音频随命令经管道传递
+DEFAULT_CAPACITY_SECONDS = 40.0
+_CANCEL_POLL_SECONDS = 0.005
+DEFAULT_START_TIMEOUT = 300.0
+
+
+def _resolve_factory(spec: str):
+    module_name, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _watch_cancel(flag: np.ndarray, token: CancelToken, done: threading.Event) -> None:
+    while not done.wait(_CANCEL_POLL_SECONDS):
+        if flag[0]:
+            token.cancel()
+            return
+
+
+def _config_snapshot() -> dict:
+    """Runtime LOCAL_* settings (the UI may have changed them) to replay in the child."""
+    import config
+
+    return {
+        name: value
+        for name, value in vars(config).items()
+        if name.startswith("LOCAL_") and isinstance(value, (bool, int, float, str, type(None)))
+    }
+
+
+def _worker_main(
+    conn, factory: str, kwargs: dict, overrides: dict, shm_name: str, capacity: int
+) -> None:
+    """Child entry point: load the engine, then serve commands until stop/EOF."""
+    import config
+
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    shm = SharedMemory(name=shm_name)
+    flag = np.ndarray((1,), dtype=np.uint8, buffer=shm.buf)
+    samples = np.ndarray((capacity,), dtype=np.float32, buffer=shm.buf, offset=_HEADER_BYTES)
+    try:
+        try:
+            engine = _resolve_factory(factory)(**kwargs)
+        except Exception as exc:
+            conn.send(("error", f"{type(exc).__name__}: {exc}"))
+            return
+        code = getattr(engine.transcribe, "__code__", None)
+        supported = set(code.co_varnames) if code is not None else set()
+        conn.send(("ready", sorted(supported & {"update_context", "cancel", "incremental"})))
+
+        while True:
+            try:
+                command, payload = conn.recv()
+            except (EOFError, OSError):
+                break
+            if command == "stop":
+                break
+            if command == "call":
+                name, args = payload
+                method = getattr(engine, name, None)
+                if method is not None:
+                    try:
+                        method(*args)
+                    except Exception:
+                        logger.exception("ASR worker call %s failed", name)
+                continue
+            if command != "transcribe":
+                continue
+
+            size, inline, options = payload
+            audio = inline if inline is not None else samples[:size].copy()
+            call_kwargs = {}
+            if "update_context" in supported:
+                call_kwargs["update_context"] = options.get("update_context", True)
+            if "incremental" in supported:
+                call_kwargs["incremental"] = options.get("incremental", False)
+            done = None
+            if options.get("cancellable") and "cancel" in supported:
+                token = CancelToken()
+                done = threading.Event()
+                threading.Thread(target=_watch_cancel, args=(flag, token, done), daemon=True).start()
+                call_kwargs["cancel"] = token
+            try:
+                reply = ("ok", engine.transcribe(audio, **call_kwargs))
+            except TranscriptionCancelled:
+                reply = ("cancelled", None)
+            except Exception as exc:
+                reply = ("error", f"{type(exc).__name__}: {exc}")
+            finally:
+                if done is not None:
+                    done.set()
+            conn.send(reply)
+
+        if hasattr(engine, "unload"):
+            engine.unload()
+    finally:
+        del flag, samples
+        shm.close()
+        conn.close()
+
+
+class ASRWorkerProcess:
+    """Engine proxy backed by a spawned child process.
+
+    Parameters
+    ----------
+    engine_name : str
+        Key of :data:`ENGINE_FACTORIES`; also used for the process name.
+    factory : str | None
+        ``"module:callable"`` building the engine in the child; defaults to
+        the factory registered for ``engine_name``.
+    kwargs : dict | None
+        Keyword arguments for the factory (must be picklable).
+    capacity_seconds : float
+        Audio capacity of the shared-memory block.
+    """
+
+    def __init__(
+        self,
+        engine_name: str,
+        *,
+        factory: str | None = None,
+        kwargs: dict | None = None,
+        capacity_seconds: float = DEFAULT_CAPACITY_SECONDS,
+        start_timeout: float = DEFAULT_START_TIMEOUT,
+    ) -> None:
+        factory = factory or ENGINE_FACTORIES.get(engine_name)
+        if factory is None:
+            raise RuntimeError(f"未知的本地识别引擎: {engine_name}")
+        self.engine_name = engine_name
+        self.capacity = int(capacity_seconds * WORKER_SAMPLE_RATE)
+        self.language: str | None = None
+        self._corpus_text: Any = None
+        # _lock 串行化转写（一次一个请求），_send_lock 只保护管道写入：
+        # 转写等待结果期间，commit_context 等单向命令仍可立即发出
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._shm = SharedMemory(create=True, size=_HEADER_BYTES + self.capacity * 4)
+        self._flag = np.ndarray((1,), dtype=np.uint8, buffer=self._shm.buf)
+        self._samples = np.ndarray((self.capacity,), dtype=np.float32, buffer=self._shm.buf, offset=_HEADER_BYTES)
+        self._flag[0] = 0
+
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, factory, dict(kwargs or {}), _config_snapshot(), self._shm.name, self.capacity),
+            name=f"yakutan-asr-{engine_name}",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        try:
+            if not self._conn.poll(start_timeout):
+                raise RuntimeError(f"本地识别进程启动超时（{start_timeout:.0f}s）")
+            status, detail = self._conn.recv()
+        except (EOFError, OSError) as exc:
+            self.shutdown()
+            raise RuntimeError("本地识别进程启动失败：子进程已退出") from exc
+        except RuntimeError:
+            self.shutdown()
+            raise
+        if status != "ready":
+            self.shutdown()
+            raise RuntimeError(f"本地识别进程启动失败: {detail}")
+        self._supported = frozenset(detail)
+        logger.info("Local ASR worker process started: %s (pid=%s)", engine_name, self._process.pid)
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid if self._process is not None else None
+
+    def _send(self, message) -> None:
+        with self._send_lock:
+            self._conn.send(message)
+
+    def _call(self, name: str, *args) -> None:
+        if not self.alive:
+            return
+        try:
+            self._send(("call", (name, args)))
+        except (OSError, ValueError):
+            pass
+
+    def _raise_cancel_flag(self) -> None:
+        self._flag[0] = 1
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        *,
+        update_context: bool = True,
+        cancel: CancelToken | None = None,
+        incremental: bool = False,
+    ) -> dict | None:
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        options = {"update_context": update_context, "cancellable": cancel is not None, "incremental": incremental}
+        with self._lock:
+            if not self.alive:
+                raise RuntimeError("本地识别进程已退出")
+            self._flag[0] = 0
+            if audio.size <= self.capacity:
+                self._samples[: audio.size] = audio
+                payload = (audio.size, None, options)
+            else:
+                payload = (audio.size, audio, options)
+            if cancel is not None:
+                cancel.on_cancel(self._raise_cancel_flag)
+            try:
+                self._send(("transcribe", payload))
+                status, detail = self._conn.recv()
+            except (EOFError, OSError) as exc:
+                raise RuntimeError("本地识别进程已退出") from exc
+        if status == "cancelled":
+            raise TranscriptionCancelled()
+        if status == "error":
+            raise RuntimeError(f"本地识别进程出错: {detail}")
+        return detail
+
+    def set_language(self, language: str) -> None:
+        self.language = language if language != "auto" else None
+        self._call("set_language", language)
+
+    def set_corpus_text(self, text) -> None:
+        # 识别器每次转写前都会调用：只在变化时转发
+        if text == self._corpus_text:
+            return
+        self._corpus_text = text
+        self._call("set_corpus_text", text)
+
+    def commit_context(self, text: str) -> None:
+        self._call("commit_context", text)
+
+    def to_device(self, device: str) -> bool:
+        _ = device
+        return False
+
+    def reset_session(self) -> None:
+        """End a recognizer session; the child keeps the model loaded for the next one."""
+        self._corpus_text = None
+        self._call("reset_session")
+
+    def unload(self) -> None:
+        self.shutdown()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the child process and release the shared-memory block."""
+        process = self._process
+        if process is not None:
+            try:
+                if process.is_alive():
+                    self._send(("stop", None))
+            except (OSError, ValueError):
+                pass
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join(1.0)
+            self._process = None
+        try:
+            self._conn.close()
+        except OSError:
+            pass
+        if self._shm is not None:
+            del self._flag, self._samples
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
@@ -0,0 +1,289 @@
+"""Process-level pool of loaded local ASR engines.
+
+``LocalSpeechRecognizer.stop()`` used to unload its engine, so every
+mute-driven stop or UI restart reloaded SenseVoice / the Qwen3 GGUF model,
+their ORT sessions and embedding tables from disk. The pool keeps released
+engines warm instead:
+
+- :meth:`EnginePool.acquire` hands out an idle engine loaded under the same
+  key (engine name + load-time settings) or builds a new one;
+- :meth:`EnginePool.release` resets per-session state (``reset_session``) and
+  parks the engine;
+- idle engines are unloaded after ``LOCAL_ASR_POOL_IDLE_SECONDS`` or, least
+  recently used first, when the pool's estimated footprint exceeds
+  ``LOCAL_ASR_POOL_MEMORY_MB``. Engines in use are never evicted, and the
+  engine just released stays even if it alone exceeds the budget (a warning
+  names the budget to raise).
+
+Worker-process proxies (:class:`~local_asr.asr_worker_process.ASRWorkerProcess`)
+are pooled the same way; evicting one stops its child process. Engines that
+report ``alive`` as False (a crashed child) are evicted instead of reused.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from typing import Callable
+
+import config
+
+logger = logging.getLogger(__name__)
+
+EVICT_IDLE = "idle"
+EVICT_MEMORY = "memory"
+EVICT_SHUTDOWN = "shutdown"
+EVICT_DEAD = "dead"
+
+
+class _Entry:
+    __slots__ = ("key", "engine_name", "engine", "size_bytes", "in_use", "last_used", "load_ms")
+
+    def __init__(self, key: tuple, engine_name: str, engine, size_bytes: int, load_ms: float) -> None:
+        self.key = key
+        self.engine_name = engine_name
+        self.engine = engine
+        self.size_bytes = int(size_bytes)
+        self.in_use = True
+        self.last_used = time.monotonic()
+        self.load_ms = load_ms
+
+
+class EnginePool:
+    """Keeps released engines loaded for the next recognizer session.
+
+    ``idle_seconds`` / ``memory_budget_mb`` default to the current config
+    values (read on every check, so UI changes apply without a restart);
+    ``idle_seconds=0`` unloads on release, as before the pool existed.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_seconds: float | None = None,
+        memory_budget_mb: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._idle_seconds = idle_seconds
+        self._memory_budget_mb = memory_budget_mb
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: list[_Entry] = []
+        self._timer: threading.Timer | None = None
+        self._metrics: dict[str, dict] = {}
+        self._budget_warned: set[tuple] = set()
+
+    @property
+    def idle_seconds(self) -> float:
+        if self._idle_seconds is not None:
+            return float(self._idle_seconds)
+        return float(getattr(config, "LOCAL_ASR_POOL_IDLE_SECONDS", 600))
+
+    @property
+    def memory_budget_bytes(self) -> int:
+        mb = self._memory_budget_mb
+        if mb is None:
+            mb = getattr(config, "LOCAL_ASR_POOL_MEMORY_MB", 2048)
+        return int(float(mb) * 1024 * 1024)
+
+    def _metrics_for(self, engine_name: str) -> dict:
+        return self._metrics.setdefault(
+            engine_name,
+            {
+                "loads": 0,
+                "reuses": 0,
+                "last_load_ms": None,
+                "evictions": {EVICT_IDLE: 0, EVICT_MEMORY: 0, EVICT_SHUTDOWN: 0, EVICT_DEAD: 0},
+            },
+        )
+
+    def acquire(self, key: tuple, engine_name: str, factory: Callable[[], object], *, size_bytes: int = 0):
+        """Return a warm engine for ``key`` or load one with ``factory()``."""
+        evicted: list[_Entry] = []
+        with self._lock:
+            evicted += self._expired_locked() + self._dead_locked()
+            for entry in self._entries:
+                if entry.key == key and not entry.in_use:
+                    entry.in_use = True
+                    entry.last_used = self._clock()
+                    self._metrics_for(engine_name)["reuses"] += 1
+                    break
+            else:
+                entry = None
+                # 先腾出预算再加载，避免新旧模型同时驻留
+                evicted += self._over_budget_locked(int(size_bytes))
+        self._unload(evicted)
+        if entry is not None:
+            logger.info("Reusing warm local ASR engine: %s", engine_name)
+            return entry.engine
+
+        started = time.perf_counter()
+        engine = factory()
+        load_ms = round((time.perf_counter() - started) * 1000.0, 1)
+        with self._lock:
+            self._entries.append(_Entry(key, engine_name, engine, size_bytes, load_ms))
+            metrics = self._metrics_for(engine_name)
+            metrics["loads"] += 1
+            metrics["last_load_ms"] = load_ms
+        logger.info("Loaded local ASR engine %s in %.0f ms", engine_name, load_ms)
+        return engine
+
+    def release(self, engine) -> None:
+        """End a session: reset the engine's per-session state and keep it warm."""
+        with self._lock:
+            entry = next((e for e in self._entries if e.engine is engine), None)
+        if entry is None:
+            # 不是从池里取的引擎：照旧直接卸载
+            self._unload_engine(engine)
+            return
+        if hasattr(engine, "reset_session") and not _is_dead(engine):
+            try:
+                engine.reset_session()
+            except Exception:
+                logger.exception("Local ASR engine session reset failed")
+        with self._lock:
+            entry.in_use = False
+            entry.last_used = self._clock()
+            evicted = self._expired_locked() + self._dead_locked()
+            if entry in self._entries:
+                # 刚释放的引擎保留：即使它单独就超出预算，也不能退化成每次停止都卸载
+                evicted += self._over_budget_locked(0, keep=entry)
+                self._warn_over_budget_locked(entry)
+            self._schedule_sweep_locked()
+        self._unload(evicted)
+
+    def sweep(self) -> int:
+        """Unload engines idle for longer than ``idle_seconds``; returns how many."""
+        with self._lock:
+            evicted = self._expired_locked()
+            self._timer = None
+            self._schedule_sweep_locked()
+        self._unload(evicted)
+        return len(evicted)
+
+    def _expired_locked(self) -> list[_Entry]:
+        limit = self.idle_seconds
+        now = self._clock()
+        expired = [e for e in self._entries if not e.in_use and now - e.last_used >= limit]
+        return self._evict_locked(expired, EVICT_IDLE)
+
+    def _dead_locked(self) -> list[_Entry]:
+        dead = [e for e in self._entries if not e.in_use and _is_dead(e.engine)]
+        return self._evict_locked(dead, EVICT_DEAD)
+
+    def _over_budget_locked(self, incoming: int, keep: _Entry | None = None) -> list[_Entry]:
+        budget = self.memory_budget_bytes
+        total = incoming + sum(e.size_bytes for e in self._entries)
+        evicted = []
+        for entry in sorted((e for e in self._entries if not e.in_use and e is not keep), key=lambda e: e.last_used):
+            if total <= budget:
+                break
+            evicted.append(entry)
+            total -= entry.size_bytes
+        return self._evict_locked(evicted, EVICT_MEMORY)
+
+    def _warn_over_budget_locked(self, entry: _Entry) -> None:
+        budget = self.memory_budget_bytes
+        if entry.size_bytes <= budget or entry.key in self._budget_warned:
+            return
+        self._budget_warned.add(entry.key)
+        logger.warning(
+            "Local ASR engine %s (~%.0f MB) exceeds the pool memory budget of %.0f MB "
+            "(LOCAL_ASR_POOL_MEMORY_MB); keeping it warm anyway, raise the budget to keep more engines",
+            entry.engine_name,
+            entry.size_bytes / (1024 * 1024),
+            budget / (1024 * 1024),
+        )
+
+    def _evict_locked(self, entries: list[_Entry], reason: str) -> list[_Entry]:
+        for entry in entries:
+            self._entries.remove(entry)
+            self._metrics_for(entry.engine_name)["evictions"][reason] += 1
+            logger.info("Evicting local ASR engine %s (%s)", entry.engine_name, reason)
+        return entries
+
+    def _schedule_sweep_locked(self) -> None:
+        idle = [e.last_used for e in self._entries if not e.in_use]
+        if not idle or self._timer is not None:
+            return
+        delay = max(0.0, min(idle) + self.idle_seconds - self._clock()) + 0.5
+        self._timer = threading.Timer(delay, self.sweep)
+        self._timer.daemon = True
+        self._timer.start()
+
+    @staticmethod
+    def _unload_engine(engine) -> None:
+        try:
+            engine.unload()
+        except Exception:
+            logger.exception("Local ASR engine unload failed")
+
+    def _unload(self, entries: list[_Entry]) -> None:
+        # 卸载可能较慢（Qwen 释放 llama 上下文、停止子进程）：放在锁外
+        for entry in entries:
+            self._unload_engine(entry.engine)
+
+    def shutdown(self) -> None:
+        """Unload every pooled engine, including ones still marked in use."""
+        with self._lock:
+            evicted = self._evict_locked(list(self._entries), EVICT_SHUTDOWN)
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        self._unload(evicted)
+
+    def stats(self, engine_name: str | None = None) -> dict:
+        """Load/reuse/eviction counters and the pooled engines (optionally for one engine)."""
+        now = self._clock()
+        with self._lock:
+            entries = [e for e in self._entries if engine_name is None or e.engine_name == engine_name]
+            names = [engine_name] if engine_name is not None else sorted(self._metrics)
+            metrics = {}
+            for name in names:
+                m = self._metrics_for(name)
+                metrics[name] = {**m, "evictions": dict(m["evictions"])}
+            return {
+                "idle_seconds": self.idle_seconds,
+                "memory_budget_mb": round(self.memory_budget_bytes / (1024 * 1024)),
+                "resident_mb": round(sum(e.size_bytes for e in entries) / (1024 * 1024), 1),
+                "engines": [
+                    {
+                        "engine": e.engine_name,
+                        "in_use": e.in_use,
+                        "idle_s": 0.0 if e.in_use else round(now - e.last_used, 1),
+                        "size_mb": round(e.size_bytes / (1024 * 1024), 1),
+                        "load_ms": e.load_ms,
+                    }
+                    for e in entries
+                ],
+                "metrics": metrics if engine_name is None else metrics[engine_name],
+            }
+
+
+def _is_dead(engine) -> bool:
+    # 只有显式报告 alive=False 的引擎（子进程已退出的 ASRWorkerProcess）才算失效
+    return getattr(engine, "alive", True) is False
+
+
+_pool: EnginePool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_engine_pool() -> EnginePool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = EnginePool()
+        return _pool
+
+
+def shutdown_engine_pool() -> None:
+    with _pool_lock:
+        pool = _pool
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_engine_pool)
@@ -535,7 +535,29 @@ def prepare_engine(engine: str) -> None:
         download_asr(engine)
 
 
+# 每个引擎最近一次开始识别的冷启动耗时（毫秒）：engine_ready_ms 为点击开始到引擎可用，
+# first_result_ms 为点击开始到第一条识别结果
+_ENGINE_STARTUP: dict[str, dict] = {}
+
+
+def record_engine_startup(engine: str, **timings) -> None:
+    _ENGINE_STARTUP.setdefault(engine, {}).update(timings)
+
+
+def estimate_engine_memory_bytes(engine: str) -> int:
+    """加载后常驻内存的粗略估计：本地权重文件大小之和（未下载时用预估下载大小）。"""
+    local = get_local_model_path(engine)
+    if local:
+        total = sum(path.stat().st_size for path in Path(local).rglob("*") if path.is_file())
+        if total:
+            return total
+    return _MODEL_SIZE_BYTES.get(engine, 0)
+
+
 def get_engine_status(engine: str) -> dict:
+    from .engine_pool import get_engine_pool
+    from .ort_cache import cache_stats
+
     return {
         "engine": engine,
         "display_name": LOCAL_ASR_DISPLAY_NAMES.get(engine, engine),
@@ -544,5 +566,8 @@ def get_engine_status(engine: str) -> dict:
         "model_cached": bool(get_local_model_path(engine)) if engine != "qwen3-asr" else is_qwen3_asr_ready(),
         "ready": is_asr_cached(engine),
         "missing": get_missing_models(engine),
+        "startup": dict(_ENGINE_STARTUP.get(engine, {})),
+        "graph_cache": cache_stats(),
+        "pool": get_engine_pool().stats(engine),
     }
 
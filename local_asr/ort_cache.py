@@ -0,0 +1,225 @@
+"""Cache ONNX Runtime's optimized graphs between starts.
+
+Building an ``InferenceSession`` re-runs graph optimization (constant folding,
+fusions, layout transforms) every time a local engine or Silero is created.
+:func:`create_session` serializes the optimized graph on first use through
+``SessionOptions.optimized_model_filepath`` into ``<models dir>/ort_optimized``
+and later loads that file with optimization disabled.
+
+Cache entries are keyed by the model file's SHA-256, the ORT version, the
+optimization level and the machine (``ORT_ENABLE_ALL`` output can contain
+CPU-specific layouts), so a model update or an ORT upgrade never reuses a
+stale graph. Only CPU-only sessions are cached; GPU providers build as before.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import config
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = "ort_optimized"
+_HASH_INDEX_NAME = "hashes.json"
+_HASH_CHUNK = 1 << 20
+
+_lock = threading.Lock()
+# 缓存目录 -> {模型路径 -> (size, mtime_ns, sha256)}；进程内记忆，每个目录各存一份索引免得每次启动重算大文件
+_hashes: dict[str, dict[str, tuple[int, int, str]]] = {}
+_loads: dict[str, dict] = {}
+_counters = {"hits": 0, "misses": 0, "uncached": 0, "errors": 0}
+
+
+def cache_dir() -> Path:
+    from .model_manager import MODELS_DIR
+
+    return MODELS_DIR / CACHE_DIR_NAME
+
+
+def _hash_index(directory: Path) -> dict[str, tuple[int, int, str]]:
+    """The in-memory hash index of ``directory``, loaded from disk on first use."""
+    key = str(directory.resolve())
+    index = _hashes.get(key)
+    if index is not None:
+        return index
+    index = _hashes[key] = {}
+    try:
+        data = json.loads((directory / _HASH_INDEX_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return index
+    for path, (size, mtime_ns, digest) in data.items():
+        index[path] = (int(size), int(mtime_ns), str(digest))
+    return index
+
+
+def _temp_path(target: Path) -> Path:
+    # 每次调用唯一（跨进程、跨线程），改名前不会被别的写入者覆盖
+    fd, name = tempfile.mkstemp(prefix=f"{target.name}.", suffix=".tmp", dir=target.parent)
+    os.close(fd)
+    return Path(name)
+
+
+def _save_hash_index(directory: Path, index: dict[str, tuple[int, int, str]]) -> None:
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        target = directory / _HASH_INDEX_NAME
+        tmp = _temp_path(target)
+        tmp.write_text(json.dumps({k: list(v) for k, v in index.items()}), encoding="utf-8")
+        os.replace(tmp, target)
+    except OSError:
+        logger.debug("Could not write ORT cache hash index", exc_info=True)
+
+
+def model_hash(model_path: str | Path, directory: Path | None = None) -> str:
+    """SHA-256 of a model file, memoised by (size, mtime)."""
+    path = Path(model_path).resolve()
+    stat = path.stat()
+    directory = directory or cache_dir()
+    with _lock:
+        known = _hash_index(directory).get(str(path))
+        if known is not None and known[:2] == (stat.st_size, stat.st_mtime_ns):
+            return known[2]
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(_HASH_CHUNK), b""):
+            digest.update(block)
+    value = digest.hexdigest()
+    with _lock:
+        index = _hash_index(directory)
+        index[str(path)] = (stat.st_size, stat.st_mtime_ns, value)
+        _save_hash_index(directory, index)
+    return value
+
+
+def cache_path(model_path: str | Path, sess_options, directory: Path | None = None) -> Path:
+    import onnxruntime as ort
+
+    directory = directory or cache_dir()
+    key = hashlib.sha256(
+        "|".join(
+            (
+                model_hash(model_path, directory),
+                ort.__version__,
+                str(int(sess_options.graph_optimization_level)),
+                platform.machine(),
+                platform.processor(),
+            )
+        ).encode("utf-8")
+    ).hexdigest()[:20]
+    return directory / f"{Path(model_path).stem}.{key}.onnx"
+
+
+def _cpu_only(providers) -> bool:
+    names = [p[0] if isinstance(p, (tuple, list)) else p for p in (providers or ["CPUExecutionProvider"])]
+    return all(name == "CPUExecutionProvider" for name in names)
+
+
+def _record(model_path, cache: str, started: float) -> None:
+    with _lock:
+        _loads[Path(model_path).name] = {
+            "cache": cache,
+            "load_ms": round((time.perf_counter() - started) * 1000.0, 1),
+        }
+        if cache == "hit":
+            _counters["hits"] += 1
+        elif cache == "miss":
+            _counters["misses"] += 1
+        else:
+            _counters["uncached"] += 1
+
+
+def create_session(model_path: str | Path, sess_options=None, providers=None, *, directory: Path | None = None):
+    """``ort.InferenceSession`` that reuses (or writes) the cached optimized graph.
+
+    ``sess_options`` is handed back unchanged, so one options object can be
+    shared by several models.
+    """
+    import onnxruntime as ort
+
+    started = time.perf_counter()
+    model_path = str(model_path)
+    if sess_options is None:
+        sess_options = ort.SessionOptions()
+    if not getattr(config, "LOCAL_ASR_ORT_GRAPH_CACHE", True) or not _cpu_only(providers):
+        session = ort.InferenceSession(model_path, sess_options=sess_options, providers=providers)
+        _record(model_path, "off", started)
+        return session
+
+    # 调用方可能把同一个 SessionOptions 传给多个模型（如 Qwen 编码器前后端）：
+    # 改动的两个字段必须还原，否则下一个模型的缓存键和输出路径都会错
+    level = sess_options.graph_optimization_level
+    filepath = sess_options.optimized_model_filepath
+    try:
+        return _create_cached(model_path, sess_options, providers, directory, started)
+    finally:
+        sess_options.graph_optimization_level = level
+        sess_options.optimized_model_filepath = filepath
+
+
+def _create_cached(model_path: str, sess_options, providers, directory: Path | None, started: float):
+    import onnxruntime as ort
+
+    try:
+        target = cache_path(model_path, sess_options, directory)
+    except OSError:
+        logger.debug("ORT graph cache unavailable for %s", model_path, exc_info=True)
+        target = None
+    if target is not None and target.is_file():
+        # 已是优化后的图：关闭图优化直接加载，省掉整段优化耗时
+        level = sess_options.graph_optimization_level
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+        try:
+            session = ort.InferenceSession(str(target), sess_options=sess_options, providers=providers)
+        except Exception:
+            logger.warning("Cached optimized graph %s failed to load; rebuilding", target.name, exc_info=True)
+            with _lock:
+                _counters["errors"] += 1
+            try:
+                target.unlink()
+            except OSError:
+                pass
+            sess_options.graph_optimization_level = level
+        else:
+            _record(model_path, "hit", started)
+            return session
+
+    if target is not None:
+        # 先写临时文件再改名：并发启动或中途退出都不会留下半个图
+        tmp = None
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = _temp_path(target)
+            sess_options.optimized_model_filepath = str(tmp)
+            session = ort.InferenceSession(model_path, sess_options=sess_options, providers=providers)
+            os.replace(tmp, target)
+        except Exception:
+            logger.warning("Could not serialize optimized graph for %s", model_path, exc_info=True)
+            with _lock:
+                _counters["errors"] += 1
+            sess_options.optimized_model_filepath = ""
+            if tmp is not None:
+                try:
+                    tmp.unlink()
+                except OSError:
+                    pass
+        else:
+            _record(model_path, "miss", started)
+            return session
+    session = ort.InferenceSession(model_path, sess_options=sess_options, providers=providers)
+    _record(model_path, "off", started)
+    return session
+
+
+def cache_stats() -> dict:
+    """Hit/miss counters and the last session load per model file."""
+    with _lock:
+        return {**_counters, "models": {name: dict(entry) for name, entry in _loads.items()}}
@@ -5,72 +5,270 @@ import logging
 import math
 import numpy as np
 
+import config
 from .model_manager import apply_cache_env, silero_onnx_path
+from .ort_cache import create_session
 
 logger = logging.getLogger(__name__)
 
+# Adaptive end-of-speech: hangover = clamp(p90 of the session's recent
+# in-utterance pauses * factor + margin, floor, silence_duration); a pause in
+# which confidence keeps hovering near the threshold (after the decay chunks
+# that follow every word) reads as hesitation -- trailing vowel, breath,
+# filler -- and extends the hangover to silence_duration * max scale.
+# These are untuned starting values: on the synthetic hesitation set
+# (benchmarks/bench_vad_endpointing.py --adaptive --hesitation 0.08) they cut
+# the offset p50 by 120-170 ms but raise false splits from ~1-2% to ~7%, which is
+# why adaptive_endpoint stays off by default.
+_ADAPTIVE_MIN_SILENCE = 0.35
+_ADAPTIVE_MAX_SCALE = 1.5
+_ADAPTIVE_PAUSE_QUANTILE = 90
+_ADAPTIVE_PAUSE_FACTOR = 1.25
+_ADAPTIVE_PAUSE_MARGIN = 0.1
+_ADAPTIVE_MIN_PAUSES = 3
+_ADAPTIVE_PAUSE_HISTORY = 48
+_ADAPTIVE_HESITATION_RATIO = 0.8
+_ADAPTIVE_DECAY_CHUNKS = 3
+
 
 class _SileroOnnxVAD:
-    """Silero VAD via `silero_vad_16k_op15.onnx` (no PyTorch)."""
+    """Silero VAD via `silero_vad_16k_op15.onnx` (no PyTorch).
+
+    Input (context + window), state, ``sr`` and output tensors are allocated
+    once and bound through ORT IOBinding; each call copies the new window into
+    the bound input in place and runs without building feeds or allocating
+    results. Falls back to ``session.run`` on the same buffers when IOBinding
+    is disabled or unavailable.
+    """
 
-    def __init__(self, model_path: str) -> None:
+    def __init__(self, model_path: str, use_io_binding: bool = True) -> None:
         import onnxruntime as ort
 
+        self._ort = ort
         opts = ort.SessionOptions()
         opts.inter_op_num_threads = 1
         opts.intra_op_num_threads = 1
-        self._session = ort.InferenceSession(
-            model_path,
-            providers=["CPUExecutionProvider"],
-            sess_options=opts,
-        )
+        self._session = create_session(model_path, opts, ["CPUExecutionProvider"])
+        self._use_io_binding = bool(use_io_binding)
+        self._binding = None
+        self._bound_values: list = []
+        self._sample_rate = 0
+        self._allocate(16000)
+
+    @property
+    def uses_io_binding(self) -> bool:
+        return self._binding is not None
+
+    def _allocate(self, sample_rate: int) -> None:
+        self._num_samples = 512 if sample_rate == 16000 else 256
+        self._context_size = 64 if sample_rate == 16000 else 32
+        self._input = np.zeros((1, self._context_size + self._num_samples), dtype=np.float32)
+        self._window = self._input[0]
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._state_out = np.zeros_like(self._state)
+        self._prob = np.zeros((1, 1), dtype=np.float32)
+        self._sr = np.array(sample_rate, dtype=np.int64)
+        self._sample_rate = sample_rate
+        self._silence_state: np.ndarray | None = None
+        self._binding = None
+        self._bound_values = []
+        if not self._use_io_binding:
+            return
+        try:
+            self._bind()
+        except Exception as exc:
+            logger.debug("Silero IOBinding unavailable, falling back to session.run: %s", exc)
+            self._binding = None
+            self._bound_values = []
+            self._use_io_binding = False
+
+    def _bind(self) -> None:
+        # CPU 上 OrtValue.ortvalue_from_numpy 与 numpy 数组共享内存，原地写入即对模型可见
+        from_numpy = self._ort.OrtValue.ortvalue_from_numpy
+        binding = self._session.io_binding()
+        values = []
+        for name, array in (("input", self._input), ("state", self._state), ("sr", self._sr)):
+            value = from_numpy(array)
+            binding.bind_ortvalue_input(name, value)
+            values.append(value)
+        for name, array in (("output", self._prob), ("stateN", self._state_out)):
+            value = from_numpy(array)
+            binding.bind_ortvalue_output(name, value)
+            values.append(value)
+        self._bound_values = values
+        self._binding = binding
+
+    def reset_states(self) -> None:
+        self._input.fill(0.0)
+        self._state.fill(0.0)
+
+    def _compute_silence_state(self, iterations: int = 64) -> np.ndarray:
+        """LSTM state after ~2 s of digital silence from reset (computed once per sample rate)."""
+        saved_input = self._input.copy()
+        saved_state = self._state.copy()
         self.reset_states()
+        zeros = np.zeros(self._num_samples, dtype=np.float32)
+        for _ in range(iterations):
+            self.probability(zeros, self._sample_rate)
+        silence_state = self._state.copy()
+        np.copyto(self._input, saved_input)
+        np.copyto(self._state, saved_state)
+        return silence_state
+
+    def reset_to_silence_state(self) -> None:
+        """Put the LSTM into its after-silence state, keeping the audio context.
+
+        Used after chunks were skipped without inference. The state Silero would
+        have reached over that silence is much closer to this than to the stale
+        pre-skip state or to all zeros. It still drifts slowly on silence, so this
+        is an approximation; results are insensitive to 0.5-4 s of warm-up.
+        """
+        if self._silence_state is None:
+            self._silence_state = self._compute_silence_state()
+        np.copyto(self._state, self._silence_state)
+
+    def _load_window(self, audio_chunk: np.ndarray, sample_rate: int) -> None:
+        if sample_rate != self._sample_rate:
+            self._allocate(sample_rate)
 
-    def reset_states(self, batch_size: int = 1) -> None:
-        self._state = np.zeros((2, batch_size, 128), dtype=np.float32)
-        self._context: np.ndarray | None = None
-        self._last_sr = 0
-        self._last_batch_size = 0
+        x = np.asarray(audio_chunk, dtype=np.float32)
+        if x.ndim > 1:
+            if x.shape[0] != 1:
+                raise ValueError("Silero ONNX path supports batch size 1 only")
+            x = x[0]
+
+        ctx = self._context_size
+        window = self._window
+        # 上一次输入的尾部作为本次上下文，再就地写入新窗口（不足补零，超出截断）
+        window[:ctx] = window[-ctx:]
+        n = min(len(x), self._num_samples)
+        window[ctx : ctx + n] = x[:n]
+        if n < self._num_samples:
+            window[ctx + n :] = 0.0
+
+    def skip(self, audio_chunk: np.ndarray, sample_rate: int) -> None:
+        """Advance the audio context over a chunk without running the model."""
+        self._load_window(audio_chunk, sample_rate)
 
     def probability(self, audio_chunk: np.ndarray, sample_rate: int) -> float:
-        batch_size = 1
-        num_samples = 512 if sample_rate == 16000 else 256
-        context_size = 64 if sample_rate == 16000 else 32
+        self._load_window(audio_chunk, sample_rate)
 
-        x = np.asarray(audio_chunk, dtype=np.float32)
-        if x.ndim == 1:
-            x = x.reshape(1, -1)
-        if x.shape[0] != batch_size:
-            raise ValueError("Silero ONNX path supports batch size 1 only")
-
-        if x.shape[1] < num_samples:
-            x = np.pad(x, ((0, 0), (0, num_samples - x.shape[1])))
-        elif x.shape[1] > num_samples:
-            x = x[:, :num_samples]
-
-        if self._last_batch_size and self._last_batch_size != batch_size:
-            self.reset_states(batch_size)
-        if self._last_sr and self._last_sr != sample_rate:
-            self.reset_states(batch_size)
-
-        if self._context is None or self._context.shape != (batch_size, context_size):
-            self._context = np.zeros((batch_size, context_size), dtype=np.float32)
-
-        inp = np.concatenate([self._context, x], axis=1)
-        ort_inputs = {
-            "input": inp.astype(np.float32, copy=False),
-            "state": self._state,
-            "sr": np.array(sample_rate, dtype=np.int64),
-        }
-        prob_arr, self._state = self._session.run(None, ort_inputs)
-        self._context = inp[..., -context_size:]
-        self._last_sr = sample_rate
-        self._last_batch_size = batch_size
-        return float(prob_arr.reshape(-1)[0])
+        if self._binding is not None:
+            self._session.run_with_iobinding(self._binding)
+            np.copyto(self._state, self._state_out)
+            return float(self._prob[0, 0])
+
+        prob, state = self._session.run(
+            None,
+            {"input": self._input, "state": self._state, "sr": self._sr},
+        )
+        np.copyto(self._state, state)
+        return float(prob.reshape(-1)[0])
+
+
+class _SpeechAccumulator:
+    """Contiguous float32 speech buffer with a per-chunk confidence array.
+
+    Capacity doubles on overflow, so appends are amortised O(chunk). ``audio()``
+    and ``detach()`` return read-only views instead of copies. A view that has
+    been handed out is never overwritten: after ``detach()`` or ``clear()`` the
+    next append allocates a new buffer instead of reusing the old one.
+    """
+
+    def __init__(self, initial_samples: int, initial_chunks: int) -> None:
+        self._initial_samples = max(1, int(initial_samples))
+        self._initial_chunks = max(1, int(initial_chunks))
+        self._audio: np.ndarray | None = None
+        self._conf: np.ndarray | None = None
+        self.size = 0
+        self.chunks = 0
+
+    def _reserve(self, samples: int, chunks: int) -> None:
+        if self._audio is None:
+            self._audio = np.empty(max(self._initial_samples, samples), dtype=np.float32)
+            self._conf = np.empty(max(self._initial_chunks, chunks), dtype=np.float32)
+            return
+        if samples > len(self._audio):
+            grown = np.empty(max(samples, 2 * len(self._audio)), dtype=np.float32)
+            grown[: self.size] = self._audio[: self.size]
+            self._audio = grown
+        if chunks > len(self._conf):
+            grown = np.empty(max(chunks, 2 * len(self._conf)), dtype=np.float32)
+            grown[: self.chunks] = self._conf[: self.chunks]
+            self._conf = grown
+
+    def append(self, chunk: np.ndarray, confidence: float) -> None:
+        n = len(chunk)
+        end = self.size + n
+        self._reserve(end, self.chunks + 1)
+        self._audio[self.size : end] = chunk
+        self._conf[self.chunks] = confidence
+        self.size = end
+        self.chunks += 1
+
+    def audio(self) -> np.ndarray:
+        view = self._audio[: self.size] if self._audio is not None else np.empty(0, dtype=np.float32)
+        view.flags.writeable = False
+        return view
+
+    def confidences(self) -> np.ndarray:
+        view = self._conf[: self.chunks] if self._conf is not None else np.empty(0, dtype=np.float32)
+        view.flags.writeable = False
+        return view
+
+    def detach(self) -> np.ndarray:
+        """Return the accumulated audio as a view and start a fresh buffer."""
+        audio = self.audio()
+        self.clear()
+        return audio
+
+    def split(self, cut: int, keep_from: int) -> np.ndarray:
+        """Hand out chunks ``[0, cut)`` as a view and keep ``[keep_from, end)``.
+
+        The kept chunks are copied into a fresh buffer, so the returned view is
+        never overwritten; ``keep_from < cut`` makes the two parts overlap.
+        Assumes equal-length chunks.
+        """
+        step = self.size // self.chunks
+        head = self._audio[: cut * step]
+        head.flags.writeable = False
+        tail_audio = self._audio[keep_from * step : self.size]
+        tail_conf = self._conf[keep_from : self.chunks]
+        self._audio = None
+        self._conf = None
+        self.size = 0
+        self.chunks = 0
+        self._reserve(len(tail_audio), len(tail_conf))
+        self._audio[: len(tail_audio)] = tail_audio
+        self._conf[: len(tail_conf)] = tail_conf
+        self.size = len(tail_audio)
+        self.chunks = len(tail_conf)
+        return head
+
+    def clear(self) -> None:
+        if self.size or self.chunks:
+            self._audio = None
+            self._conf = None
+        self.size = 0
+        self.chunks = 0
 
 
 class VADProcessor:
-    """Voice activity detection with Silero (ONNX), energy, or disabled mode."""
+    """Voice activity detection with Silero (ONNX), cascade, energy, or disabled mode.
+
+    ``cascade`` puts a vectorized RMS / zero-crossing gate in front of Silero:
+    chunks that are clearly silent (below the RMS floor, or low-level
+    low-frequency hum) are scored 0.0 without running the model, while Silero
+    still runs on everything else and on every chunk while speaking. Skipped
+    chunks still advance Silero's audio context; after a skipped stretch the
+    recurrent state is replaced by the state Silero reaches on silence.
+
+    With ``adaptive_endpoint`` the end-of-speech hangover is no longer the
+    fixed ``silence_duration``: it shrinks towards a floor when the speaker's
+    in-utterance pauses are short and the current pause is clean, and grows
+    past ``silence_duration`` while confidence keeps hovering near the
+    threshold (hesitant speech).
+    """
 
     def __init__(
         self,
@@ -90,11 +288,15 @@ class VADProcessor:
         apply_cache_env()
         self._silero: _SileroOnnxVAD | None = None
 
-        self._speech_buffer: list[np.ndarray] = []
-        self._confidence_history: list[float] = []
-        self._speech_samples = 0
+        chunk_samples = max(1, int(round(chunk_duration * sample_rate)))
+        self._speech = _SpeechAccumulator(
+            initial_samples=8 * sample_rate,
+            initial_chunks=max(1, (8 * sample_rate) // chunk_samples),
+        )
         self._is_speaking = False
         self._silence_counter = 0
+        # 当前缓冲是被 split_long_segment 切出的后续部分：交出时不做密度过滤
+        self._continuation = False
 
         self._pre_speech_duration = max(0.0, float(pre_speech_duration))
         self._pre_speech_chunks = 0
@@ -104,6 +306,24 @@ class VADProcessor:
         self._silence_limit = self._seconds_to_chunks(0.8)
         self.last_confidence = 0.0
 
+        self.adaptive_endpoint = False
+        self._pause_history: collections.deque[int] = collections.deque(maxlen=_ADAPTIVE_PAUSE_HISTORY)
+        self._typical_pause = 0.0
+        self._pause_peak = 0.0
+
+        self._cascade_silence_energy = 0.0
+        self._cascade_hum_energy = 0.0
+        self._set_cascade_floor(float(getattr(config, "LOCAL_VAD_CASCADE_SILENCE_DBFS", -50)))
+        self._cascade_hum_zcr = 0.02
+        self._cascade_reset_chunks = self._seconds_to_chunks(0.12)
+        self._cascade_skip_run = 0
+        self.silero_runs = 0
+        self.silero_skips = 0
+
+    @property
+    def _speech_samples(self) -> int:
+        return self._speech.size
+
     def _ensure_silero(self) -> _SileroOnnxVAD:
         if self._silero is not None:
             return self._silero
@@ -112,7 +332,10 @@ class VADProcessor:
             raise FileNotFoundError(
                 f"Silero VAD ONNX 未找到: {path}。请先运行 download_silero() 或 prepare_engine()。"
             )
-        self._silero = _SileroOnnxVAD(str(path))
+        self._silero = _SileroOnnxVAD(
+            str(path),
+            use_io_binding=getattr(config, "LOCAL_VAD_IO_BINDING", True),
+        )
         return self._silero
 
     def _seconds_to_chunks(self, seconds: float) -> int:
@@ -137,6 +360,11 @@ class VADProcessor:
         if old:
             self._pre_buffer.extend(old[-self._pre_speech_chunks :])
 
+    def _set_cascade_floor(self, dbfs: float) -> None:
+        # 均方能量阈值；哼声判定上限比静音底高 12dB
+        self._cascade_silence_energy = 10 ** (dbfs / 10.0)
+        self._cascade_hum_energy = 10 ** ((dbfs + 12.0) / 10.0)
+
     def update_settings(self, settings: dict) -> None:
         if "vad_mode" in settings:
             self.mode = settings["vad_mode"]
@@ -150,13 +378,41 @@ class VADProcessor:
             self._silence_limit = self._seconds_to_chunks(float(settings["silence_duration"]))
         if "pre_speech_duration" in settings:
             self._update_pre_speech_chunks(float(settings["pre_speech_duration"]))
+        if "cascade_silence_dbfs" in settings:
+            self._set_cascade_floor(float(settings["cascade_silence_dbfs"]))
+        if "adaptive_endpoint" in settings:
+            self.adaptive_endpoint = bool(settings["adaptive_endpoint"])
 
     def _silero_confidence(self, audio_chunk: np.ndarray) -> float:
-        window_size = 512 if self.sample_rate == 16000 else 256
-        chunk = audio_chunk[:window_size]
-        if len(chunk) < window_size:
-            chunk = np.pad(chunk, (0, window_size - len(chunk)))
-        return self._ensure_silero().probability(chunk.astype(np.float32, copy=False), self.sample_rate)
+        # 截断/补零由 _SileroOnnxVAD 在其预分配的输入缓冲内完成
+        self.silero_runs += 1
+        return self._ensure_silero().probability(audio_chunk, self.sample_rate)
+
+    def _is_clear_silence(self, audio_chunk: np.ndarray) -> bool:
+        x = np.asarray(audio_chunk, dtype=np.float32)
+        if not len(x):
+            return True
+        energy = float(np.dot(x, x)) / len(x)
+        if energy < self._cascade_silence_energy:
+            return True
+        if energy < self._cascade_hum_energy:
+            # 略高于静音底但几乎没有过零：低频哼声/隆隆声，不含语音频带
+            crossings = np.count_nonzero(np.signbit(x[1:]) != np.signbit(x[:-1]))
+            return crossings < self._cascade_hum_zcr * len(x)
+        return False
+
+    def _cascade_confidence(self, audio_chunk: np.ndarray) -> float:
+        if not self._is_speaking and self._is_clear_silence(audio_chunk):
+            if self._silero is not None:
+                self._silero.skip(audio_chunk, self.sample_rate)
+            self._cascade_skip_run += 1
+            self.silero_skips += 1
+            return 0.0
+        if self._cascade_skip_run >= self._cascade_reset_chunks:
+            # 跳过了一段静音：LSTM 状态已与音频脱节，换成其在静音上运行后的状态
+            self._ensure_silero().reset_to_silence_state()
+        self._cascade_skip_run = 0
+        return self._silero_confidence(audio_chunk)
 
     def _energy_confidence(self, audio_chunk: np.ndarray) -> float:
         rms = float(np.sqrt(np.mean(audio_chunk**2)))
@@ -165,39 +421,49 @@ class VADProcessor:
     def _get_confidence(self, audio_chunk: np.ndarray) -> float:
         if self.mode == "silero":
             return self._silero_confidence(audio_chunk)
+        if self.mode == "cascade":
+            return self._cascade_confidence(audio_chunk)
         if self.mode == "energy":
             return self._energy_confidence(audio_chunk)
         return 1.0
 
-    def process_chunk(self, audio_chunk: np.ndarray) -> np.ndarray | None:
-        confidence = self._get_confidence(audio_chunk)
+    def _effective_threshold(self) -> float:
+        return self.threshold if self.mode in ("silero", "cascade") else 0.5
+
+    def process_chunk(self, audio_chunk: np.ndarray, confidence: float | None = None) -> np.ndarray | None:
+        """Advance the segmenter by one chunk; returns a finished segment or None.
+
+        ``confidence`` lets a caller supply a score computed elsewhere (the shared
+        VAD stream) so the model is not run a second time on the same audio.
+        """
+        if confidence is None:
+            confidence = self._get_confidence(audio_chunk)
         self.last_confidence = confidence
 
-        effective_threshold = self.threshold if self.mode == "silero" else 0.5
+        effective_threshold = self._effective_threshold()
 
         if confidence >= effective_threshold:
             if not self._is_speaking:
                 for pre_chunk in self._pre_buffer:
-                    self._speech_buffer.append(pre_chunk)
-                    self._confidence_history.append(effective_threshold)
-                    self._speech_samples += len(pre_chunk)
+                    self._speech.append(pre_chunk, effective_threshold)
                 self._pre_buffer.clear()
+            elif self._silence_counter:
+                self._record_pause(self._silence_counter)
 
             self._is_speaking = True
             self._silence_counter = 0
-            self._speech_buffer.append(audio_chunk)
-            self._confidence_history.append(confidence)
-            self._speech_samples += len(audio_chunk)
+            self._pause_peak = 0.0
+            self._speech.append(audio_chunk, confidence)
         elif self._is_speaking:
             self._silence_counter += 1
-            self._speech_buffer.append(audio_chunk)
-            self._confidence_history.append(confidence)
-            self._speech_samples += len(audio_chunk)
+            if self._silence_counter > _ADAPTIVE_DECAY_CHUNKS:
+                self._pause_peak = max(self._pause_peak, confidence)
+            self._speech.append(audio_chunk, confidence)
         else:
             if self._pre_speech_chunks > 0:
                 self._pre_buffer.append(audio_chunk)
 
-        if self._is_speaking and self._silence_counter >= self._silence_limit:
+        if self._is_speaking and self._silence_counter >= self.endpoint_silence_chunks():
             if self._speech_samples >= self.min_speech_samples:
                 return self._flush_segment()
             logger.debug(
@@ -216,13 +482,32 @@ class VADProcessor:
         """当前是否正在说话（供外部 gating 逻辑读取）。"""
         return self._is_speaking
 
+    def _record_pause(self, chunks: int) -> None:
+        self._pause_history.append(chunks)
+        if len(self._pause_history) >= _ADAPTIVE_MIN_PAUSES:
+            self._typical_pause = float(np.percentile(self._pause_history, _ADAPTIVE_PAUSE_QUANTILE))
+
+    def endpoint_silence_chunks(self) -> int:
+        """Silence chunks that end the current utterance (fixed unless adaptive)."""
+        base = self._silence_limit
+        if not self.adaptive_endpoint:
+            return base
+        if self._pause_peak >= self._effective_threshold() * _ADAPTIVE_HESITATION_RATIO:
+            return max(base, int(round(base * _ADAPTIVE_MAX_SCALE)))
+        if len(self._pause_history) < _ADAPTIVE_MIN_PAUSES:
+            return base
+        floor = min(base, self._seconds_to_chunks(_ADAPTIVE_MIN_SILENCE))
+        limit = math.ceil(self._typical_pause * _ADAPTIVE_PAUSE_FACTOR) + self._seconds_to_chunks(_ADAPTIVE_PAUSE_MARGIN)
+        return int(min(base, max(floor, limit)))
+
     def _flush_segment(self) -> np.ndarray | None:
-        if not self._speech_buffer:
+        if not self._speech.size:
             return None
-        if len(self._confidence_history) >= 4:
-            effective_threshold = self.threshold if self.mode == "silero" else 0.5
-            voiced = sum(1 for confidence in self._confidence_history if confidence >= effective_threshold)
-            density = voiced / len(self._confidence_history)
+        if self._speech.chunks >= 4 and not self._continuation:
+            effective_threshold = self._effective_threshold()
+            confidences = self._speech.confidences()
+            voiced = int(np.count_nonzero(confidences >= np.float32(effective_threshold)))
+            density = voiced / len(confidences)
             if density < 0.25:
                 logger.debug(
                     "Low speech density %.0f%%, discarding %.1fs",
@@ -231,20 +516,46 @@ class VADProcessor:
                 )
                 self._reset()
                 return None
-        segment = np.concatenate(self._speech_buffer)
+        segment = self._speech.detach()
         self._reset()
         return segment
 
     def _reset(self) -> None:
-        self._speech_buffer = []
-        self._confidence_history = []
-        self._speech_samples = 0
+        self._speech.clear()
         self._is_speaking = False
         self._silence_counter = 0
+        self._pause_peak = 0.0
+        self._continuation = False
+
+    def split_long_segment(self, search_duration: float, overlap_duration: float) -> np.ndarray | None:
+        """Cut a long ongoing utterance at its quietest point and hand out the head.
+
+        The cut is the lowest smoothed-confidence chunk within the last
+        ``search_duration`` of the buffer. The head (up to and including that
+        chunk) is returned; the buffer keeps everything after the cut plus
+        ``overlap_duration`` before it, so the next window overlaps the
+        previous one. Returns None when not speaking or the buffer is too short.
+        """
+        chunks = self._speech.chunks
+        if not self._is_speaking or chunks < 2 or self._speech.size % chunks:
+            return None
+        overlap = self._seconds_to_chunks(overlap_duration) if overlap_duration > 0 else 0
+        lo = max(overlap + 1, chunks - self._seconds_to_chunks(search_duration))
+        if lo >= chunks:
+            return None
+        confidences = self._speech.confidences()
+        smoothed = np.convolve(confidences, np.ones(3, dtype=np.float32) / 3.0, mode="same")
+        cut = lo + int(np.argmin(smoothed[lo:chunks]))
+        head = self._speech.split(cut + 1, max(0, cut + 1 - overlap))
+        self._continuation = True
+        return head
 
     def reset(self) -> None:
         self._reset()
         self.last_confidence = 0.0
+        self._cascade_skip_run = 0
+        self._pause_history.clear()
+        self._typical_pause = 0.0
         if self._silero is not None:
             try:
                 self._silero.reset_states()
@@ -253,15 +564,15 @@ class VADProcessor:
         self._pre_buffer.clear()
 
     def peek_buffer(self) -> tuple[np.ndarray, float] | None:
-        if not self._speech_buffer or not self._is_speaking:
+        """Read-only view of the current utterance (no copy); stays valid after flush."""
+        if not self._speech.size or not self._is_speaking:
             return None
-        audio = np.concatenate(self._speech_buffer)
-        return audio, self._speech_samples / self.sample_rate
+        return self._speech.audio(), self._speech.size / self.sample_rate
 
     def force_flush(self) -> np.ndarray | None:
-        if not self._speech_buffer:
+        if not self._speech.size:
             return None
-        segment = np.concatenate(self._speech_buffer)
+        segment = self._speech.detach()
         self._reset()
         return segment
 
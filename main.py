@@ -48,7 +48,12 @@ from streaming_translation import (
 from streaming_translation.pipeline import (
     _is_primary_config_changed as _is_primary_translator_config_changed,
 )
-from audio_capture import init_audio_stream, close_audio_stream, audio_capture_task
+from audio_capture import (
+    audio_capture_task,
+    close_audio_stream,
+    create_vad_stream,
+    init_audio_stream,
+)
 from recognition_handler import (
     VRChatRecognitionCallback,
     PAUSE_RESUME_BACKENDS,
@@ -158,14 +163,13 @@ async def stop_recognition_async(state):
         pass
 
     # 闭麦时重置本地 VAD 状态与缓存，确保下一次开麦时有干净的历史。
-    if state.vad_processor is not None:
+    if state.vad_stream is not None:
         try:
-            state.vad_processor.reset()
+            state.vad_stream.reset()
         except Exception:
             pass
     state._vad_was_speaking = False
-    import numpy as np
-    state._vad_pending_samples = np.array([], dtype=np.float32)
+    state.vad_pre_roll.clear()
 
     state.bump_audio_send_generation()
 
@@ -344,53 +348,35 @@ async def main(
     # 初始化语言检测器
     state.language_detector = _create_language_detector()
 
-    # ---- 统一 VAD：在线 API 发送门控（本地 ASR 走识别器内部 VAD，此处不处理） ----
-    # 门控仅对在线后端生效：本地 ASR 需要连续音频（含静音）供其内部 VAD 分段。
+    # ---- 统一 VAD：采集侧只运行一个 VAD 引擎 ----
+    # 在线后端：作为发送门控，静音时不向 ASR 发送音频；
+    # 本地后端：不做门控（本地 ASR 需要连续音频分段），识别器订阅逐块 VAD 流，
+    # 复用同一串置信度做分段，不再自己跑一遍 Silero。
     _online_backend = backend != 'local'
-    _vad_gating_enabled = config.VAD_ENABLED and _online_backend
 
-    if _vad_gating_enabled:
+    if config.VAD_ENABLED:
         try:
-            from local_asr.model_manager import is_silero_cached, download_silero
-            from local_asr.vad_processor import VADProcessor
-
-            if not is_silero_cached():
-                print('[VAD] Silero ONNX 模型未下载，正在自动下载...')
-                download_silero()
-
-            print('[VAD] Silero ONNX 模型就绪，正在初始化...')
-            state.vad_processor = VADProcessor(
-                sample_rate=config.SAMPLE_RATE,
-                threshold=config.LOCAL_VAD_THRESHOLD,
-                min_speech_duration=config.LOCAL_VAD_MIN_SPEECH_DURATION,
-                chunk_duration=512.0 / config.SAMPLE_RATE,
-                pre_speech_duration=config.LOCAL_VAD_PRE_SPEECH_DURATION,
-            )
-            state.vad_processor.update_settings({
-                'vad_mode': 'silero',
-                'vad_threshold': config.LOCAL_VAD_THRESHOLD,
-                'min_speech_duration': config.LOCAL_VAD_MIN_SPEECH_DURATION,
-                'silence_duration': config.LOCAL_VAD_SILENCE_DURATION,
-                'pre_speech_duration': config.LOCAL_VAD_PRE_SPEECH_DURATION,
-            })
+            state.vad_stream = create_vad_stream(gating=_online_backend)
             state.vad_enabled = True
-            import numpy as np
-            state._vad_pending_samples = np.array([], dtype=np.float32)
+            state.vad_pre_roll.clear()
             state._vad_was_speaking = False
-            print('[VAD] ✓ 在线 API VAD 发送门控已启用')
-            print(f'[VAD]   threshold={state.vad_processor.threshold:.2f} '
+            processor = state.vad_stream.processor
+            if _online_backend:
+                print('[VAD] ✓ 在线 API VAD 发送门控已启用')
+            else:
+                print('[VAD] ✓ 共享 VAD 流已启用（本地识别复用采集侧 VAD）')
+            print(f'[VAD]   threshold={processor.threshold:.2f} '
                   f'min_speech={config.LOCAL_VAD_MIN_SPEECH_DURATION:.1f}s '
                   f'silence={config.LOCAL_VAD_SILENCE_DURATION:.1f}s '
-                  f'mode={state.vad_processor.mode}')
+                  f'mode={processor.mode}')
         except Exception as e:
             import traceback
-            print(f'[VAD] ✗ 初始化失败，VAD 门控未启用: {e}')
+            print(f'[VAD] ✗ 初始化失败，采集侧 VAD 未启用: {e}')
             traceback.print_exc()
+            state.vad_stream = None
             state.vad_enabled = False
-    elif not config.VAD_ENABLED:
-        print('[VAD] — VAD 未启用（VAD_ENABLED=False）')
     else:
-        print('[VAD] — 本地 ASR 后端：门控由识别器内部 VAD 负责，采集侧不做门控')
+        print('[VAD] — VAD 未启用（VAD_ENABLED=False）')
 
     # 初始化翻译器
     cfg = config_from_module(config)
@@ -477,6 +463,16 @@ async def main(
         keepalive_interval=config.KEEPALIVE_INTERVAL,
     )
 
+    if state.vad_stream is not None and not state.vad_stream.gating:
+        attach = getattr(state.recognition_instance, 'attach_vad_stream', None)
+        if attach is not None and attach(state.vad_stream):
+            print('[VAD] 本地识别器已订阅共享 VAD 流')
+        else:
+            # 识别器无法复用（如采样率不符）：退回识别器自带 VAD，采集侧不再分析
+            print('[VAD] 本地识别器无法复用共享 VAD 流，改用识别器内部 VAD')
+            state.vad_stream = None
+            state.vad_enabled = False
+
     if state.vocabulary_id and backend == 'dashscope':
         print(f'[ASR] 使用热词表: {state.vocabulary_id}')
 
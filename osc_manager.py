@@ -18,6 +18,7 @@ import vrchat_oscquery.common as vrchat_osc_common
 from vrchat_oscquery.threaded import vrc_osc
 
 import config as app_config
+from latency_trace import latency_tracer
 from shared.vrchat_text_limits import (
     normalize_osc_text_max_length,
     trim_text_prefix_to_limit,
@@ -49,6 +50,7 @@ class QueuedMessage:
     ongoing: bool
     priority: int
     timestamp: float
+    trace_id: Optional[int] = None
 
 
 @dataclass
@@ -692,16 +694,18 @@ class OSCManager:
             self._last_send_time = time.time()
             text = message.text
             ongoing = message.ongoing
+            trace_id = message.trace_id
 
-        self._send_message_immediately(text, ongoing)
+        self._send_message_immediately(text, ongoing, trace_id)
     
-    def _send_message_immediately(self, text: str, ongoing: bool):
+    def _send_message_immediately(self, text: str, ongoing: bool, trace_id: Optional[int] = None):
         """
         立即发送消息到VRChat聊天框（内部方法）
         
         Args:
             text: 要发送的文本
             ongoing: 是否正在输入中
+            trace_id: 延迟追踪 id；终句发出后结束该追踪
         """
         try:
             client = self.get_udp_client()
@@ -710,6 +714,11 @@ class OSCManager:
             logger.info(f"[OSC] Sent chatbox message: '{text}' (ongoing={ongoing})")
         except Exception as e:
             logger.error(f"[OSC] Failed to send OSC message: {e}")
+            latency_tracer.finish(trace_id, status='error')
+            return
+        latency_tracer.mark(trace_id, 'osc_sent')
+        if not ongoing:
+            latency_tracer.finish(trace_id)
     
     async def set_typing(self, typing: bool):
         if (self._ipc_client is not None 
@@ -737,21 +746,26 @@ class OSCManager:
         except Exception as e:
             logger.error(f"[OSC] Failed to set typing state: {e}")
     
-    async def send_text(self, text: str, ongoing: bool):
+    async def send_text(self, text: str, ongoing: bool, trace_id: Optional[int] = None):
+        latency_tracer.mark(trace_id, 'osc_enqueued')
         if (self._ipc_client is not None 
                 and self._ipc_client.is_connected() 
                 and self._ipc_client.is_delegate_osc_enabled()):
             text = self._prepare_outgoing_text_for_osc(text)
             await self._ipc_client.send_message(text, ongoing)
+            latency_tracer.mark(trace_id, 'osc_sent', transport='ipc')
+            if not ongoing:
+                latency_tracer.finish(trace_id)
             return
         if hasattr(asyncio, "to_thread"):
-            await asyncio.to_thread(self.send_text_sync, text, ongoing)
+            await asyncio.to_thread(self.send_text_sync, text, ongoing, trace_id)
         else:
             loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, self.send_text_sync, text, ongoing)
+            await loop.run_in_executor(None, self.send_text_sync, text, ongoing, trace_id)
 
-    def send_text_sync(self, text: str, ongoing: bool):
+    def send_text_sync(self, text: str, ongoing: bool, trace_id: Optional[int] = None):
         """发送文本到 VRChat（带冷却，最多保留一个待发消息）"""
+        latency_tracer.mark(trace_id, 'osc_enqueued')
         text = self._prepare_outgoing_text_for_osc(text)
 
         if self._compat_mode_enabled():
@@ -759,9 +773,12 @@ class OSCManager:
                 if self._pending_timer is not None:
                     self._pending_timer.cancel()
                     self._pending_timer = None
+                superseded = self._pending_message
                 self._pending_message = None
                 self._last_send_time = time.time()
-            self._send_message_immediately(text, ongoing)
+            if superseded is not None and superseded.trace_id != trace_id:
+                latency_tracer.finish(superseded.trace_id, status='superseded')
+            self._send_message_immediately(text, ongoing, trace_id)
             return
         
         # 确定优先级
@@ -772,9 +789,11 @@ class OSCManager:
             ongoing=ongoing,
             priority=priority,
             timestamp=time.time(),
+            trace_id=trace_id,
         )
 
         send_now = None
+        superseded = None
 
         with self._state_lock:
             now = time.time()
@@ -794,14 +813,17 @@ class OSCManager:
                         self._pending_message.priority,
                         priority,
                     )
+                    superseded = self._pending_message
                 else:
                     logger.debug("[OSC] Added pending message (priority=%s)", priority)
 
                 self._pending_message = message
                 self._schedule_pending_send_locked()
 
+        if superseded is not None and superseded.trace_id != trace_id:
+            latency_tracer.finish(superseded.trace_id, status='superseded')
         if send_now is not None:
-            self._send_message_immediately(send_now.text, send_now.ongoing)
+            self._send_message_immediately(send_now.text, send_now.ongoing, send_now.trace_id)
 
 
 # 创建全局单例实例
@@ -8,6 +8,7 @@ import time
 from typing import Optional
 
 import config
+from latency_trace import latency_tracer
 from osc_manager import osc_manager
 from speech_recognizers.base_speech_recognizer import (
     RecognitionEvent,
@@ -42,6 +43,15 @@ def _translation_context_prefix() -> str:
     return build_translation_context_prefix(getattr(config, 'CONTEXT_PREFIX', ''))
 
 
+def _translate_traced(trace_id: Optional[int], *args, **kwargs) -> str:
+    """translate_with_backend 外加 mt_request / mt_response 延迟打点。"""
+    latency_tracer.mark(trace_id, 'mt_request')
+    try:
+        return translate_with_backend(*args, **kwargs)
+    finally:
+        latency_tracer.mark(trace_id, 'mt_response')
+
+
 def is_doubao_file_backend(backend: str) -> bool:
     return backend == 'doubao_file'
 
@@ -367,6 +377,7 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
         request_id: int,
         async_result_seq: int,
         session_generation: int,
+        trace_id: Optional[int] = None,
     ) -> bool:
         if not self.loop:
             return False
@@ -389,6 +400,7 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                     request_id=request_id,
                     async_result_seq=async_result_seq,
                     session_generation=session_generation,
+                    trace_id=trace_id,
                 )
             )
 
@@ -415,6 +427,7 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
         previous_source_segment: Optional[str],
         async_result_seq: int,
         session_generation: int,
+        trace_id: Optional[int] = None,
     ) -> None:
         """Non-blocking: run final translation in executor, post results to event loop.
 
@@ -426,6 +439,7 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
 
         def _translate_and_post() -> None:
             """Runs in executor thread — translation + history, then post to event loop."""
+            latency_tracer.mark(trace_id, 'translate_start')
             try:
                 if not self._is_session_generation_current(session_generation):
                     return
@@ -438,7 +452,8 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                     translated_text = text
                     secondary_translated_text = text
                     if primary_should_translate:
-                        translated_text = translate_with_backend(
+                        translated_text = _translate_traced(
+                            trace_id,
                             s.translator, s.deepl_fallback_translator,
                             text, actual_target,
                             previous_translation, use_deepl_final,
@@ -448,7 +463,8 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                             record_history=False,
                         )
                     if secondary_should_translate and secondary_translator is not None:
-                        secondary_translated_text = translate_with_backend(
+                        secondary_translated_text = _translate_traced(
+                            trace_id,
                             secondary_translator, secondary_deepl_fallback,
                             text, actual_secondary_target,
                             previous_translation_secondary, use_deepl_final,
@@ -460,7 +476,8 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                 else:
                     secondary_translated_text = None
                     if primary_should_translate:
-                        translated_text = translate_with_backend(
+                        translated_text = _translate_traced(
+                            trace_id,
                             s.translator, s.deepl_fallback_translator,
                             text, actual_target,
                             previous_translation, use_deepl_final,
@@ -471,6 +488,7 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                         )
                     else:
                         translated_text = text
+                latency_tracer.mark(trace_id, 'translate_done')
 
                 if not self._is_session_generation_current(session_generation):
                     return
@@ -521,6 +539,7 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                                     reverse_translated_text=reverse_text,
                                     async_result_seq=async_result_seq,
                                     session_generation=session_generation,
+                                    trace_id=trace_id,
                                 )
                             )
                         )
@@ -547,6 +566,7 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
         reverse_translated_text: Optional[str],
         async_result_seq: int,
         session_generation: int,
+        trace_id: Optional[int] = None,
     ) -> None:
         """Apply translation results on the event loop (display, subtitles, OSC).
 
@@ -647,7 +667,7 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                 )
 
             if osc_text:
-                await osc_manager.send_text(osc_text, ongoing=False)
+                await osc_manager.send_text(osc_text, ongoing=False, trace_id=trace_id)
 
             if (
                 reverse_translated_text is not None
@@ -919,8 +939,10 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
         request_id: int,
         async_result_seq: int,
         session_generation: int,
+        trace_id: Optional[int] = None,
     ) -> None:
         s = self.state
+        latency_tracer.mark(trace_id, 'translate_start')
         try:
             if not self._is_session_generation_current(session_generation):
                 return
@@ -934,7 +956,8 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
             if primary_should_translate:
                 primary_future = loop.run_in_executor(
                     s.executor,
-                    lambda: translate_with_backend(
+                    lambda: _translate_traced(
+                        trace_id,
                         s.translator,
                         s.deepl_fallback_translator,
                         text,
@@ -953,7 +976,8 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
             if use_secondary_output and secondary_should_translate and secondary_translator is not None:
                 secondary_future = loop.run_in_executor(
                     s.executor,
-                    lambda: translate_with_backend(
+                    lambda: _translate_traced(
+                        trace_id,
                         secondary_translator,
                         secondary_deepl_fallback,
                         text,
@@ -972,6 +996,7 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                 translated_text = await primary_future
             if secondary_future is not None:
                 secondary_translated_text = await secondary_future
+            latency_tracer.mark(trace_id, 'translate_done')
 
             if not self._is_session_generation_current(session_generation):
                 return
@@ -1092,7 +1117,7 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                 )
 
             if osc_text:
-                await osc_manager.send_text(osc_text, ongoing=False)
+                await osc_manager.send_text(osc_text, ongoing=False, trace_id=trace_id)
 
             if (
                 primary_should_translate
@@ -1141,6 +1166,14 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
             return
         session_generation = self._get_session_generation()
 
+        # 延迟追踪：终句让「当前句」脱离，后续阶段通过 trace_id 显式传递
+        trace_id = latency_tracer.current()
+        if is_ongoing:
+            latency_tracer.mark(trace_id, 'asr_first_partial')
+        else:
+            latency_tracer.mark(trace_id, 'asr_final')
+            latency_tracer.detach()
+
         is_translated = False
         display_text = None
 
@@ -1189,12 +1222,14 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
             if not config.ENABLE_TRANSLATION:
                 source_lang_info = s.language_detector.detect(text)
                 source_lang = source_lang_info['language']
+                latency_tracer.mark(trace_id, 'lang_detected')
                 display_text = get_display_text(text, source_lang)
                 print(f'识别：{display_text}')
                 s.update_subtitles(display_text, "", is_ongoing, "")
             else:
                 source_lang_info = s.language_detector.detect(text)
                 source_lang = source_lang_info['language']
+                latency_tracer.mark(trace_id, 'lang_detected')
 
                 normalized_source = self._normalize_lang(source_lang)
                 primary_enabled = getattr(config, 'SMART_TARGET_PRIMARY_ENABLED', False)
@@ -1291,6 +1326,7 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                         request_id=my_final_tid,
                         async_result_seq=async_result_seq,
                         session_generation=session_generation,
+                        trace_id=trace_id,
                     ):
                         return
                     self._dispatch_final_translation_to_executor(
@@ -1308,6 +1344,7 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                         previous_source_segment=previous_source_segment,
                         async_result_seq=async_result_seq,
                         session_generation=session_generation,
+                        trace_id=trace_id,
                     )
                     return
 
@@ -1315,7 +1352,8 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                     translated_text = text
                     secondary_translated_text = text
                     if primary_should_translate:
-                        translated_text = translate_with_backend(
+                        translated_text = _translate_traced(
+                            trace_id,
                             s.translator,
                             s.deepl_fallback_translator,
                             text,
@@ -1329,7 +1367,8 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                             record_history=False,
                         )
                     if secondary_should_translate and secondary_translator is not None:
-                        secondary_translated_text = translate_with_backend(
+                        secondary_translated_text = _translate_traced(
+                            trace_id,
                             secondary_translator,
                             secondary_deepl_fallback,
                             text,
@@ -1344,7 +1383,8 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
                         )
                 else:
                     if primary_should_translate:
-                        translated_text = translate_with_backend(
+                        translated_text = _translate_traced(
+                            trace_id,
                             s.translator,
                             s.deepl_fallback_translator,
                             text,
@@ -1475,7 +1515,11 @@ class VRChatRecognitionCallback(SpeechRecognitionCallback):
             if _should_send:
                 if osc_text:
                     asyncio.run_coroutine_threadsafe(
-                        osc_manager.send_text(osc_text, ongoing=is_ongoing),
+                        osc_manager.send_text(
+                            osc_text,
+                            ongoing=is_ongoing,
+                            trace_id=None if is_ongoing else trace_id,
+                        ),
                         self.loop,
                     )
             elif should_set_typing_started:
@@ -30,6 +30,9 @@ def _run_web_ui_mode():
     app.run(host='127.0.0.1', port=5001, debug=False)
 
 if __name__ == '__main__':
+    # 打包版本中本地识别子进程（spawn）需要它来接管入口
+    import multiprocessing
+    multiprocessing.freeze_support()
     if len(sys.argv) >= 2 and sys.argv[1] == '--panel-app':
         _run_panel_mode()
     else:
@@ -4,7 +4,11 @@ from array import array
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 import sys
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from audio_frame import AudioFrame
+    from vad_stream import VADStream
 
 
 @dataclass
@@ -40,6 +44,11 @@ class SpeechRecognitionCallback(ABC):
 class SpeechRecognizer(ABC):
     """Abstract base class for speech recognition backends."""
 
+    # Largest PCM payload (bytes) a single send may carry when the capture
+    # sender coalesces queued frames (ASR_SEND_COALESCE_MAX_BYTES may lower
+    # it further). None or 0: frames are always sent one by one.
+    max_audio_append_bytes: Optional[int] = None
+
     @abstractmethod
     def set_callback(self, callback: SpeechRecognitionCallback) -> None:
         """Register the callback that will receive recognition events."""
@@ -56,6 +65,10 @@ class SpeechRecognizer(ABC):
     def send_audio_frame(self, data: bytes) -> None:
         """Send a chunk of audio data to the recognizer."""
 
+    def send_audio(self, frame: "AudioFrame") -> None:
+        """Send a pre-converted capture frame; defaults to its int16 PCM bytes."""
+        self.send_audio_frame(frame.pcm)
+
     @abstractmethod
     def pause(self) -> None:
         """Temporarily pause recognition while keeping the session alive if possible."""
@@ -117,6 +130,10 @@ class MonoAudioSpeechRecognizer(SpeechRecognizer):
         self._recognizer = recognizer
         self._input_channels = max(1, int(input_channels))
 
+    @property
+    def max_audio_append_bytes(self) -> Optional[int]:  # type: ignore[override]
+        return getattr(self._recognizer, "max_audio_append_bytes", None)
+
     def set_callback(self, callback: SpeechRecognitionCallback) -> None:
         self._recognizer.set_callback(callback)
 
@@ -131,12 +148,26 @@ class MonoAudioSpeechRecognizer(SpeechRecognizer):
         if mono_data:
             self._recognizer.send_audio_frame(mono_data)
 
+    def send_audio(self, frame: "AudioFrame") -> None:
+        # Capture frames are already downmixed to mono.
+        self._recognizer.send_audio(frame)
+
     def pause(self) -> None:
         self._recognizer.pause()
 
     def resume(self) -> None:
         self._recognizer.resume()
 
+    def attach_vad_stream(self, stream: "VADStream") -> bool:
+        """Let the wrapped recognizer follow the shared VAD stream; False if it cannot."""
+        attach = getattr(self._recognizer, "attach_vad_stream", None)
+        return bool(attach(stream)) if attach is not None else False
+
+    def get_scheduler_stats(self) -> Optional[dict]:
+        """Local ASR scheduler stats of the wrapped recognizer (None for other backends)."""
+        get_stats = getattr(self._recognizer, "get_scheduler_stats", None)
+        return get_stats() if get_stats is not None else None
+
     def get_last_request_id(self) -> Optional[str]:
         return self._recognizer.get_last_request_id()
 
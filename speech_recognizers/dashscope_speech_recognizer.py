@@ -57,6 +57,9 @@ class _DashscopeCallbackAdapter(RecognitionCallback):
 class DashscopeSpeechRecognizer(SpeechRecognizer):
     """DashScope-backed implementation of the speech recognizer interface."""
 
+    # DashScope 实时识别建议单次发送的音频不超过 16KB
+    max_audio_append_bytes = 16000
+
     def __init__(self, callback: SpeechRecognitionCallback, **recognition_kwargs: Any) -> None:
         self._recognition_kwargs = recognition_kwargs
         self._recognition: Optional[Recognition] = None
@@ -1,27 +1,91 @@
 from __future__ import annotations
 
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future
+from difflib import SequenceMatcher
 import logging
 import queue
 import threading
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 
 import config
+from audio_frame import FixedChunker, pcm16_to_float32
 from local_asr import get_engine_runtime_issues
-from local_asr.model_manager import is_asr_cached, is_asr_models_ready, is_silero_cached
+from local_asr.asr_scheduler import (
+    PRIORITY_FINAL,
+    PRIORITY_PARTIAL,
+    PRIORITY_SPECULATIVE,
+    ASRScheduler,
+    CancelToken,
+    TranscriptionCancelled,
+)
+from local_asr.engine_pool import get_engine_pool
+from local_asr.model_manager import (
+    estimate_engine_memory_bytes,
+    is_asr_cached,
+    is_asr_models_ready,
+    is_silero_cached,
+    record_engine_startup,
+)
 from local_asr.vad_processor import VADProcessor
 from vrcx_context_bridge import build_asr_context_text
 
 from .base_speech_recognizer import RecognitionEvent, SpeechRecognitionCallback, SpeechRecognizer
 
+if TYPE_CHECKING:
+    from audio_frame import AudioFrame
+    from vad_stream import VADChunk, VADStream
+
 logger = logging.getLogger(__name__)
 
 LOCAL_VAD_SAMPLE_RATE = 16000
 LOCAL_VAD_CHUNK_SAMPLES = 512
 LOCAL_VAD_CHUNK_DURATION = LOCAL_VAD_CHUNK_SAMPLES / LOCAL_VAD_SAMPLE_RATE
+# 长句切窗时，在窗口末尾这段范围内找置信度最低处下刀
+LOCAL_WINDOW_SEARCH_DURATION = 3.0
+# 合并重叠文本时，只在上一窗结尾 / 本窗开头这么多字符内找重复
+_WINDOW_MERGE_SPAN = 48
+# 各引擎加载时读取的设置；变化后池里的旧引擎不再复用
+_ENGINE_LOAD_SETTINGS = {
+    "sensevoice": (),
+    "qwen3-asr": ("LOCAL_QWEN_ASR_N_CTX", "LOCAL_QWEN_ENCODER_USE_DML"),
+}
+
+
+def _merge_window_text(previous: str, text: str) -> str:
+    """Drop the head of ``text`` that repeats the tail of ``previous`` (window overlap)."""
+    if not previous or not text:
+        return text
+    tail = previous[-_WINDOW_MERGE_SPAN:]
+    head = text[:_WINDOW_MERGE_SPAN]
+    match = SequenceMatcher(None, tail, head, autojunk=False).find_longest_match(0, len(tail), 0, len(head))
+    # 重复部分须贴着上一窗结尾、本窗开头（容许几个字符的标点/识别差异）
+    if match.size < 2 or len(tail) - (match.a + match.size) > 4 or match.b > 4:
+        return text
+    return text[match.b + match.size :].lstrip()
+
+
+class _Speculation:
+    """A final decode started at the first sub-threshold chunk of an utterance.
+
+    ``confirmed``: the VAD then flushed the segment with no speech in between,
+    so the result is the final. ``abandoned``: speech resumed (or the segment
+    was dropped); a late result is only offered as a partial.
+    """
+
+    __slots__ = ("audio", "stream_id", "future", "started", "done", "payload", "confirmed", "abandoned")
+
+    def __init__(self, audio: np.ndarray, stream_id: int) -> None:
+        self.audio = audio
+        self.stream_id = stream_id
+        self.future: Future | None = None
+        self.started = False
+        self.done = False
+        self.payload: tuple[str, dict] | None = None
+        self.confirmed = False
+        self.abandoned = False
 
 
 class LocalSpeechRecognizer(SpeechRecognizer):
@@ -38,25 +102,30 @@ class LocalSpeechRecognizer(SpeechRecognizer):
         self._sample_rate = sample_rate
         self._source_language = source_language
         self._engine_name = getattr(config, "LOCAL_ASR_ENGINE", "sensevoice")
-        self._audio_queue: queue.Queue[bytes] = queue.Queue(maxsize=128)
+        # 元素为原始采样，或跟随共享 VAD 流时的 (512 采样块, 置信度)
+        self._audio_queue: queue.Queue = queue.Queue(maxsize=128)
         self._worker: threading.Thread | None = None
-        self._asr_executor: ThreadPoolExecutor | None = None
-        self._active_transcribe_future: Future | None = None
-        self._waiting_partial_audio: np.ndarray | None = None
-        self._waiting_final_audio: np.ndarray | None = None
+        # 最终结果 > 推测 > 中间结果；终句到来时抢占正在跑的中间结果
+        self._scheduler: ASRScheduler | None = None
+        self._window_text = ""
+        self._speculation: _Speculation | None = None
         self._running = False
         self._paused = False
         self._lock = threading.RLock()
         self._engine = None
         self._vad = self._create_vad()
-        self._pending_samples = np.array([], dtype=np.float32)
+        self._chunker = FixedChunker(LOCAL_VAD_CHUNK_SAMPLES)
+        self._vad_stream: VADStream | None = None
         self._last_partial_text = ""
         self._last_partial_time = 0.0
         self._last_request_id = f"local-{self._engine_name}"
         self._stream_id = 0
         self._corpus_text = (corpus_text or "").strip()
+        # 点击开始的时刻；首条结果发出时记一次「开始到首个结果」耗时
+        self._started_at = 0.0
+        self._first_result_pending = False
 
-    def _input_cap_samples(self) -> int:
+    def _window_samples(self) -> int:
         sec = float(getattr(config, "LOCAL_VAD_MAX_SPEECH_DURATION", 30.0))
         sec = max(1.0, sec)
         return int(sec * LOCAL_VAD_SAMPLE_RATE)
@@ -81,6 +150,7 @@ class LocalSpeechRecognizer(SpeechRecognizer):
                 "min_speech_duration": float(getattr(config, "LOCAL_VAD_MIN_SPEECH_DURATION", 1.0)),
                 "silence_duration": float(getattr(config, "LOCAL_VAD_SILENCE_DURATION", 0.8)),
                 "pre_speech_duration": float(getattr(config, "LOCAL_VAD_PRE_SPEECH_DURATION", 0.2)),
+                "adaptive_endpoint": bool(getattr(config, "LOCAL_VAD_ADAPTIVE_ENDPOINT", False)),
             }
         )
         return vad
@@ -104,24 +174,48 @@ class LocalSpeechRecognizer(SpeechRecognizer):
                 f"本地识别主模型未就绪。请在「本地音频识别」中点击下载 {self._engine_name} 所需资源。"
             )
 
-        if self._engine_name == "sensevoice":
-            from local_asr.asr_sensevoice import SenseVoiceEngine
-
-            engine = SenseVoiceEngine()
-        elif self._engine_name == "qwen3-asr":
-            from local_asr.asr_qwen3 import Qwen3ASREngine
-
-            engine = Qwen3ASREngine(corpus_text=build_asr_context_text(self._corpus_text) or None)
-        else:
+        if self._engine_name not in _ENGINE_LOAD_SETTINGS:
             raise RuntimeError(f"未知的本地识别引擎: {self._engine_name}")
-
+        use_worker = bool(getattr(config, "LOCAL_ASR_WORKER_PROCESS", False))
+        # 加载参数不同的引擎不能复用：键里带上影响加载的设置
+        key = (
+            self._engine_name,
+            use_worker,
+            tuple(getattr(config, name, None) for name in _ENGINE_LOAD_SETTINGS[self._engine_name]),
+        )
+        engine = get_engine_pool().acquire(
+            key,
+            self._engine_name,
+            lambda: self._load_engine(use_worker),
+            size_bytes=estimate_engine_memory_bytes(self._engine_name),
+        )
         engine.set_language(self._source_language or "auto")
         self._engine = engine
         return engine
 
+    def _load_engine(self, use_worker: bool):
+        corpus_text = build_asr_context_text(self._corpus_text) or None
+        if use_worker:
+            from local_asr.asr_worker_process import ASRWorkerProcess
+
+            kwargs = {"corpus_text": corpus_text} if self._engine_name == "qwen3-asr" else {}
+            return ASRWorkerProcess(self._engine_name, kwargs=kwargs)
+        if self._engine_name == "sensevoice":
+            from local_asr.asr_sensevoice import SenseVoiceEngine
+
+            return SenseVoiceEngine()
+        from local_asr.asr_qwen3 import Qwen3ASREngine
+
+        return Qwen3ASREngine(corpus_text=corpus_text)
+
     def _emit_result(self, text: str, is_final: bool, raw: Optional[dict] = None) -> None:
         if not text:
             return
+        if self._first_result_pending:
+            self._first_result_pending = False
+            record_engine_startup(
+                self._engine_name, first_result_ms=round((time.perf_counter() - self._started_at) * 1000.0, 1)
+            )
         self._callback.on_result(
             RecognitionEvent(
                 text=text,
@@ -130,14 +224,45 @@ class LocalSpeechRecognizer(SpeechRecognizer):
             )
         )
 
-    def _transcribe(self, audio: np.ndarray, *, is_final: bool = True) -> tuple[str, dict] | None:
+    def _emit_final_locked(self, payload: tuple[str, dict] | None, *, window: bool = False) -> None:
+        if payload is None:
+            if not window:
+                self._window_text = ""
+            return
+        text, raw = payload
+        merged = _merge_window_text(self._window_text, text)
+        self._window_text = text if window else ""
+        self._last_partial_text = ""
+        self._stream_id += 1
+        self._emit_result(merged, is_final=True, raw=raw)
+
+    def _emit_partial_locked(self, payload: tuple[str, dict] | None, stream_id: int) -> None:
+        if payload is None:
+            return
+        text, raw = payload
+        if stream_id == self._stream_id and text != self._last_partial_text:
+            self._last_partial_text = text
+            self._emit_result(text, is_final=False, raw=raw)
+
+    def _transcribe(
+        self, audio: np.ndarray, *, is_final: bool = True, cancel: CancelToken | None = None
+    ) -> tuple[str, dict] | None:
         engine = self._ensure_engine()
         if hasattr(engine, "set_corpus_text"):
             engine.set_corpus_text(build_asr_context_text(self._corpus_text) or None)
         kwargs = {}
-        if hasattr(engine, "transcribe") and "update_context" in engine.transcribe.__code__.co_varnames:
+        varnames = engine.transcribe.__code__.co_varnames if hasattr(engine, "transcribe") else ()
+        if "update_context" in varnames:
             kwargs["update_context"] = is_final
-        result = engine.transcribe(audio, **kwargs)
+        if cancel is not None and "cancel" in varnames:
+            kwargs["cancel"] = cancel
+        if "incremental" in varnames:
+            # 中间结果 / 推测解码的音频是同一句不断增长的前缀，引擎可复用已算的特征
+            kwargs["incremental"] = not is_final
+        return self._payload(engine.transcribe(audio, **kwargs))
+
+    @staticmethod
+    def _payload(result: dict | None) -> tuple[str, dict] | None:
         if not result:
             return None
         text = (result.get("text") or "").strip()
@@ -145,72 +270,150 @@ class LocalSpeechRecognizer(SpeechRecognizer):
             return None
         return text, result
 
-    def _on_transcription_done(self, future: Future, *, stream_id: int, is_final: bool) -> None:
+    def _transcribe_batch(self, audios: list[np.ndarray], _cancel: CancelToken) -> list[tuple[str, dict] | None]:
+        """Several queued finals in one engine call (engines with ``transcribe_batch``)."""
+        engine = self._ensure_engine()
+        if hasattr(engine, "set_corpus_text"):
+            engine.set_corpus_text(build_asr_context_text(self._corpus_text) or None)
+        return [self._payload(result) for result in engine.transcribe_batch(audios)]
+
+    def _job_result(self, future: Future):
+        """Result of a scheduled decode; None when it was cancelled, superseded or failed."""
+        if future.cancelled():
+            return None
         try:
-            payload = future.result()
+            return future.result()
+        except TranscriptionCancelled:
+            return None
         except Exception as exc:  # pragma: no cover - runtime safety
             logger.exception("Local ASR transcription failed")
             self._callback.on_error(exc)
-            payload = None
-
-        if payload is not None:
-            text, raw = payload
-            with self._lock:
-                if is_final:
-                    self._last_partial_text = ""
-                    self._stream_id += 1
-                    self._emit_result(text, is_final=True, raw=raw)
-                elif stream_id == self._stream_id and text != self._last_partial_text:
-                    self._last_partial_text = text
-                    self._emit_result(text, is_final=False, raw=raw)
+            return None
 
+    def _on_final_done(self, future: Future, *, window: bool) -> None:
+        payload = self._job_result(future)
         with self._lock:
-            self._try_start_transcribe_locked()
+            self._emit_final_locked(payload, window=window)
 
-    def _try_start_transcribe_locked(self) -> None:
-        if self._asr_executor is None:
-            return
-        fut = self._active_transcribe_future
-        if fut is not None and not fut.done():
+    def _on_partial_done(self, future: Future) -> None:
+        result = self._job_result(future)
+        if result is None:
             return
+        stream_id, payload = result
+        with self._lock:
+            self._emit_partial_locked(payload, stream_id)
 
-        if self._waiting_final_audio is not None:
-            audio = self._waiting_final_audio
-            self._waiting_final_audio = None
-            is_final = True
-        elif self._waiting_partial_audio is not None:
-            audio = self._waiting_partial_audio
-            self._waiting_partial_audio = None
-            is_final = False
-        else:
-            self._active_transcribe_future = None
-            return
+    def _on_speculation_done(self, future: Future, speculation: _Speculation) -> None:
+        payload = self._job_result(future)
+        with self._lock:
+            speculation.done = True
+            speculation.payload = payload
+            if speculation.confirmed:
+                self._accept_speculation_locked(speculation)
+            elif speculation.abandoned:
+                self._emit_partial_locked(payload, speculation.stream_id)
+
+    def _run_partial(self, audio: np.ndarray, cancel: CancelToken) -> tuple[int, tuple[str, dict] | None]:
+        # 开始识别时才取 stream_id：排在前一句终句之后的中间结果属于新的一句
+        with self._lock:
+            stream_id = self._stream_id
+        return stream_id, self._transcribe(audio, is_final=False, cancel=cancel)
 
-        stream_id = self._stream_id
-        self._active_transcribe_future = self._asr_executor.submit(self._transcribe, audio, is_final=is_final)
-        self._active_transcribe_future.add_done_callback(
-            lambda done_future, _sid=stream_id, _fin=is_final: self._on_transcription_done(
-                done_future,
-                stream_id=_sid,
-                is_final=_fin,
-            )
-        )
+    def _run_speculation(self, speculation: _Speculation) -> tuple[str, dict] | None:
+        with self._lock:
+            if speculation.abandoned:
+                raise TranscriptionCancelled()
+            speculation.started = True
+        # 推测解码不更新引擎上下文：确认后再 commit，放弃时不留痕迹
+        return self._transcribe(speculation.audio, is_final=False)
 
-    def _enqueue_transcribe(self, audio: np.ndarray, *, is_final: bool) -> None:
+    def _enqueue_transcribe(self, audio: np.ndarray, *, is_final: bool, window: bool = False) -> None:
         if audio.size == 0:
             return
-        copy = audio.copy()
+        # VAD 交出的是只读视图，且之后不会被覆写，无需再复制
         with self._lock:
-            if self._asr_executor is None:
-                self._asr_executor = ThreadPoolExecutor(
-                    max_workers=1,
-                    thread_name_prefix="yakutan-local-asr",
-                )
+            scheduler = self._ensure_scheduler_locked()
             if is_final:
-                self._waiting_final_audio = copy
+                # 排队中的中间结果已被这句终句覆盖
+                scheduler.cancel_queued(PRIORITY_PARTIAL)
+                # 多句终句同时排队（回放、识别跟不上）时合并成一次批量推理
+                batch = (self._transcribe_batch, audio) if hasattr(self._engine, "transcribe_batch") else None
+                future = scheduler.submit(
+                    lambda _cancel: self._transcribe(audio, is_final=True),
+                    priority=PRIORITY_FINAL,
+                    batch=batch,
+                )
+                future.add_done_callback(lambda done, _win=window: self._on_final_done(done, window=_win))
             else:
-                self._waiting_partial_audio = copy
-            self._try_start_transcribe_locked()
+                future = scheduler.submit(
+                    lambda cancel: self._run_partial(audio, cancel),
+                    priority=PRIORITY_PARTIAL,
+                    cancellable=True,
+                    supersede=True,
+                )
+                future.add_done_callback(self._on_partial_done)
+
+    def _ensure_scheduler_locked(self) -> ASRScheduler:
+        if self._scheduler is None:
+            self._scheduler = ASRScheduler(name="yakutan-local-asr")
+        return self._scheduler
+
+    def get_scheduler_stats(self) -> Optional[dict]:
+        """Queue-wait and preemption stats of the local ASR scheduler (None when stopped)."""
+        scheduler = self._scheduler
+        return scheduler.stats() if scheduler is not None else None
+
+    def _start_speculation_locked(self) -> None:
+        if not getattr(config, "LOCAL_SPECULATIVE_FINAL", True):
+            return
+        if self._vad._speech_samples < self._vad.min_speech_samples:
+            return  # 太短的段不会在静音后交出，推测无意义
+        peek = self._vad.peek_buffer()
+        if peek is None:
+            return
+        self._abandon_speculation_locked()
+        speculation = _Speculation(peek[0], self._stream_id)
+        self._speculation = speculation
+        scheduler = self._ensure_scheduler_locked()
+        # 推测解码优先于中间结果（会抢占正在跑的中间结果）：它本身就能充当中间结果
+        scheduler.cancel_queued(PRIORITY_PARTIAL)
+        speculation.future = scheduler.submit(
+            lambda _cancel, _spec=speculation: self._run_speculation(_spec),
+            priority=PRIORITY_SPECULATIVE,
+        )
+        speculation.future.add_done_callback(
+            lambda done, _spec=speculation: self._on_speculation_done(done, _spec)
+        )
+
+    def _abandon_speculation_locked(self) -> None:
+        speculation = self._speculation
+        if speculation is None:
+            return
+        self._speculation = None
+        speculation.abandoned = True
+        if speculation.future is not None and not speculation.started:
+            speculation.future.cancel()
+
+    def _accept_speculation_locked(self, speculation: _Speculation) -> None:
+        payload = speculation.payload
+        if payload is not None:
+            engine = self._engine
+            if engine is not None and hasattr(engine, "commit_context"):
+                engine.commit_context(payload[0])
+        self._emit_final_locked(payload)
+
+    def _finish_segment_locked(self, segment: np.ndarray) -> None:
+        speculation = self._speculation
+        if speculation is None or not speculation.started:
+            # 推测解码还在排队：直接对完整段做最终识别
+            self._abandon_speculation_locked()
+            self._enqueue_transcribe(segment, is_final=True)
+            return
+        # 静音确认：推测解码的结果即最终结果（段尾只多了静音）
+        self._speculation = None
+        speculation.confirmed = True
+        if speculation.done:
+            self._accept_speculation_locked(speculation)
 
     def _maybe_emit_partial(self) -> None:
         if not getattr(config, "LOCAL_INCREMENTAL_ASR", True):
@@ -229,69 +432,73 @@ class LocalSpeechRecognizer(SpeechRecognizer):
         self._last_partial_time = time.monotonic()
         self._enqueue_transcribe(audio, is_final=False)
 
-    def _process_chunk(self, chunk: np.ndarray) -> None:
-        if self._vad._is_speaking and self._vad._speech_samples >= self._input_cap_samples():
-            chunk = np.zeros_like(chunk)
-        speech_segment = self._vad.process_chunk(chunk)
+    def _split_window_locked(self) -> None:
+        """长句超过窗口上限：在低置信处切出一个窗口立即识别，保留重叠部分继续累积。"""
+        overlap = max(0.0, float(getattr(config, "LOCAL_ASR_WINDOW_OVERLAP", 0.8)))
+        window = self._vad.split_long_segment(LOCAL_WINDOW_SEARCH_DURATION, overlap)
+        if window is None:
+            return
+        self._abandon_speculation_locked()
+        self._last_partial_text = ""
+        self._last_partial_time = time.monotonic()
+        self._enqueue_transcribe(window, is_final=True, window=True)
+
+    def _process_chunk(self, chunk: np.ndarray, confidence: float | None = None) -> None:
+        speech_segment = self._vad.process_chunk(chunk, confidence)
         if speech_segment is not None:
-            self._enqueue_transcribe(speech_segment, is_final=True)
+            self._finish_segment_locked(speech_segment)
             return
+        if self._vad._is_speaking and self._vad._speech_samples >= self._window_samples():
+            self._split_window_locked()
+        if self._speculation is not None and (not self._vad._is_speaking or self._vad._silence_counter == 0):
+            # 又开始说话，或短段/低密度段未交出：推测作废
+            self._abandon_speculation_locked()
         if self._vad._is_speaking:
-            self._maybe_emit_partial()
-
-    def _feed_samples(self, samples: np.ndarray) -> None:
+            if self._vad._silence_counter == 1:
+                self._start_speculation_locked()
+            if self._speculation is None:
+                self._maybe_emit_partial()
+
+    def _feed_samples(self, samples) -> None:
+        if isinstance(samples, tuple):
+            chunk, confidence = samples
+            self._process_chunk(chunk, confidence)
+            return
         if samples.size == 0:
             return
-        if self._pending_samples.size:
-            samples = np.concatenate([self._pending_samples, samples])
-        chunk_size = LOCAL_VAD_CHUNK_SAMPLES
-        offset = 0
-        while offset + chunk_size <= len(samples):
-            chunk = samples[offset : offset + chunk_size]
+        for chunk in self._chunker.push(samples):
             self._process_chunk(chunk)
-            offset += chunk_size
-        self._pending_samples = samples[offset:].copy()
 
     def _drain_queue_locked(self) -> None:
-        buffered: list[np.ndarray] = []
         while True:
             try:
-                data = self._audio_queue.get_nowait()
+                samples = self._audio_queue.get_nowait()
             except queue.Empty:
                 break
-            buffered.append(self._pcm_to_float32(data))
-        if buffered:
-            self._feed_samples(np.concatenate(buffered))
+            self._feed_samples(samples)
 
     def _finalize_current_segment_locked(self) -> None:
-        if self._pending_samples.size:
-            padded = np.pad(
-                self._pending_samples,
-                (0, LOCAL_VAD_CHUNK_SAMPLES - len(self._pending_samples)),
-            )
+        pending = self._chunker.pending
+        if pending.size:
+            padded = np.pad(pending, (0, LOCAL_VAD_CHUNK_SAMPLES - len(pending)))
             self._process_chunk(padded)
-            self._pending_samples = np.array([], dtype=np.float32)
+            self._chunker.reset()
+        self._abandon_speculation_locked()
         segment = self._vad.force_flush() if self._vad._is_speaking else self._vad.flush()
         if segment is not None:
             self._enqueue_transcribe(segment, is_final=True)
         self._last_partial_text = ""
         self._last_partial_time = 0.0
 
-    @staticmethod
-    def _pcm_to_float32(data: bytes) -> np.ndarray:
-        audio = np.frombuffer(data, dtype=np.int16).astype(np.float32)
-        return audio / 32768.0
-
     def _worker_loop(self) -> None:
         try:
             while self._running:
                 try:
-                    data = self._audio_queue.get(timeout=0.2)
+                    samples = self._audio_queue.get(timeout=0.2)
                 except queue.Empty:
                     continue
                 if self._paused:
                     continue
-                samples = self._pcm_to_float32(data)
                 with self._lock:
                     self._feed_samples(samples)
         except Exception as exc:  # pragma: no cover - runtime safety
@@ -303,21 +510,24 @@ class LocalSpeechRecognizer(SpeechRecognizer):
 
     def start(self) -> None:
         with self._lock:
+            started = time.perf_counter()
             self._ensure_engine()
             self._paused = False
             if self._running:
                 return
+            self._started_at = started
+            self._first_result_pending = True
+            record_engine_startup(
+                self._engine_name,
+                engine_ready_ms=round((time.perf_counter() - started) * 1000.0, 1),
+                first_result_ms=None,
+            )
             self._running = True
             self._stream_id = 0
             self._last_partial_text = ""
-            self._waiting_partial_audio = None
-            self._waiting_final_audio = None
-            self._active_transcribe_future = None
-            if self._asr_executor is None:
-                self._asr_executor = ThreadPoolExecutor(
-                    max_workers=1,
-                    thread_name_prefix="yakutan-local-asr",
-                )
+            self._window_text = ""
+            self._speculation = None
+            self._ensure_scheduler_locked()
             self._worker = threading.Thread(target=self._worker_loop, daemon=True)
             self._worker.start()
             self._callback.on_session_started()
@@ -331,32 +541,73 @@ class LocalSpeechRecognizer(SpeechRecognizer):
         if self._worker is not None:
             self._worker.join(timeout=5.0)
             self._worker = None
-        if self._asr_executor is not None:
-            self._asr_executor.shutdown(wait=True)
-            self._asr_executor = None
-        self._active_transcribe_future = None
-        self._waiting_partial_audio = None
-        self._waiting_final_audio = None
+        scheduler = self._scheduler
+        if scheduler is not None:
+            # 已排队的终句仍会识别完；中间结果不再需要
+            scheduler.cancel_queued(PRIORITY_PARTIAL)
+            scheduler.shutdown(wait=True)
+            logger.info("Local ASR scheduler stats: %s", scheduler.stats())
+            self._scheduler = None
+        self._speculation = None
         with self._lock:
             if self._engine is not None:
-                try:
-                    self._engine.unload()
-                except Exception:
-                    pass
+                # 引擎回到进程级池中保温，下次 start() 直接复用
+                get_engine_pool().release(self._engine)
                 self._engine = None
             self._callback.on_session_stopped()
 
-    def send_audio_frame(self, data: bytes) -> None:
-        if not self._running or self._paused or not data:
+    def attach_vad_stream(self, stream: "VADStream") -> bool:
+        """Follow the shared capture-side VAD stream instead of running our own model.
+
+        The stream's per-chunk confidences drive this recognizer's segmenter, so
+        Silero runs once per chunk for the whole app. Returns False when the stream
+        does not match the 16 kHz / 512-sample layout the segmenter expects; the
+        recognizer then keeps consuming ``send_audio`` with its own VAD.
+        """
+        if (
+            stream.sample_rate != LOCAL_VAD_SAMPLE_RATE
+            or stream.chunk_samples != LOCAL_VAD_CHUNK_SAMPLES
+            or self._sample_rate != LOCAL_VAD_SAMPLE_RATE
+        ):
+            return False
+        with self._lock:
+            if self._vad_stream is not None:
+                self._vad_stream.unsubscribe(self._on_vad_chunk)
+            self._vad_stream = stream
+            stream.subscribe(self._on_vad_chunk)
+        return True
+
+    def _on_vad_chunk(self, chunk: "VADChunk") -> None:
+        # 在推送方线程（事件循环）内调用：只入队，分段与转写留给工作线程
+        if not self._running or self._paused:
             return
+        self._enqueue_samples((chunk.samples, chunk.confidence))
+
+    def _enqueue_samples(self, samples) -> None:
         try:
-            self._audio_queue.put_nowait(data)
+            self._audio_queue.put_nowait(samples)
         except queue.Full:
             try:
                 _ = self._audio_queue.get_nowait()
             except queue.Empty:
                 pass
-            self._audio_queue.put_nowait(data)
+            self._audio_queue.put_nowait(samples)
+
+    def send_audio_frame(self, data: bytes) -> None:
+        if self._vad_stream is not None:
+            return
+        if not self._running or self._paused or not data:
+            return
+        self._enqueue_samples(pcm16_to_float32(data))
+
+    def send_audio(self, frame: "AudioFrame") -> None:
+        # 跟随共享 VAD 流时音频已随逐块结果送达，忽略重复输入
+        if self._vad_stream is not None:
+            return
+        # 直接复用采集阶段已转换好的 float32 视图
+        if not self._running or self._paused or not len(frame):
+            return
+        self._enqueue_samples(frame.samples)
 
     def pause(self) -> None:
         with self._lock:
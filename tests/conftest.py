@@ -0,0 +1,18 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def _ort_cache_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("ort_optimized")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_ort_cache(monkeypatch, _ort_cache_dir):
+    """Keep optimized ONNX graphs out of the dev models directory."""
+    from local_asr import ort_cache
+
+    monkeypatch.setattr(ort_cache, "cache_dir", lambda: _ort_cache_dir)
@@ -0,0 +1,161 @@
+"""Tests for local_asr.asr_scheduler."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from local_asr.asr_scheduler import (
+    PRIORITY_FINAL,
+    PRIORITY_PARTIAL,
+    PRIORITY_SPECULATIVE,
+    ASRScheduler,
+    CancelToken,
+    TranscriptionCancelled,
+)
+
+
+@pytest.fixture
+def scheduler():
+    sched = ASRScheduler(name="test-asr")
+    yield sched
+    sched.shutdown(wait=True)
+
+
+def _blocker(started: threading.Event, release: threading.Event):
+    def run(_cancel):
+        started.set()
+        release.wait(5.0)
+        return "blocker"
+
+    return run
+
+
+class TestCancelToken:
+    def test_check_raises_after_cancel_and_runs_callbacks(self):
+        token = CancelToken()
+        fired = []
+        token.on_cancel(lambda: fired.append("early"))
+        token.check()
+        token.cancel()
+        token.cancel()
+        token.on_cancel(lambda: fired.append("late"))
+        assert token.cancelled
+        assert fired == ["early", "late"]
+        with pytest.raises(TranscriptionCancelled):
+            token.check()
+
+
+class TestASRScheduler:
+    def test_finals_run_before_earlier_partials(self, scheduler):
+        started, release = threading.Event(), threading.Event()
+        order = []
+        scheduler.submit(_blocker(started, release), priority=PRIORITY_FINAL)
+        assert started.wait(5.0)
+        futures = [
+            scheduler.submit(lambda _c: order.append("partial"), priority=PRIORITY_PARTIAL),
+            scheduler.submit(lambda _c: order.append("speculative"), priority=PRIORITY_SPECULATIVE),
+            scheduler.submit(lambda _c: order.append("final-1"), priority=PRIORITY_FINAL),
+            scheduler.submit(lambda _c: order.append("final-2"), priority=PRIORITY_FINAL),
+        ]
+        release.set()
+        for future in futures:
+            future.result(5.0)
+        assert order == ["final-1", "final-2", "speculative", "partial"]
+
+    def test_final_preempts_running_partial(self, scheduler):
+        started = threading.Event()
+
+        def slow_partial(cancel):
+            started.set()
+            while True:
+                cancel.check()
+                threading.Event().wait(0.005)
+
+        partial = scheduler.submit(slow_partial, priority=PRIORITY_PARTIAL, cancellable=True)
+        assert started.wait(5.0)
+        final = scheduler.submit(lambda _c: "final", priority=PRIORITY_FINAL)
+        assert final.result(5.0) == "final"
+        with pytest.raises(TranscriptionCancelled):
+            partial.result(5.0)
+        assert scheduler.stats()["preempted"] == 1
+
+    def test_non_cancellable_job_is_not_preempted(self, scheduler):
+        started, release = threading.Event(), threading.Event()
+        speculative = scheduler.submit(_blocker(started, release), priority=PRIORITY_SPECULATIVE)
+        assert started.wait(5.0)
+        final = scheduler.submit(lambda _c: "final", priority=PRIORITY_FINAL)
+        release.set()
+        assert speculative.result(5.0) == "blocker"
+        assert final.result(5.0) == "final"
+        assert scheduler.stats()["preempted"] == 0
+
+    def test_new_partial_supersedes_queued_partial(self, scheduler):
+        started, release = threading.Event(), threading.Event()
+        scheduler.submit(_blocker(started, release), priority=PRIORITY_FINAL)
+        assert started.wait(5.0)
+        stale = scheduler.submit(lambda _c: "stale", priority=PRIORITY_PARTIAL, supersede=True)
+        fresh = scheduler.submit(lambda _c: "fresh", priority=PRIORITY_PARTIAL, supersede=True)
+        assert stale.cancelled()
+        release.set()
+        assert fresh.result(5.0) == "fresh"
+        stats = scheduler.stats()
+        assert stats["superseded"] == 1
+        assert stats["queue_wait"]["final"]["count"] == 1
+        assert stats["queue_wait"]["partial"]["count"] == 1
+        assert stats["queued"] == 0
+
+    def test_shutdown_drains_queued_jobs(self):
+        scheduler = ASRScheduler(name="test-asr")
+        started, release = threading.Event(), threading.Event()
+        scheduler.submit(_blocker(started, release), priority=PRIORITY_FINAL)
+        assert started.wait(5.0)
+        pending = scheduler.submit(lambda _c: "pending", priority=PRIORITY_FINAL)
+        release.set()
+        scheduler.shutdown(wait=True)
+        assert pending.result(0) == "pending"
+        with pytest.raises(RuntimeError):
+            scheduler.submit(lambda _c: None, priority=PRIORITY_FINAL)
+
+    def test_queued_batchable_jobs_run_as_one_call(self):
+        scheduler = ASRScheduler(name="test-asr", max_batch=3)
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def runner(items, _cancel):
+            calls.append(list(items))
+            return [item * 10 for item in items]
+
+        try:
+            scheduler.submit(_blocker(started, release), priority=PRIORITY_FINAL)
+            assert started.wait(5.0)
+            futures = [
+                scheduler.submit(lambda _c, i=i: i, priority=PRIORITY_FINAL, batch=(runner, i)) for i in range(4)
+            ]
+            partial = scheduler.submit(lambda _c: "partial", priority=PRIORITY_PARTIAL, batch=(runner, 9))
+            release.set()
+            assert [future.result(5.0) for future in futures] == [0, 10, 20, 3]
+            assert partial.result(5.0) == "partial"
+        finally:
+            scheduler.shutdown(wait=True)
+        # 同级最多 max_batch 个合并；落单的任务与其他级别的任务照常单独执行
+        assert calls == [[0, 1, 2]]
+        stats = scheduler.stats()
+        assert stats["batches"] == 1
+        assert stats["batched_jobs"] == 3
+        assert stats["completed"] == 6
+
+    def test_batch_failure_propagates_to_every_job(self, scheduler):
+        started, release = threading.Event(), threading.Event()
+
+        def runner(_items, _cancel):
+            raise ValueError("boom")
+
+        scheduler.submit(_blocker(started, release), priority=PRIORITY_FINAL)
+        assert started.wait(5.0)
+        futures = [scheduler.submit(lambda _c: None, priority=PRIORITY_FINAL, batch=(runner, i)) for i in range(2)]
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result(5.0)
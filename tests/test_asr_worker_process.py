@@ -0,0 +1,119 @@
+"""Tests for local_asr.asr_worker_process (spawns real child processes)."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from local_asr.asr_scheduler import CancelToken, TranscriptionCancelled
+from local_asr.asr_worker_process import ASRWorkerProcess
+from local_asr.engine_pool import EnginePool
+
+ECHO_FACTORY = f"{__name__}:_EchoEngine"
+
+
+class _EchoEngine:
+    """Child-side fake engine: echoes the audio it received plus session state."""
+
+    def __init__(self, fail: bool = False):
+        if fail:
+            raise ValueError("model missing")
+        self.language = None
+        self.context = ""
+
+    def set_language(self, language):
+        self.language = language
+
+    def set_context(self, text):
+        self.context = text
+
+    def commit_context(self, text):
+        self.context += text
+
+    def reset_session(self):
+        self.context = ""
+
+    def transcribe(self, audio, *, update_context=True, cancel=None):
+        if audio.size and audio[0] < 0:
+            # 负数开头：模拟一次很长的解码，直到被取消
+            while True:
+                cancel.check()
+                time.sleep(0.005)
+        text = f"{audio.size}:{float(audio.sum()):.1f}"
+        if update_context:
+            self.context += text
+        return {"text": text, "context": self.context, "language": self.language}
+
+    def unload(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def worker():
+    proc = ASRWorkerProcess("echo", factory=ECHO_FACTORY, capacity_seconds=0.01, start_timeout=60.0)
+    yield proc
+    proc.shutdown()
+
+
+class TestASRWorkerProcess:
+    def test_transcribe_through_shared_memory_and_inline(self, worker):
+        worker.reset_session()
+        worker.set_language("ja")
+        small = np.full(100, 0.5, dtype=np.float32)
+        result = worker.transcribe(small, update_context=False)
+        assert result == {"text": "100:50.0", "context": "", "language": "ja"}
+        # 超出共享内存容量（160 采样）的音频随命令经管道传递
+        large = np.ones(1000, dtype=np.float32)
+        assert worker.transcribe(large)["text"] == "1000:1000.0"
+
+    def test_session_state_commands_are_ordered(self, worker):
+        worker.reset_session()
+        worker.commit_context("abc")
+        assert worker.transcribe(np.zeros(4, dtype=np.float32), update_context=False)["context"] == "abc"
+        worker.reset_session()
+        assert worker.transcribe(np.zeros(4, dtype=np.float32), update_context=False)["context"] == ""
+
+    def test_cancel_stops_decode_in_child(self, worker):
+        token = CancelToken()
+        errors = []
+
+        def run():
+            try:
+                worker.transcribe(np.full(10, -1.0, dtype=np.float32), cancel=token)
+            except TranscriptionCancelled as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        time.sleep(0.1)
+        token.cancel()
+        thread.join(5.0)
+        assert not thread.is_alive()
+        assert len(errors) == 1
+        # 取消标志在下一次请求前被清除
+        assert worker.transcribe(np.ones(3, dtype=np.float32), cancel=CancelToken())["text"] == "3:3.0"
+
+    def test_load_failure_is_reported(self):
+        with pytest.raises(RuntimeError, match="model missing"):
+            ASRWorkerProcess("echo", factory=ECHO_FACTORY, kwargs={"fail": True}, start_timeout=60.0)
+
+    def test_pool_reuses_live_worker_and_unload_stops_it(self):
+        pool = EnginePool(idle_seconds=600, memory_budget_mb=1024)
+        key = ("echo", True, ())
+
+        def load():
+            return ASRWorkerProcess("echo", factory=ECHO_FACTORY, start_timeout=60.0)
+
+        first = pool.acquire(key, "echo", load)
+        try:
+            first.commit_context("abc")
+            pool.release(first)
+            assert pool.acquire(key, "echo", load) is first
+            assert first.alive
+            assert first.transcribe(np.zeros(2, dtype=np.float32), update_context=False)["context"] == ""
+        finally:
+            pool.shutdown()
+        assert not first.alive
@@ -0,0 +1,138 @@
+"""Tests for audio_bus."""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from audio_bus import AudioBus, POLICY_BLOCK
+from audio_frame import AudioFrame
+
+
+def _frame(value: int) -> AudioFrame:
+    return AudioFrame.from_pcm16(np.full(160, value, dtype=np.int16).tobytes(), 16000)
+
+
+class TestFanOut:
+    def test_subscribers_share_frame_objects(self):
+        bus = AudioBus(capacity=8)
+        a = bus.subscribe('a')
+        b = bus.subscribe('b')
+        seen = []
+        bus.subscribe('cb', callback=seen.append)
+        frame = _frame(1)
+        bus.publish_nowait(frame)
+        assert a.get_nowait().frame is frame
+        assert b.get_nowait().frame is frame
+        assert seen == [frame]
+
+    def test_cursors_are_independent(self):
+        bus = AudioBus(capacity=8)
+        fast = bus.subscribe('fast')
+        slow = bus.subscribe('slow')
+        for value in range(3):
+            bus.publish_nowait(_frame(value), tag=value)
+            assert fast.get_nowait().tag == value
+        assert fast.lag == 0
+        assert slow.lag == 3
+        assert [slow.get_nowait().tag for _ in range(3)] == [0, 1, 2]
+        assert slow.get_nowait() is None
+
+    def test_late_subscriber_sees_only_new_frames(self):
+        bus = AudioBus(capacity=8)
+        bus.publish_nowait(_frame(1))
+        sub = bus.subscribe('late')
+        assert sub.get_nowait() is None
+        bus.publish_nowait(_frame(2), tag='new')
+        assert sub.get_nowait().tag == 'new'
+
+    def test_callback_errors_are_isolated(self):
+        bus = AudioBus(capacity=4)
+
+        def _boom(_frame):
+            raise RuntimeError('boom')
+
+        bad = bus.subscribe('bad', callback=_boom)
+        seen = []
+        bus.subscribe('good', callback=seen.append)
+        bus.publish_nowait(_frame(1))
+        assert bad.errors == 1
+        assert len(seen) == 1
+
+    def test_unsubscribe(self):
+        bus = AudioBus(capacity=4)
+        seen = []
+        sub = bus.subscribe('cb', callback=seen.append)
+        sub.close()
+        bus.publish_nowait(_frame(1))
+        assert seen == []
+        assert bus.subscribers == []
+
+
+class TestBackpressure:
+    def test_drop_oldest_keeps_newest(self):
+        bus = AudioBus(capacity=8)
+        sub = bus.subscribe('asr', max_pending=3)
+        for value in range(5):
+            bus.publish_nowait(_frame(value), tag=value)
+        assert sub.dropped == 2
+        assert sub.max_lag == 3
+        assert [sub.get_nowait().tag for _ in range(3)] == [2, 3, 4]
+
+    def test_max_pending_is_capped_by_capacity(self):
+        bus = AudioBus(capacity=4)
+        sub = bus.subscribe('big', max_pending=100)
+        assert sub.max_pending == 4
+        for value in range(6):
+            bus.publish_nowait(_frame(value), tag=value)
+        assert sub.peek().tag == 2
+
+    def test_block_waits_for_consumer(self):
+        bus = AudioBus(capacity=8)
+        sub = bus.subscribe('lossless', policy=POLICY_BLOCK, max_pending=2, block_timeout=1.0)
+        received = []
+
+        async def _consumer():
+            while len(received) < 5:
+                received.append((await sub.get()).tag)
+                await asyncio.sleep(0.001)
+
+        async def _run():
+            consumer = asyncio.create_task(_consumer())
+            for value in range(5):
+                await bus.publish(_frame(value), tag=value)
+            await asyncio.wait_for(consumer, timeout=1.0)
+
+        asyncio.run(_run())
+        assert received == [0, 1, 2, 3, 4]
+        assert sub.dropped == 0
+        assert sub.blocked_seconds > 0
+
+    def test_block_timeout_bounds_publisher_stall(self):
+        bus = AudioBus(capacity=8)
+        sub = bus.subscribe('stuck', policy=POLICY_BLOCK, max_pending=1, block_timeout=0.01)
+
+        async def _run():
+            for value in range(3):
+                await bus.publish(_frame(value), tag=value)
+
+        asyncio.run(_run())
+        assert sub.overruns == 2
+        assert sub.dropped == 2
+        assert sub.get_nowait().tag == 2
+
+    def test_clear_skips_pending(self):
+        bus = AudioBus(capacity=8)
+        sub = bus.subscribe('asr')
+        for value in range(3):
+            bus.publish_nowait(_frame(value))
+        assert sub.clear() == 3
+        assert sub.get_nowait() is None
+        assert sub.dropped == 0
+
+
+def test_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        AudioBus().subscribe('x', policy='drop_newest')
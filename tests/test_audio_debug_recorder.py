@@ -0,0 +1,82 @@
+"""Tests for audio_debug_recorder."""
+
+from __future__ import annotations
+
+import threading
+import wave
+
+import numpy as np
+
+from audio_debug_recorder import WaveDebugRecorder
+
+
+def _read_frames(path) -> bytes:
+    with wave.open(path, "rb") as wf:
+        return wf.readframes(wf.getnframes())
+
+
+class TestWaveDebugRecorder:
+    def test_blocks_are_written_in_order(self, tmp_path):
+        recorder = WaveDebugRecorder(str(tmp_path), 48000, 16000, file_prefix="t")
+        blocks = [np.full(160, i, dtype=np.int16).tobytes() for i in range(50)]
+        for block in blocks:
+            recorder.write(block)
+        recorder.close()
+
+        assert _read_frames(recorder.file_path) == b"".join(blocks)
+        stats = recorder.stats()
+        assert stats["written_blocks"] == 50
+        assert stats["dropped_blocks"] == 0
+        assert stats["batches"] <= 50
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path):
+        recorder = WaveDebugRecorder(str(tmp_path), 16000, 16000, file_prefix="t", max_queue_blocks=2)
+        # 让后台线程卡在写盘上，模拟磁盘抖动
+        gate = threading.Event()
+        original = recorder._wave.writeframesraw
+
+        def slow_write(data):
+            gate.wait(timeout=2.0)
+            original(data)
+
+        recorder._wave.writeframesraw = slow_write
+        for _ in range(20):
+            recorder.write(b"\x01\x00" * 160)
+        gate.set()
+        recorder.close()
+
+        stats = recorder.stats()
+        assert stats["dropped_blocks"] > 0
+        assert stats["written_blocks"] + stats["dropped_blocks"] == 20
+        assert len(_read_frames(recorder.file_path)) == stats["written_bytes"]
+
+    def test_write_after_close_is_ignored(self, tmp_path):
+        recorder = WaveDebugRecorder(str(tmp_path), 16000, 16000, file_prefix="t")
+        recorder.close()
+        recorder.write(b"\x00\x00")
+        recorder.close()
+        assert _read_frames(recorder.file_path) == b""
+
+    def test_write_error_fails_recorder_without_hanging_close(self, tmp_path):
+        recorder = WaveDebugRecorder(
+            str(tmp_path), 16000, 16000, file_prefix="t", max_queue_blocks=2, close_timeout=2.0
+        )
+
+        def failing_write(data):
+            raise OSError(28, "No space left on device")
+
+        recorder._wave.writeframesraw = failing_write
+        for _ in range(20):
+            recorder.write(b"\x01\x00" * 160)
+
+        closer = threading.Thread(target=recorder.close)
+        closer.start()
+        closer.join(timeout=3.0)
+        assert not closer.is_alive()
+
+        stats = recorder.stats()
+        assert "No space left on device" in stats["error"]
+        assert stats["written_blocks"] == 0
+        assert stats["dropped_blocks"] == 20
+        recorder.write(b"\x00\x00")
+        assert recorder.stats()["dropped_blocks"] == 20
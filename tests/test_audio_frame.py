@@ -0,0 +1,72 @@
+"""Tests for audio_frame."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from audio_frame import AudioFrame, FixedChunker, pcm16_to_float32
+
+
+class TestAudioFrame:
+    def test_from_pcm16_converts_once(self):
+        pcm = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
+        frame = AudioFrame.from_pcm16(pcm, 16000)
+        assert frame.pcm == pcm
+        assert frame.samples.dtype == np.float32
+        np.testing.assert_allclose(frame.samples, [0.0, 0.5, -1.0])
+        assert len(frame) == 3
+        assert frame.duration == pytest.approx(3 / 16000)
+
+    def test_frame_is_immutable(self):
+        frame = AudioFrame.from_pcm16(b"\x00\x00" * 4, 16000)
+        with pytest.raises(ValueError):
+            frame.samples[0] = 1.0
+        with pytest.raises(AttributeError):
+            frame.pcm = b""
+
+    def test_empty_frame_is_falsy(self):
+        assert not AudioFrame.from_pcm16(b"", 16000)
+
+    def test_tail_keeps_newest_samples(self):
+        frame = AudioFrame.from_pcm16(np.arange(6, dtype=np.int16).tobytes(), 16000)
+        tail = frame.tail(2)
+        assert tail.pcm == np.array([4, 5], dtype=np.int16).tobytes()
+        assert np.shares_memory(tail.samples, frame.samples)
+        assert frame.tail(10) is frame
+
+    def test_concat(self):
+        a = AudioFrame.from_pcm16(np.array([1, 2], dtype=np.int16).tobytes(), 16000)
+        b = AudioFrame.from_pcm16(np.array([3], dtype=np.int16).tobytes(), 16000)
+        merged = AudioFrame.concat([a, b])
+        assert merged.pcm == a.pcm + b.pcm
+        np.testing.assert_array_equal(merged.samples, pcm16_to_float32(merged.pcm))
+
+
+class TestFixedChunker:
+    def test_carries_remainder_between_pushes(self):
+        chunker = FixedChunker(4)
+        first = list(chunker.push(np.arange(6, dtype=np.float32)))
+        assert [c.tolist() for c in first] == [[0, 1, 2, 3]]
+        assert chunker.pending.tolist() == [4, 5]
+        second = list(chunker.push(np.arange(6, 13, dtype=np.float32)))
+        assert [c.tolist() for c in second] == [[4, 5, 6, 7], [8, 9, 10, 11]]
+        assert chunker.pending.tolist() == [12]
+
+    def test_full_chunks_are_views(self):
+        samples = np.arange(8, dtype=np.float32)
+        chunks = list(FixedChunker(4).push(samples))
+        assert all(np.shares_memory(chunk, samples) for chunk in chunks)
+
+    def test_short_input_accumulates(self):
+        chunker = FixedChunker(4)
+        assert list(chunker.push(np.ones(1, dtype=np.float32))) == []
+        assert list(chunker.push(np.ones(2, dtype=np.float32))) == []
+        chunks = list(chunker.push(np.ones(2, dtype=np.float32)))
+        assert len(chunks) == 1 and chunker.pending.size == 1
+
+    def test_reset(self):
+        chunker = FixedChunker(4)
+        list(chunker.push(np.ones(3, dtype=np.float32)))
+        chunker.reset()
+        assert chunker.pending.size == 0
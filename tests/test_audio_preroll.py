@@ -0,0 +1,113 @@
+"""Tests for audio_preroll."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from audio_bus import AudioBus
+from audio_frame import AudioFrame
+from audio_preroll import PreRollBuffer
+
+
+def _frame(value: int, samples: int = 1600) -> AudioFrame:
+    return AudioFrame.from_pcm16(np.full(samples, value, dtype=np.int16).tobytes(), 16000)
+
+
+class TestPreRollBuffer:
+    def test_keeps_only_last_duration(self):
+        pre_roll = PreRollBuffer(250, 16000)  # 4000 samples
+        for value in range(1, 5):
+            pre_roll.push(_frame(value))
+        frames = pre_roll.drain()
+        assert sum(len(f) for f in frames) == 4000
+        # 最旧的一帧被截成尾部 800 个采样
+        assert len(frames[0]) == 800
+        assert frames[0].samples[0] == np.float32(2 / 32768)
+        assert frames[0].pcm == np.full(800, 2, dtype=np.int16).tobytes()
+        assert [f.pcm[:2] for f in frames] == [np.int16(v).tobytes() for v in (2, 3, 4)]
+
+    def test_drain_clears_and_counts(self):
+        pre_roll = PreRollBuffer(300, 16000)
+        pre_roll.push(_frame(1))
+        pre_roll.push(_frame(2))
+        assert len(pre_roll.drain()) == 2
+        assert pre_roll.drain() == []
+        stats = pre_roll.stats()
+        assert stats['flushes'] == 1
+        assert stats['replayed_frames'] == 2
+        assert stats['replayed_ms'] == 200
+        assert stats['depth_ms'] == 0
+
+    def test_zero_duration_disables(self):
+        pre_roll = PreRollBuffer(0, 16000)
+        pre_roll.push(_frame(1))
+        assert not pre_roll.enabled
+        assert pre_roll.drain() == []
+
+
+class _ScriptedVad:
+    """Reports speech starting from the n-th processed frame."""
+
+    def __init__(self, onset_frame: int):
+        self.onset_frame = onset_frame
+        self.frames = 0
+        self.last_confidence = 0.0
+
+    @property
+    def is_speaking(self) -> bool:
+        return self.frames >= self.onset_frame
+
+    def process_chunk(self, _chunk, confidence=None):
+        pass
+
+    def reset(self):
+        pass
+
+
+class TestCaptureGateReplay:
+    def test_gate_open_replays_pre_roll_before_live_frame(self):
+        import audio_capture
+        from vad_stream import VADStream
+
+        frames = [_frame(v) for v in range(1, 7)]
+        vad = _ScriptedVad(onset_frame=5)
+
+        state = MagicMock()
+        state.stop_event = asyncio.Event()
+        state.recognition_active = True
+        state.audio_send_generation = 1
+        state.vad_enabled = True
+        state.vad_stream = VADStream(vad)
+        state._vad_was_speaking = False
+        state.vad_pre_roll = PreRollBuffer(200, 16000)
+        state.audio_bus = AudioBus()
+        state.speech_bus = AudioBus()
+
+        sent = []
+
+        async def fake_read_audio_data(_state):
+            if vad.frames >= len(frames):
+                state.stop_event.set()
+                await asyncio.sleep(0.05)
+                return None
+            frame = frames[vad.frames]
+            vad.frames += 1
+            return frame
+
+        async def fake_send(_state, _recognizer, frame):
+            sent.append(frame)
+
+        async def _test():
+            with patch("audio_capture.read_audio_data", side_effect=fake_read_audio_data), \
+                    patch("audio_capture.send_audio_frame_async", side_effect=fake_send):
+                await asyncio.wait_for(audio_capture.audio_capture_task(state, MagicMock()), timeout=1.0)
+
+        asyncio.run(_test())
+
+        # 第 5 帧起声：先补发第 3、4 帧（200ms），再发实时的第 5、6 帧
+        sent_pcm = b''.join(f.pcm for f in sent)
+        assert sent_pcm == b''.join(frames[v - 1].pcm for v in (3, 4, 5, 6))
+        assert state.vad_pre_roll.stats()['flushes'] == 1
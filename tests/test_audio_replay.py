@@ -0,0 +1,91 @@
+"""Tests for audio_replay."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import wave
+
+import numpy as np
+import pytest
+
+from audio_replay import ReplayRecognizer, WavReplayStream, load_wav_pcm16, run_replay
+
+
+def _write_wav(path, frames: np.ndarray, rate: int, width: int = 2) -> None:
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(frames.shape[1])
+        wf.setsampwidth(width)
+        wf.setframerate(rate)
+        if width == 2:
+            wf.writeframes(frames.astype("<i2").tobytes())
+        else:
+            # 24-bit: 低字节补零
+            raw = frames.astype("<i4").reshape(-1) << 8
+            wf.writeframes(b"".join(int(v).to_bytes(4, "little", signed=True)[:3] for v in raw))
+
+
+class TestLoadWav:
+    def test_stereo_16bit(self, tmp_path):
+        frames = np.array([[1, -1], [2, -2], [3, -3]], dtype=np.int16)
+        _write_wav(tmp_path / "a.wav", frames, 48000)
+        loaded, rate = load_wav_pcm16(tmp_path / "a.wav")
+        assert rate == 48000
+        assert np.array_equal(loaded, frames)
+
+    def test_24bit_is_truncated_to_16bit(self, tmp_path):
+        frames = np.array([[1000], [-1000], [32767], [-32768]], dtype=np.int16)
+        _write_wav(tmp_path / "b.wav", frames, 44100, width=3)
+        loaded, _ = load_wav_pcm16(tmp_path / "b.wav")
+        assert np.array_equal(loaded, frames)
+
+
+class TestWavReplayStream:
+    def test_reads_full_blocks_and_pads_tail(self):
+        stream = WavReplayStream(np.arange(10, dtype=np.int16).reshape(-1, 2), 16000, speed=0)
+        assert stream.read(3, exception_on_overflow=False) == np.arange(6, dtype=np.int16).tobytes()
+        tail = np.frombuffer(stream.read(3, exception_on_overflow=False), dtype=np.int16)
+        assert tail.tolist() == [6, 7, 8, 9, 0, 0]
+        assert stream.read(3) == b""
+        assert stream.stats()["frames_read"] == 5
+
+    def test_realtime_pacing(self):
+        stream = WavReplayStream(np.zeros((1600, 1), dtype=np.int16), 16000, speed=1.0)
+        t0 = time.perf_counter()
+        while stream.read(400, exception_on_overflow=False):
+            pass
+        assert time.perf_counter() - t0 >= 0.09
+
+    def test_slow_consumer_overflows(self):
+        stream = WavReplayStream(
+            np.zeros((16000, 1), dtype=np.int16), 16000, speed=1.0, device_buffer_seconds=0.05,
+        )
+        stream.read(160, exception_on_overflow=False)
+        time.sleep(0.2)
+        with pytest.raises(IOError):
+            stream.read(160)
+        stats = stream.stats()
+        assert stats["overflows"] == 1
+        assert stats["dropped_frames"] > 0
+
+    def test_stop_ends_stream(self):
+        stream = WavReplayStream(np.zeros((100, 1), dtype=np.int16), 16000, speed=0)
+        stream.stop_stream()
+        assert stream.read(10) == b""
+
+
+class TestRunReplay:
+    def test_48k_stereo_drives_downmix_and_resampler(self):
+        t = np.arange(48000) / 48000.0
+        tone = np.rint(8000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+        stream = WavReplayStream(np.stack([tone, tone], axis=1), 48000, speed=0)
+        recognizer = ReplayRecognizer()
+
+        report = asyncio.run(run_replay(stream, recognizer=recognizer))
+
+        data = report.to_dict()
+        assert data["source"]["dropped_frames"] == 0
+        assert data["stages"]["process"]["calls"] == 10
+        assert 0 < recognizer.bytes_received <= 16000 * 2
+        assert data["send"]["queue_dropped_frames"] == 0
+        assert data["send"]["queue_high_water"] >= 1
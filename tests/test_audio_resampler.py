@@ -0,0 +1,91 @@
+"""Tests for audio_resampler."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from audio_resampler import AudioResampler
+
+
+def _tone(freq: float, rate: int, seconds: float, amplitude: float = 0.5) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / float(rate)
+    return np.rint(amplitude * 32767 * np.sin(2 * np.pi * freq * t)).astype(np.int16)
+
+
+def _rms(samples: np.ndarray) -> float:
+    body = samples.astype(np.float64)
+    return float(np.sqrt(np.mean(body * body)))
+
+
+class TestEngineSelection:
+    def test_auto_uses_fir_for_integer_downsample(self):
+        assert AudioResampler(48000, 16000).engine == 'fir'
+
+    def test_auto_falls_back_to_soxr_for_fractional_ratio(self):
+        assert AudioResampler(44100, 16000).engine == 'soxr'
+
+    def test_explicit_fir_rejects_fractional_ratio(self):
+        with pytest.raises(ValueError):
+            AudioResampler(44100, 16000, engine='fir')
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            AudioResampler(48000, 16000, engine='sinc')
+
+
+class TestFirDecimator:
+    def test_blockwise_matches_one_shot(self):
+        x = _tone(1000, 48000, 1.0)
+        one_shot = AudioResampler(48000, 16000, engine='fir').resample_array(x)
+        streamed = AudioResampler(48000, 16000, engine='fir')
+        parts = [streamed.resample_array(x[i:i + 1234]) for i in range(0, len(x), 1234)]
+        assert np.array_equal(one_shot, np.concatenate(parts))
+        assert len(one_shot) == 16000
+
+    def test_passband_gain_is_unity(self):
+        y = AudioResampler(48000, 16000, engine='fir').resample_array(_tone(1000, 48000, 1.0))
+        x_ref = _tone(1000, 16000, 1.0)
+        ratio = _rms(y[4000:-4000]) / _rms(x_ref[4000:-4000])
+        assert abs(ratio - 1.0) < 1e-3
+
+    def test_rejects_aliasing_tone(self):
+        # 12 kHz 在 16k 输出下会折叠到 4 kHz，应被低通滤除
+        y = AudioResampler(48000, 16000, engine='fir').resample_array(_tone(12000, 48000, 1.0))
+        assert _rms(y[4000:-4000]) < 1.0
+
+    def test_stereo_channels_are_independent(self):
+        left = _tone(1000, 48000, 0.5)
+        stereo = np.stack([left, np.zeros_like(left)], axis=1).reshape(-1)
+        y = AudioResampler(48000, 16000, channels=2, engine='fir').resample_array(stereo)
+        frames = y.reshape(-1, 2)
+        assert _rms(frames[:, 0]) > 1000
+        assert not frames[:, 1].any()
+
+    def test_writes_into_caller_buffer(self):
+        resampler = AudioResampler(48000, 16000, engine='fir')
+        x = _tone(1000, 48000, 0.1)
+        out = np.empty(resampler.max_output_frames(len(x)), dtype=np.int16)
+        y = resampler.resample_array(x, out=out)
+        assert np.shares_memory(y, out)
+        assert len(y) == 1600
+
+    def test_reset_clears_history(self):
+        resampler = AudioResampler(48000, 16000, engine='fir')
+        x = _tone(1000, 48000, 0.1)
+        first = resampler.resample_array(x).copy()
+        resampler.reset()
+        assert np.array_equal(resampler.resample_array(x), first)
+
+
+class TestResampleBytes:
+    def test_bytes_roundtrip_length(self):
+        data = _tone(440, 48000, 0.1).tobytes()
+        for engine in ('fir', 'soxr'):
+            out = AudioResampler(48000, 16000, engine=engine).resample(data)
+            assert isinstance(out, bytes)
+            assert abs(len(out) // 2 - 1600) <= 16
+
+    def test_same_rate_passthrough(self):
+        data = _tone(440, 16000, 0.1).tobytes()
+        assert AudioResampler(16000, 16000).resample(data) is data
@@ -0,0 +1,115 @@
+"""Tests for audio_ring_buffer."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from audio_ring_buffer import AudioRingBuffer
+
+
+def _pcm(values, channels: int = 1) -> bytes:
+    return np.asarray(values, dtype=np.int16).reshape(-1, channels).tobytes()
+
+
+class TestAudioRingBuffer:
+    def test_read_returns_none_until_block_available(self):
+        ring = AudioRingBuffer(capacity_frames=8)
+        ring.write(_pcm([1, 2, 3]))
+        assert ring.read(4) is None
+        assert ring.depth == 3
+        ring.write(_pcm([4]))
+        assert ring.read(4) == _pcm([1, 2, 3, 4])
+        assert ring.depth == 0
+
+    def test_wrap_around_preserves_order(self):
+        ring = AudioRingBuffer(capacity_frames=5)
+        ring.write(_pcm([1, 2, 3, 4]))
+        assert ring.read(3) == _pcm([1, 2, 3])
+        ring.write(_pcm([5, 6, 7]))
+        assert ring.read(4) == _pcm([4, 5, 6, 7])
+
+    def test_overrun_drops_oldest_and_counts(self):
+        ring = AudioRingBuffer(capacity_frames=4)
+        ring.write(_pcm([1, 2, 3]))
+        ring.write(_pcm([4, 5, 6]))
+        stats = ring.stats()
+        assert stats['overruns'] == 1
+        assert stats['dropped_frames'] == 2
+        assert stats['max_depth_frames'] == 4
+        assert ring.read(4) == _pcm([3, 4, 5, 6])
+
+    def test_write_larger_than_capacity_keeps_newest(self):
+        ring = AudioRingBuffer(capacity_frames=3)
+        ring.write(_pcm([1, 2, 3, 4, 5]))
+        assert ring.read(3) == _pcm([3, 4, 5])
+        assert ring.stats()['dropped_frames'] == 2
+
+    def test_multichannel_frames(self):
+        ring = AudioRingBuffer(capacity_frames=4, channels=2)
+        ring.write(_pcm([1, -1, 2, -2, 3, -3], channels=2))
+        assert ring.read(2) == _pcm([1, -1, 2, -2], channels=2)
+        assert ring.depth == 1
+
+    def test_notifier_fires_once_block_is_ready(self):
+        calls = []
+        ring = AudioRingBuffer(capacity_frames=16)
+        ring.set_notifier(lambda: calls.append(ring.depth), min_frames=4)
+        ring.write(_pcm([0, 0]))
+        assert calls == []
+        ring.write(_pcm([0, 0]))
+        assert calls == [4]
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            AudioRingBuffer(capacity_frames=0)
+
+
+class TestCaptureRingRead:
+    """The callback-mode reader waits on the ring's wakeup, not on a poll."""
+
+    def _state(self, loop_event):
+        ring = AudioRingBuffer(capacity_frames=64)
+        state = SimpleNamespace(
+            capture_ring=ring,
+            capture_ready_event=loop_event,
+            input_block_size=4,
+            audio_closing=False,
+            stream=object(),
+            debug_pre_audio_recorder=None,
+            capture_channels=1,
+            resampler=None,
+        )
+        return state, ring
+
+    def test_wakes_on_write_from_callback_thread(self):
+        import audio_capture
+
+        async def _run():
+            loop = asyncio.get_running_loop()
+            event = asyncio.Event()
+            state, ring = self._state(event)
+            ring.set_notifier(lambda: loop.call_soon_threadsafe(event.set), min_frames=4)
+            timer = threading.Timer(0.02, ring.write, args=(_pcm([1, 2, 3, 4]),))
+            timer.start()
+            frame = await audio_capture._read_from_capture_ring(state)
+            timer.join()
+            return frame
+
+        frame = asyncio.run(_run())
+        assert frame.pcm == _pcm([1, 2, 3, 4])
+
+    def test_returns_empty_after_timeout(self, monkeypatch):
+        import audio_capture
+
+        monkeypatch.setattr(audio_capture, 'CALLBACK_READ_TIMEOUT_SECONDS', 0.01)
+
+        async def _run():
+            state, _ring = self._state(asyncio.Event())
+            return await audio_capture._read_from_capture_ring(state)
+
+        assert asyncio.run(_run()) == b''
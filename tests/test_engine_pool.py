@@ -0,0 +1,152 @@
+"""Tests for local_asr.engine_pool."""
+
+from __future__ import annotations
+
+import pytest
+
+from local_asr.engine_pool import EnginePool
+
+MB = 1024 * 1024
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeEngine:
+    def __init__(self, name):
+        self.name = name
+        self.resets = 0
+        self.unloaded = False
+
+    def reset_session(self):
+        self.resets += 1
+
+    def unload(self):
+        self.unloaded = True
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+def _pool(clock, idle=60, budget=1000):
+    return EnginePool(idle_seconds=idle, memory_budget_mb=budget, clock=clock)
+
+
+def _acquire(pool, name, size_mb=100, key=None):
+    return pool.acquire(key or (name,), name, lambda: _FakeEngine(name), size_bytes=size_mb * MB)
+
+
+class TestEnginePool:
+    def test_released_engine_is_reused_with_session_reset(self, clock):
+        pool = _pool(clock)
+        engine = _acquire(pool, "sensevoice")
+        pool.release(engine)
+        assert engine.resets == 1 and not engine.unloaded
+        assert _acquire(pool, "sensevoice") is engine
+        metrics = pool.stats("sensevoice")["metrics"]
+        assert metrics["loads"] == 1
+        assert metrics["reuses"] == 1
+        assert metrics["last_load_ms"] is not None
+
+    def test_engine_in_use_is_not_shared(self, clock):
+        pool = _pool(clock)
+        first = _acquire(pool, "sensevoice")
+        second = _acquire(pool, "sensevoice")
+        assert second is not first
+        assert pool.stats("sensevoice")["metrics"]["loads"] == 2
+
+    def test_idle_engine_is_evicted_after_timeout(self, clock):
+        pool = _pool(clock, idle=60)
+        engine = _acquire(pool, "qwen3-asr")
+        pool.release(engine)
+        clock.now += 30
+        assert pool.sweep() == 0
+        clock.now += 31
+        assert pool.sweep() == 1
+        assert engine.unloaded
+        stats = pool.stats("qwen3-asr")
+        assert stats["metrics"]["evictions"]["idle"] == 1
+        assert stats["engines"] == []
+        assert _acquire(pool, "qwen3-asr") is not engine
+
+    def test_zero_idle_unloads_on_release(self, clock):
+        pool = _pool(clock, idle=0)
+        engine = _acquire(pool, "sensevoice")
+        pool.release(engine)
+        assert engine.unloaded
+
+    def test_memory_budget_evicts_least_recently_used_idle_engine(self, clock):
+        pool = _pool(clock, budget=1000)
+        old = _acquire(pool, "sensevoice", size_mb=300)
+        pool.release(old)
+        clock.now += 1
+        other = _acquire(pool, "sensevoice", size_mb=300, key=("sensevoice", "other"))
+        pool.release(other)
+        clock.now += 1
+        # 再加载 500MB 超出预算：只需卸掉最久未用的那个空闲引擎
+        _acquire(pool, "qwen3-asr", size_mb=500)
+        assert old.unloaded
+        assert not other.unloaded
+        assert pool.stats("sensevoice")["metrics"]["evictions"]["memory"] == 1
+        assert pool.stats()["resident_mb"] == 800.0
+
+    def test_engine_not_from_pool_is_unloaded_on_release(self, clock):
+        pool = _pool(clock)
+        stray = _FakeEngine("x")
+        pool.release(stray)
+        assert stray.unloaded and stray.resets == 0
+
+    def test_shutdown_unloads_everything(self, clock):
+        pool = _pool(clock)
+        busy = _acquire(pool, "sensevoice")
+        idle = _acquire(pool, "qwen3-asr")
+        pool.release(idle)
+        pool.shutdown()
+        assert busy.unloaded and idle.unloaded
+        assert pool.stats()["metrics"]["sensevoice"]["evictions"]["shutdown"] == 1
+
+    def test_dead_worker_is_replaced_instead_of_reused(self, clock):
+        pool = _pool(clock)
+        engine = _acquire(pool, "sensevoice")
+        engine.alive = True
+        pool.release(engine)
+        # 子进程崩溃：代理仍在池里，但不能再交给下一次会话
+        engine.alive = False
+        fresh = _acquire(pool, "sensevoice")
+        assert fresh is not engine
+        assert engine.unloaded
+        metrics = pool.stats("sensevoice")["metrics"]
+        assert metrics["loads"] == 2
+        assert metrics["reuses"] == 0
+        assert metrics["evictions"]["dead"] == 1
+
+    def test_engine_dead_at_release_is_unloaded(self, clock):
+        pool = _pool(clock)
+        engine = _acquire(pool, "sensevoice")
+        engine.alive = False
+        pool.release(engine)
+        assert engine.unloaded and engine.resets == 0
+        assert pool.stats("sensevoice")["engines"] == []
+
+    def test_engine_over_budget_stays_warm_with_warning(self, clock, caplog):
+        pool = _pool(clock, budget=100)
+        with caplog.at_level("WARNING", logger="local_asr.engine_pool"):
+            engine = _acquire(pool, "qwen3-asr", size_mb=300)
+            pool.release(engine)
+            assert _acquire(pool, "qwen3-asr", size_mb=300) is engine
+            pool.release(engine)
+        assert not engine.unloaded
+        warnings = [r for r in caplog.records if r.levelname == "WARNING"]
+        assert len(warnings) == 1
+        assert "100 MB" in warnings[0].getMessage()
+        # 换别的模型时照常按预算腾出空间
+        _acquire(pool, "sensevoice", size_mb=50)
+        assert engine.unloaded
+        assert pool.stats("qwen3-asr")["metrics"]["evictions"]["memory"] == 1
@@ -0,0 +1,154 @@
+"""Tests for latency_trace and its OSC send hooks."""
+
+from __future__ import annotations
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import latency_trace
+from latency_trace import LatencyTracer
+
+
+class TestLatencyTracer:
+    def test_current_is_reused_until_detached(self):
+        tracer = LatencyTracer()
+        first = tracer.current()
+        assert tracer.current() == first
+        assert tracer.detach() == first
+        assert tracer.current() != first
+
+    def test_current_without_create(self):
+        tracer = LatencyTracer()
+        assert tracer.current(create=False) is None
+
+    def test_first_mark_wins(self):
+        tracer = LatencyTracer()
+        tid = tracer.current()
+        with patch('latency_trace.time.monotonic', side_effect=[10.0, 10.5, 11.0]):
+            tracer.mark(tid, 'speech_start')
+            tracer.mark(tid, 'asr_final')
+            tracer.mark(tid, 'asr_final')
+        tracer.finish(tid)
+        stages = tracer.recent()[-1]['stages_ms']
+        assert stages == {'speech_start': 0.0, 'asr_final': 500.0}
+
+    def test_summary_intervals(self):
+        tracer = LatencyTracer()
+        tid = tracer.current()
+        times = iter([0.0, 1.0, 1.2, 1.5, 1.6])
+        with patch('latency_trace.time.monotonic', side_effect=lambda: next(times)):
+            for stage in ('speech_end', 'asr_final', 'mt_request', 'mt_response', 'osc_sent'):
+                tracer.mark(tid, stage)
+        tracer.finish(tid)
+        metrics = tracer.summary()['metrics']
+        assert round(metrics['speech_end_to_osc']['p50_ms']) == 1600
+        assert round(metrics['asr_final_to_osc']['p50_ms']) == 600
+        assert round(metrics['mt_roundtrip']['p50_ms']) == 300
+        assert sum(metrics['osc_sent']['histogram']) == 1
+
+    def test_disabled_is_noop(self):
+        tracer = LatencyTracer(enabled=False)
+        assert tracer.current() is None
+        tracer.mark(1, 'asr_final')
+        tracer.finish(1)
+        assert tracer.summary()['completed'] == 0
+
+    def test_stale_traces_expire_as_incomplete(self):
+        tracer = LatencyTracer(stale_seconds=5.0)
+        with patch('latency_trace.time.monotonic', return_value=100.0):
+            stale = tracer.current()
+            tracer.detach()
+        with patch('latency_trace.time.monotonic', return_value=200.0):
+            tracer.current()
+        summary = tracer.summary()
+        assert summary['incomplete'] == 1
+        assert summary['inflight'] == 1
+        assert tracer.recent()[-1]['trace_id'] == stale
+        assert tracer.recent()[-1]['status'] == 'incomplete'
+
+    def test_expired_traces_are_exported_outside_the_lock(self, tmp_path):
+        tracer = LatencyTracer(stale_seconds=5.0, export_path=str(tmp_path / 'latency.jsonl'))
+        exported = []
+
+        def export(record):
+            assert not tracer._lock.locked()
+            exported.append(record)
+
+        tracer._export = export
+        with patch('latency_trace.time.monotonic', return_value=100.0):
+            stale = tracer.current()
+            tracer.detach()
+        with patch('latency_trace.time.monotonic', return_value=200.0):
+            tracer.current()
+        assert [record['trace_id'] for record in exported] == [stale]
+        assert exported[0]['status'] == 'incomplete'
+
+    def test_recent_with_non_positive_limit_is_empty(self):
+        tracer = LatencyTracer()
+        for _ in range(3):
+            tracer.finish(tracer.current())
+        assert len(tracer.recent(2)) == 2
+        assert tracer.recent(0) == []
+        assert tracer.recent(-1) == []
+
+    def test_export_jsonl(self, tmp_path):
+        path = tmp_path / 'traces' / 'latency.jsonl'
+        tracer = LatencyTracer(export_path=str(path))
+        for _ in range(2):
+            tid = tracer.current()
+            tracer.mark(tid, 'asr_final', backend='test')
+            tracer.finish(tid)
+        lines = path.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 2
+        record = json.loads(lines[0])
+        assert record['status'] == 'ok'
+        assert record['attrs'] == {'backend': 'test'}
+
+
+class TestOscHooks:
+    @pytest.fixture
+    def manager(self):
+        from osc_manager import OSCManager
+
+        manager = OSCManager()
+        saved_last_send = manager._last_send_time
+        with patch.object(manager, 'get_udp_client', return_value=MagicMock()), \
+                patch.object(OSCManager, '_compat_mode_enabled', return_value=False), \
+                patch.object(manager, '_prepare_outgoing_text_for_osc', side_effect=lambda text: text):
+            yield manager
+        with manager._state_lock:
+            if manager._pending_timer is not None:
+                manager._pending_timer.cancel()
+                manager._pending_timer = None
+            manager._pending_message = None
+            manager._last_send_time = saved_last_send
+
+    def test_final_send_finishes_trace(self, manager):
+        tracer = LatencyTracer()
+        manager._last_send_time = 0.0
+        tid = tracer.current()
+        with patch('osc_manager.latency_tracer', tracer):
+            manager.send_text_sync('hello', ongoing=False, trace_id=tid)
+        record = tracer.recent()[-1]
+        assert record['status'] == 'ok'
+        assert {'osc_enqueued', 'osc_sent'} <= set(record['stages_ms'])
+
+    def test_replaced_pending_message_is_superseded(self, manager):
+        tracer = LatencyTracer()
+        manager._last_send_time = time.time() + 60  # 冷却中，消息只能排队
+        first = tracer.current()
+        tracer.detach()
+        second = tracer.current()
+        with patch('osc_manager.latency_tracer', tracer):
+            manager.send_text_sync('one', ongoing=False, trace_id=first)
+            manager.send_text_sync('two', ongoing=False, trace_id=second)
+        record = tracer.recent()[-1]
+        assert (record['trace_id'], record['status']) == (first, 'superseded')
+        assert manager._pending_message.trace_id == second
+
+
+def test_module_singleton_respects_config():
+    assert latency_trace.latency_tracer.window == latency_trace.config.LATENCY_TRACE_WINDOW
@@ -0,0 +1,260 @@
+"""Tests for speech_recognizers.local_speech_recognizer."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+import config
+from speech_recognizers.local_speech_recognizer import LocalSpeechRecognizer, _merge_window_text
+
+CHUNK = 512
+
+
+class _GatedEngine:
+    """Fake ASR engine: records decoded lengths, blocks until released."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def transcribe(self, audio):
+        self.calls.append(len(audio))
+        self.release.wait(5.0)
+        return {"text": f"t{len(audio)}"}
+
+    def unload(self):
+        pass
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def recognizer(monkeypatch):
+    monkeypatch.setattr(config, "LOCAL_INCREMENTAL_ASR", False)
+    callback = MagicMock()
+    rec = LocalSpeechRecognizer(callback)
+    rec._engine = _GatedEngine()
+    rec._running = True
+    yield rec
+    rec._engine.release.set()
+    if rec._scheduler is not None:
+        rec._scheduler.shutdown(wait=True)
+
+
+def _feed(rec, confidence: float, chunks: int) -> None:
+    with rec._lock:
+        for _ in range(chunks):
+            rec._process_chunk(np.full(CHUNK, 0.1, dtype=np.float32), confidence)
+
+
+def _results(rec, is_final: bool):
+    return [
+        call.args[0].text for call in rec._callback.on_result.call_args_list
+        if call.args[0].is_final == is_final
+    ]
+
+
+class TestSpeculativeFinal:
+    def test_speculation_becomes_final_without_second_decode(self, recognizer):
+        engine = recognizer._engine
+        _feed(recognizer, 0.9, 40)
+        _feed(recognizer, 0.0, 1)
+        _wait_for(lambda: len(engine.calls) == 1)
+        speculative_len = engine.calls[0]
+        assert speculative_len == 41 * CHUNK
+
+        engine.release.set()
+        _feed(recognizer, 0.0, recognizer._vad._silence_limit)
+        _wait_for(lambda: _results(recognizer, True))
+        assert _results(recognizer, True) == [f"t{speculative_len}"]
+        assert engine.calls == [speculative_len]
+
+    def test_resumed_speech_reuses_speculation_as_partial(self, recognizer):
+        engine = recognizer._engine
+        _feed(recognizer, 0.9, 40)
+        _feed(recognizer, 0.0, 1)
+        _wait_for(lambda: len(engine.calls) == 1)
+        _feed(recognizer, 0.9, 10)
+
+        engine.release.set()
+        _wait_for(lambda: _results(recognizer, False))
+        assert _results(recognizer, False) == [f"t{41 * CHUNK}"]
+
+        _feed(recognizer, 0.0, 1)
+        _wait_for(lambda: len(engine.calls) == 2)
+        _feed(recognizer, 0.0, recognizer._vad._silence_limit - 1)
+        _wait_for(lambda: _results(recognizer, True))
+        # 重新说话后再次停顿时又发起一次推测，最终结果来自它而不是第一次
+        assert len(engine.calls) == 2
+        assert _results(recognizer, True) == [f"t{engine.calls[1]}"]
+        assert engine.calls[1] == 52 * CHUNK
+
+    def test_disabled_decodes_only_after_silence(self, recognizer, monkeypatch):
+        monkeypatch.setattr(config, "LOCAL_SPECULATIVE_FINAL", False)
+        engine = recognizer._engine
+        engine.release.set()
+        _feed(recognizer, 0.9, 40)
+        _feed(recognizer, 0.0, 1)
+        time.sleep(0.05)
+        assert engine.calls == []
+        _feed(recognizer, 0.0, recognizer._vad._silence_limit - 1)
+        _wait_for(lambda: _results(recognizer, True))
+        assert engine.calls == [(40 + recognizer._vad._silence_limit) * CHUNK]
+
+
+class TestLongUtteranceWindows:
+    def test_merge_drops_overlap_prefix(self):
+        assert _merge_window_text("今天天气很好我们去", "我们去公园散步") == "公园散步"
+        assert _merge_window_text("the quick brown fox", "brown fox jumps over") == "jumps over"
+        assert _merge_window_text("完全不同的内容", "另一句话") == "另一句话"
+        assert _merge_window_text("", "第一窗") == "第一窗"
+
+    def test_long_speech_is_windowed_not_zeroed(self, recognizer, monkeypatch):
+        monkeypatch.setattr(config, "LOCAL_VAD_MAX_SPEECH_DURATION", 2.0)
+        monkeypatch.setattr(config, "LOCAL_SPECULATIVE_FINAL", False)
+        engine = recognizer._engine
+        engine.release.set()
+        window_chunks = recognizer._window_samples() // CHUNK + 1
+        _feed(recognizer, 0.9, window_chunks)
+        _wait_for(lambda: len(engine.calls) == 1)
+        assert engine.calls[0] <= window_chunks * CHUNK
+        # 切出的窗口立即作为最终结果交出，缓冲保留重叠部分继续累积
+        _wait_for(lambda: len(_results(recognizer, True)) == 1)
+        assert recognizer._vad._speech_samples < window_chunks * CHUNK
+
+        _feed(recognizer, 0.9, 10)
+        _feed(recognizer, 0.0, recognizer._vad._silence_limit)
+        _wait_for(lambda: len(_results(recognizer, True)) == 2)
+        assert len(engine.calls) == 2
+        assert all(call > 0 for call in engine.calls)
+
+
+class _CancellableEngine(_GatedEngine):
+    """Like _GatedEngine, but honours the scheduler's cancel token."""
+
+    def __init__(self):
+        super().__init__()
+        self.cancelled = 0
+
+    def transcribe(self, audio, *, cancel=None):
+        self.calls.append(len(audio))
+        while not self.release.wait(0.005):
+            if cancel is not None and cancel.cancelled:
+                self.cancelled += 1
+                cancel.check()
+        return {"text": f"t{len(audio)}"}
+
+
+class TestPriorityScheduling:
+    def test_final_preempts_inflight_partial(self, recognizer):
+        engine = recognizer._engine = _CancellableEngine()
+        recognizer._enqueue_transcribe(np.zeros(20 * CHUNK, dtype=np.float32), is_final=False)
+        _wait_for(lambda: len(engine.calls) == 1)
+        recognizer._enqueue_transcribe(np.zeros(30 * CHUNK, dtype=np.float32), is_final=True)
+        _wait_for(lambda: engine.cancelled == 1)
+        engine.release.set()
+        _wait_for(lambda: _results(recognizer, True))
+        assert _results(recognizer, True) == [f"t{30 * CHUNK}"]
+        assert _results(recognizer, False) == []
+        stats = recognizer.get_scheduler_stats()
+        assert stats["preempted"] == 1
+        assert stats["queue_wait"]["final"]["count"] == 1
+
+    def test_final_drops_queued_partial(self, recognizer):
+        engine = recognizer._engine
+        recognizer._enqueue_transcribe(np.zeros(10 * CHUNK, dtype=np.float32), is_final=True)
+        _wait_for(lambda: len(engine.calls) == 1)
+        recognizer._enqueue_transcribe(np.zeros(20 * CHUNK, dtype=np.float32), is_final=False)
+        recognizer._enqueue_transcribe(np.zeros(30 * CHUNK, dtype=np.float32), is_final=True)
+        engine.release.set()
+        _wait_for(lambda: len(_results(recognizer, True)) == 2)
+        assert engine.calls == [10 * CHUNK, 30 * CHUNK]
+
+
+class _BatchEngine(_GatedEngine):
+    """_GatedEngine plus transcribe_batch, recording each batch's lengths."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def transcribe_batch(self, audios):
+        self.batches.append([len(audio) for audio in audios])
+        return [{"text": f"t{len(audio)}"} for audio in audios]
+
+
+class TestBatchedFinals:
+    def test_queued_finals_share_one_batch(self, recognizer):
+        engine = recognizer._engine = _BatchEngine()
+        recognizer._enqueue_transcribe(np.zeros(10 * CHUNK, dtype=np.float32), is_final=False)
+        _wait_for(lambda: len(engine.calls) == 1)
+        for chunks in (20, 30, 40):
+            recognizer._enqueue_transcribe(np.zeros(chunks * CHUNK, dtype=np.float32), is_final=True)
+        engine.release.set()
+        _wait_for(lambda: len(_results(recognizer, True)) == 3)
+        # 识别跟不上时排队的三句终句一次推理完成，结果按原顺序发出
+        assert engine.batches == [[20 * CHUNK, 30 * CHUNK, 40 * CHUNK]]
+        assert _results(recognizer, True) == [f"t{n * CHUNK}" for n in (20, 30, 40)]
+        assert recognizer.get_scheduler_stats()["batched_jobs"] == 3
+
+
+class TestStartupTiming:
+    def test_start_records_engine_ready_and_first_result(self, recognizer):
+        from local_asr import model_manager
+
+        recognizer._running = False
+        recognizer.start()
+        try:
+            startup = model_manager._ENGINE_STARTUP[recognizer._engine_name]
+            assert startup["engine_ready_ms"] >= 0.0
+            assert startup["first_result_ms"] is None
+            recognizer._emit_result("hello", is_final=False)
+            first = startup["first_result_ms"]
+            assert first is not None and first >= 0.0
+            recognizer._emit_result("hello world", is_final=True)
+            assert startup["first_result_ms"] == first
+        finally:
+            recognizer._running = False
+            recognizer._worker.join(5.0)
+
+
+class TestWarmEnginePool:
+    def test_stop_keeps_engine_warm_for_next_start(self, monkeypatch):
+        from local_asr.engine_pool import EnginePool
+        from speech_recognizers import local_speech_recognizer as module
+
+        pool = EnginePool(idle_seconds=600, memory_budget_mb=4096)
+        loads = []
+
+        def load(_self, _use_worker):
+            loads.append(_GatedEngine())
+            loads[-1].set_language = lambda _language: None
+            return loads[-1]
+
+        monkeypatch.setattr(module, "get_engine_pool", lambda: pool)
+        monkeypatch.setattr(module, "is_asr_cached", lambda _engine: True)
+        monkeypatch.setattr(module, "estimate_engine_memory_bytes", lambda _engine: 0)
+        monkeypatch.setattr(LocalSpeechRecognizer, "_load_engine", load)
+        monkeypatch.setattr(config, "LOCAL_ASR_WORKER_PROCESS", False)
+
+        try:
+            for _ in range(2):
+                rec = LocalSpeechRecognizer(MagicMock())
+                rec.start()
+                rec.stop()
+            assert len(loads) == 1
+            metrics = pool.stats(rec._engine_name)["metrics"]
+            assert metrics["loads"] == 1 and metrics["reuses"] == 1
+        finally:
+            pool.shutdown()
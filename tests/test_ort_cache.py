@@ -0,0 +1,129 @@
+"""Tests for local_asr.ort_cache (uses the bundled Silero ONNX model)."""
+
+from __future__ import annotations
+
+import json
+import shutil
+
+import numpy as np
+import pytest
+
+ort = pytest.importorskip("onnxruntime")
+
+import config  # noqa: E402
+from local_asr import ort_cache  # noqa: E402
+from local_asr.model_manager import silero_onnx_path  # noqa: E402
+
+
+@pytest.fixture
+def model(tmp_path):
+    source = silero_onnx_path()
+    if not source.is_file():
+        pytest.skip("Silero ONNX model not available")
+    path = tmp_path / "models" / source.name
+    path.parent.mkdir()
+    shutil.copyfile(source, path)
+    return path
+
+
+def _options():
+    opts = ort.SessionOptions()
+    opts.intra_op_num_threads = 1
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return opts
+
+
+def _probability(session) -> float:
+    feeds = {
+        "input": np.linspace(-0.2, 0.2, 576, dtype=np.float32)[None, :],
+        "state": np.zeros((2, 1, 128), dtype=np.float32),
+        "sr": np.array(16000, dtype=np.int64),
+    }
+    return float(session.run(None, feeds)[0].reshape(-1)[0])
+
+
+def _load(model, directory):
+    return ort_cache.create_session(model, _options(), ["CPUExecutionProvider"], directory=directory)
+
+
+class TestOrtGraphCache:
+    def test_first_load_writes_graph_and_second_load_reuses_it(self, model, tmp_path):
+        directory = tmp_path / "cache"
+        first = _load(model, directory)
+        assert ort_cache.cache_stats()["models"][model.name]["cache"] == "miss"
+        cached = ort_cache.cache_path(model, _options(), directory)
+        assert cached.is_file()
+        assert not list(directory.glob("*.tmp"))
+
+        second = _load(model, directory)
+        assert ort_cache.cache_stats()["models"][model.name]["cache"] == "hit"
+        assert _probability(second) == pytest.approx(_probability(first), abs=1e-6)
+
+    def test_key_follows_model_content_and_ort_version(self, model, tmp_path, monkeypatch):
+        directory = tmp_path / "cache"
+        before = ort_cache.cache_path(model, _options(), directory)
+        monkeypatch.setattr(ort, "__version__", "0.0.0-test")
+        assert ort_cache.cache_path(model, _options(), directory) != before
+        monkeypatch.undo()
+        with open(model, "ab") as fh:
+            fh.write(b"\0")
+        assert ort_cache.cache_path(model, _options(), directory) != before
+
+    def test_corrupt_cache_entry_is_rebuilt(self, model, tmp_path):
+        directory = tmp_path / "cache"
+        cached = ort_cache.cache_path(model, _options(), directory)
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        cached.write_bytes(b"not a model")
+        session = _load(model, directory)
+        assert ort_cache.cache_stats()["models"][model.name]["cache"] == "miss"
+        assert 0.0 <= _probability(session) <= 1.0
+        assert cached.stat().st_size > 1000
+
+    def test_disabled_cache_builds_directly(self, model, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "LOCAL_ASR_ORT_GRAPH_CACHE", False)
+        directory = tmp_path / "cache"
+        _load(model, directory)
+        assert ort_cache.cache_stats()["models"][model.name]["cache"] == "off"
+        assert not directory.exists()
+
+    def test_shared_options_are_left_unchanged(self, model, tmp_path):
+        directory = tmp_path / "cache"
+        other = model.with_name("other.onnx")
+        shutil.copyfile(model, other)
+        opts = _options()
+        # 同一个 SessionOptions 依次用于两个模型（Qwen 编码器前后端就是这样），先让第一个命中缓存
+        for path in (model, model, other, other):
+            ort_cache.create_session(path, opts, ["CPUExecutionProvider"], directory=directory)
+            assert opts.graph_optimization_level == ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            assert opts.optimized_model_filepath == ""
+        assert ort_cache.cache_stats()["models"][other.name]["cache"] == "hit"
+        for path in (model, other):
+            assert [p.name for p in directory.glob(f"{path.stem}.*.onnx")] == [
+                ort_cache.cache_path(path, _options(), directory).name
+            ]
+        assert not list(directory.glob("*.tmp"))
+
+    def test_hash_index_is_kept_per_directory(self, model, tmp_path):
+        first, second = tmp_path / "first", tmp_path / "second"
+        digest = ort_cache.model_hash(model, first)
+        stat = model.resolve().stat()
+        # 另一个目录里已有的索引必须被读出来，而不是被第一个目录的内存记忆挡住
+        second.mkdir()
+        (second / "hashes.json").write_text(
+            json.dumps({str(model.resolve()): [stat.st_size, stat.st_mtime_ns, "from-index"]}), encoding="utf-8"
+        )
+        assert ort_cache.model_hash(model, second) == "from-index"
+        assert ort_cache.model_hash(model, first) == digest
+        saved = json.loads((first / "hashes.json").read_text(encoding="utf-8"))
+        assert saved[str(model.resolve())][2] == digest
+
+    def test_temp_paths_are_unique(self, tmp_path):
+        target = tmp_path / "model.onnx"
+        paths = {ort_cache._temp_path(target) for _ in range(8)}
+        assert len(paths) == 8
+        assert all(path.parent == tmp_path and path.name.endswith(".tmp") for path in paths)
+
+    def test_only_cpu_only_sessions_are_cached(self):
+        assert ort_cache._cpu_only(None)
+        assert ort_cache._cpu_only([("CPUExecutionProvider", {"arena_extend_strategy": "kSameAsRequested"})])
+        assert not ort_cache._cpu_only(["DmlExecutionProvider", "CPUExecutionProvider"])
@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from audio_bus import AudioBus
 from recognition_handler import VRChatRecognitionCallback
 from speech_recognizers.base_speech_recognizer import RecognitionEvent
 
@@ -318,6 +319,8 @@ def _make_mock_state(executor=None, loop=None):
     )
     state.audio_send_generation = 1
     state.ensure_asr_send_executor = MagicMock()
+    state.audio_bus = AudioBus()
+    state.speech_bus = AudioBus()
     state.translator = MagicMock()
     state.secondary_translator = None
     state.deepl_fallback_translator = None
@@ -715,6 +718,7 @@ class TestAudioExecutorSeparation:
     def test_audio_capture_keeps_reading_while_send_blocks(self, mock_config):
         """A slow WebSocket send must not stop the mic read loop."""
         import audio_capture
+        from audio_frame import AudioFrame
 
         state = _make_mock_state()
         state.stop_event = asyncio.Event()
@@ -727,10 +731,12 @@ class TestAudioExecutorSeparation:
 
         async def fake_read_audio_data(_state):
             nonlocal read_count
+            # 真实音频源总会等待执行器或回调唤醒，这里同样让出事件循环
+            await asyncio.sleep(0)
             read_count += 1
             if read_count >= 3:
                 state.stop_event.set()
-            return b"\x01" * 3200
+            return AudioFrame.from_pcm16(b"\x01" * 3200, 16000)
 
         recognizer = MagicMock()
 
@@ -757,3 +763,93 @@ class TestAudioExecutorSeparation:
 
         assert send_started.wait(timeout=1.0)
         assert read_count >= 3
+
+
+class TestAsrSendCoalescing:
+    """Frames queued behind a slow send are merged into one payload."""
+
+    def _run_capture(self, recognizer, max_bytes, frames_to_read=6):
+        import audio_capture
+        from audio_frame import AudioFrame
+
+        state = _make_mock_state()
+        state.stop_event = asyncio.Event()
+        state.recognition_active = True
+        state.vad_enabled = False
+        state.audio_send_generation = 1
+
+        first_send = threading.Event()
+        release = threading.Event()
+        payloads = []
+        read_count = 0
+
+        def blocking_send(data):
+            payloads.append(data)
+            first_send.set()
+            release.wait(timeout=2.0)
+
+        recognizer.send_audio_frame.side_effect = blocking_send
+
+        async def fake_read_audio_data(_state):
+            nonlocal read_count
+            if read_count == 1:
+                # 第一帧发送阻塞期间继续采集，后续帧在队列中积压
+                await asyncio.get_running_loop().run_in_executor(None, first_send.wait, 1.0)
+            if read_count >= frames_to_read:
+                release.set()
+                await asyncio.sleep(0.1)
+                state.stop_event.set()
+                return None
+            read_count += 1
+            return AudioFrame.from_pcm16(bytes([read_count]) * 3200, 16000)
+
+        async def _test():
+            with patch("audio_capture.read_audio_data", side_effect=fake_read_audio_data), \
+                    patch.object(audio_capture.config, "ASR_SEND_COALESCE_MAX_BYTES", max_bytes):
+                await asyncio.wait_for(audio_capture.audio_capture_task(state, recognizer), timeout=2.0)
+
+        try:
+            asyncio.run(_test())
+        finally:
+            release.set()
+            state.executor.shutdown(wait=True)
+            state.audio_executor.shutdown(wait=True)
+            state.asr_send_executor.shutdown(wait=True)
+        return payloads
+
+    @staticmethod
+    def _declaring(limit):
+        """Wrapped recognizer whose backend declares ``max_audio_append_bytes``."""
+        from speech_recognizers.base_speech_recognizer import MonoAudioSpeechRecognizer
+
+        inner = MagicMock()
+        inner.max_audio_append_bytes = limit
+        recognizer = MonoAudioSpeechRecognizer(inner)
+        recognizer.send_audio_frame = MagicMock()
+        inner.send_audio.side_effect = lambda frame: recognizer.send_audio_frame(frame.pcm)
+        return recognizer
+
+    def test_backlog_is_sent_as_one_payload(self):
+        payloads = self._run_capture(self._declaring(32000), max_bytes=0)
+        assert [len(p) for p in payloads] == [3200, 16000]
+        assert b"".join(payloads) == b"".join(bytes([i]) * 3200 for i in range(1, 7))
+
+    def test_backend_limit_caps_payload(self):
+        payloads = self._run_capture(self._declaring(6400), max_bytes=0)
+        assert [len(p) for p in payloads] == [3200, 6400, 6400, 3200]
+
+    def test_config_cap_lowers_backend_limit(self):
+        payloads = self._run_capture(self._declaring(32000), max_bytes=6400)
+        assert [len(p) for p in payloads] == [3200, 6400, 6400, 3200]
+
+    def test_backend_without_declared_limit_is_not_coalesced(self):
+        payloads = self._run_capture(self._declaring(None), max_bytes=32000)
+        assert [len(p) for p in payloads] == [3200] * 6
+
+    def test_plain_recognizer_is_not_coalesced(self):
+        payloads = self._run_capture(MagicMock(), max_bytes=32000)
+        assert [len(p) for p in payloads] == [3200] * 6
+
+    def test_zero_backend_limit_disables_coalescing(self):
+        payloads = self._run_capture(self._declaring(0), max_bytes=0)
+        assert [len(p) for p in payloads] == [3200] * 6
@@ -0,0 +1,70 @@
+"""Tests for speech_recognizers.recognizer_factory: behaviour through the mono wrapper."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from audio_frame import AudioFrame
+from speech_recognizers import recognizer_factory
+from speech_recognizers.base_speech_recognizer import MonoAudioSpeechRecognizer
+from vad_stream import VADStream
+
+
+@pytest.fixture
+def local_recognizer():
+    if recognizer_factory.LocalSpeechRecognizer is None:
+        pytest.skip("LocalSpeechRecognizer unavailable")
+    recognizer = recognizer_factory.create_recognizer('local', MagicMock())
+    assert isinstance(recognizer, MonoAudioSpeechRecognizer)
+    return recognizer
+
+
+class TestLocalRecognizerThroughFactory:
+    def test_send_audio_hands_float_frame_to_local_recognizer(self, local_recognizer):
+        inner = local_recognizer._recognizer
+        inner._running = True
+        frame = AudioFrame.from_pcm16(np.arange(512, dtype=np.int16).tobytes(), 16000)
+        local_recognizer.send_audio(frame)
+        queued = inner._audio_queue.get_nowait()
+        # 队列里是采集阶段的 float32 视图本身，而不是重新解码的 PCM
+        assert queued is frame.samples
+
+    def test_shared_vad_stream_attaches_through_wrapper(self, local_recognizer):
+        inner = local_recognizer._recognizer
+        processor = MagicMock()
+        processor.last_confidence = 0.9
+        processor.is_speaking = True
+        stream = VADStream(processor, sample_rate=16000)
+        stream.gating = False
+        assert local_recognizer.attach_vad_stream(stream) is True
+        assert inner._vad_stream is stream
+        inner._running = True
+        stream.push(np.zeros(512, dtype=np.float32))
+        samples, confidence = inner._audio_queue.get_nowait()
+        assert samples.size == 512 and confidence == 0.9
+
+    def test_scheduler_stats_reach_latency_endpoint(self, local_recognizer, monkeypatch):
+        import app_state
+        from ui import app as ui_app
+
+        state = MagicMock()
+        state.recognition_instance = local_recognizer
+        monkeypatch.setattr(app_state, "get_state", lambda: state)
+        assert ui_app._local_asr_scheduler_stats() is None  # 尚未开始：没有调度器
+        inner = local_recognizer._recognizer
+        with inner._lock:
+            inner._ensure_scheduler_locked()
+        try:
+            stats = ui_app._local_asr_scheduler_stats()
+            assert stats is not None and stats["queued"] == 0
+            assert "final" in stats["queue_wait"]
+        finally:
+            inner._scheduler.shutdown(wait=True)
+
+    def test_backend_without_local_features_declines(self):
+        wrapper = MonoAudioSpeechRecognizer(MagicMock(spec=["send_audio_frame"]))
+        assert wrapper.attach_vad_stream(VADStream(MagicMock())) is False
+        assert wrapper.get_scheduler_stats() is None
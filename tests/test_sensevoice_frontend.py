@@ -0,0 +1,121 @@
+"""Parity tests for the vectorized SenseVoice frontend (local_asr.vendor.sensevoice_onnx.frontend)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("soundfile")
+knf = pytest.importorskip("kaldi_native_fbank")
+
+from local_asr.vendor.sensevoice_onnx.frontend import StreamingFeatures, WavFrontend  # noqa: E402
+
+DIM = 80 * 7
+
+
+def _reference_lfr(inputs: np.ndarray, lfr_m: int, lfr_n: int) -> np.ndarray:
+    """The original frame-by-frame LFR stacking."""
+    LFR_inputs = []
+    T = inputs.shape[0]
+    T_lfr = int(np.ceil(T / lfr_n))
+    left_padding = np.tile(inputs[0], ((lfr_m - 1) // 2, 1))
+    inputs = np.vstack((left_padding, inputs))
+    T = T + (lfr_m - 1) // 2
+    for i in range(T_lfr):
+        if lfr_m <= T - i * lfr_n:
+            LFR_inputs.append((inputs[i * lfr_n : i * lfr_n + lfr_m]).reshape(1, -1))
+        else:
+            num_padding = lfr_m - (T - i * lfr_n)
+            frame = inputs[i * lfr_n :].reshape(-1)
+            for _ in range(num_padding):
+                frame = np.hstack((frame, inputs[-1]))
+            LFR_inputs.append(frame)
+    return np.vstack(LFR_inputs).astype(np.float32)
+
+
+@pytest.fixture
+def frontend(tmp_path):
+    rng = np.random.default_rng(3)
+    shift = " ".join(f"{v:.4f}" for v in rng.uniform(-15, -5, DIM))
+    scale = " ".join(f"{v:.4f}" for v in rng.uniform(0.1, 0.5, DIM))
+    mvn = tmp_path / "am.mvn"
+    mvn.write_text(
+        f"<Nnet>\n<AddShift> {DIM} {DIM}\n<LearnRateCoef> 0 [ {shift} ]\n"
+        f"<Rescale> {DIM} {DIM}\n<LearnRateCoef> 0 [ {scale} ]\n</Nnet>\n",
+        encoding="utf-8",
+    )
+    return WavFrontend(str(mvn))
+
+
+def _speechlike(seconds: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(16000 * seconds)) / 16000.0
+    tone = 0.3 * np.sin(2 * np.pi * 220 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 3 * t))
+    audio = tone + 0.02 * rng.standard_normal(t.size)
+    audio[: 1600] = 0.0  # 含一段纯静音，覆盖 log 下限
+    return audio.astype(np.float32)
+
+
+class TestVectorizedFrontend:
+    @pytest.mark.parametrize("seconds", [0.02, 0.0255, 1.0, 3.337])
+    def test_fbank_matches_kaldi_native_fbank(self, frontend, seconds):
+        audio = _speechlike(seconds)
+        ours, ours_len = frontend.fbank(audio)
+        ref, ref_len = frontend.fbank_knf(audio)
+        assert ours.shape == ref.shape
+        assert int(ours_len) == int(ref_len)
+        if ref.size:
+            np.testing.assert_allclose(ours, ref, rtol=1e-4, atol=2e-3)
+
+    @pytest.mark.parametrize("frames", [1, 3, 4, 6, 7, 11, 12, 100, 101])
+    def test_lfr_matches_loop(self, frames):
+        feats = np.random.default_rng(frames).standard_normal((frames, 80)).astype(np.float32)
+        np.testing.assert_array_equal(WavFrontend.apply_lfr(feats, 7, 6), _reference_lfr(feats, 7, 6))
+
+    def test_get_features_matches_original_pipeline(self, frontend):
+        audio = _speechlike(2.5, seed=1)
+        ref_fbank, _ = frontend.fbank_knf(audio)
+        ref = (_reference_lfr(ref_fbank, 7, 6) + frontend.cmvn[0]) * frontend.cmvn[1]
+        ours = frontend.get_features(audio)
+        assert ours.dtype == np.float32
+        assert ours.shape == ref.shape
+        np.testing.assert_allclose(ours, ref, rtol=1e-4, atol=1e-3)
+
+
+def _assert_same(actual, expected):
+    # 与整段重算逐帧一致（只容许 BLAS 分块带来的末位差异）
+    np.testing.assert_allclose(actual, expected, rtol=1e-6, atol=1e-5)
+
+
+class TestStreamingFeatures:
+    def test_growing_buffer_matches_full_recompute(self, frontend):
+        audio = _speechlike(6.0, seed=2)
+        stream = StreamingFeatures(frontend)
+        for end in range(8000, audio.size + 1, 5333):
+            _assert_same(stream.features(audio[:end]), frontend.get_features(audio[:end]))
+        final = stream.features(audio)
+        _assert_same(final, frontend.get_features(audio))
+        # 每帧只算一次：新增帧数之和等于整段帧数
+        assert stream.computed_frames == frontend.fbank(audio)[0].shape[0]
+
+    def test_shorter_prefix_truncates_and_new_audio_resets(self, frontend):
+        audio = _speechlike(4.0, seed=4)
+        stream = StreamingFeatures(frontend)
+        stream.features(audio)
+        # 长句切窗：新缓冲是已处理音频的前缀
+        _assert_same(stream.features(audio[:30000]), frontend.get_features(audio[:30000]))
+        assert stream.computed_frames == frontend.fbank(audio)[0].shape[0]
+
+        other = _speechlike(2.0, seed=5)
+        before = stream.computed_frames
+        _assert_same(stream.features(other), frontend.get_features(other))
+        assert stream.computed_frames - before == frontend.fbank(other)[0].shape[0]
+
+    def test_reset_drops_state(self, frontend):
+        audio = _speechlike(1.0)
+        stream = StreamingFeatures(frontend)
+        stream.features(audio)
+        stream.reset()
+        before = stream.computed_frames
+        stream.features(audio)
+        assert stream.computed_frames - before == frontend.fbank(audio)[0].shape[0]
@@ -0,0 +1,98 @@
+"""Tests for batched decoding in local_asr.vendor.sensevoice_onnx.sense_voice_ort_session."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime")
+pytest.importorskip("sentencepiece")
+
+import logging  # noqa: E402
+
+import onnxruntime as ort  # noqa: E402
+
+from local_asr.vendor.sensevoice_onnx.sense_voice_ort_session import (  # noqa: E402
+    OrtInferRuntimeSession,
+    SenseVoiceInferenceSession,
+)
+
+DIM = 8
+VOCAB = 6
+
+
+class _FrameEncoder:
+    """Frame-wise stand-in for the encoder: logits depend only on each input frame."""
+
+    def __init__(self, with_lengths: bool):
+        self.with_lengths = with_lengths
+        self.batch_sizes = []
+
+    def __call__(self, inputs, run_options=None):
+        content, lengths = inputs
+        self.batch_sizes.append(content.shape[0])
+        logits = content[..., :VOCAB] * 3.0
+        # 填充帧输出可能出错的 token：必须按有效长度截断
+        logits[..., 5] += 1.0
+        return [logits, lengths] if self.with_lengths else [logits]
+
+
+class _Pieces:
+    def DecodeIds(self, ids):
+        return " ".join(str(i) for i in ids)
+
+
+def _session(with_lengths: bool) -> SenseVoiceInferenceSession:
+    session = SenseVoiceInferenceSession.__new__(SenseVoiceInferenceSession)
+    rng = np.random.default_rng(0)
+    session.embedding = rng.standard_normal((16, DIM)).astype(np.float32)
+    session.encoder = _FrameEncoder(with_lengths)
+    session.sp = _Pieces()
+    session.blank_id = 0
+    return session
+
+
+class TestBatchedDecode:
+    @pytest.mark.parametrize("with_lengths", [True, False])
+    def test_batch_matches_single_segment_calls(self, with_lengths):
+        session = _session(with_lengths)
+        rng = np.random.default_rng(1)
+        speeches = [rng.standard_normal((n, DIM)).astype(np.float32) for n in (5, 17, 1, 9)]
+        singles = [session(speech[None, ...], language=0, use_itn=True) for speech in speeches]
+        assert session.batch(speeches, language=0, use_itn=True) == singles
+        assert session.encoder.batch_sizes == [1, 1, 1, 1, 4]
+
+    def test_empty_batch(self):
+        assert _session(True).batch([], language=0, use_itn=True) == []
+
+
+class _FailingSession:
+    def get_inputs(self):
+        return []
+
+    def get_outputs(self):
+        return []
+
+    def run(self, *_args):
+        raise RuntimeError("Exiting due to terminate flag being set to true.")
+
+
+class TestRunTermination:
+    def _runtime(self):
+        runtime = OrtInferRuntimeSession.__new__(OrtInferRuntimeSession)
+        runtime.session = _FailingSession()
+        return runtime
+
+    def test_terminated_run_is_not_logged_as_error(self, caplog):
+        run_options = ort.RunOptions()
+        run_options.terminate = True
+        with caplog.at_level(logging.ERROR):
+            with pytest.raises(RuntimeError, match="terminated"):
+                self._runtime()((), run_options)
+        assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+
+    def test_real_failure_is_logged(self, caplog):
+        with caplog.at_level(logging.ERROR):
+            with pytest.raises(RuntimeError, match="inference failed"):
+                self._runtime()((), ort.RunOptions())
+        assert [r for r in caplog.records if r.levelno >= logging.ERROR]
@@ -0,0 +1,314 @@
+"""Tests for local_asr.vad_processor."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from local_asr.vad_processor import VADProcessor, _SpeechAccumulator
+
+CHUNK = 512
+
+
+def _vad(**kwargs) -> VADProcessor:
+    vad = VADProcessor(min_speech_duration=0.1, pre_speech_duration=0.0, **kwargs)
+    vad.update_settings({"vad_mode": "energy", "silence_duration": 0.096})
+    return vad
+
+
+def _speech(value: float = 0.5) -> np.ndarray:
+    return np.full(CHUNK, value, dtype=np.float32)
+
+
+def _silence() -> np.ndarray:
+    return np.zeros(CHUNK, dtype=np.float32)
+
+
+class TestSpeechAccumulator:
+    def test_grows_past_initial_capacity(self):
+        acc = _SpeechAccumulator(initial_samples=CHUNK, initial_chunks=1)
+        for index in range(10):
+            acc.append(np.full(CHUNK, index, dtype=np.float32), float(index))
+        audio = acc.audio()
+        assert audio.shape == (10 * CHUNK,)
+        assert audio[::CHUNK].tolist() == list(range(10))
+        assert acc.confidences().tolist() == list(range(10))
+
+    def test_views_are_read_only(self):
+        acc = _SpeechAccumulator(initial_samples=CHUNK, initial_chunks=1)
+        acc.append(_speech(), 1.0)
+        with pytest.raises(ValueError):
+            acc.audio()[0] = 0.0
+
+    def test_detached_view_survives_reuse(self):
+        acc = _SpeechAccumulator(initial_samples=4 * CHUNK, initial_chunks=4)
+        acc.append(_speech(0.25), 1.0)
+        first = acc.detach()
+        acc.append(_speech(0.75), 1.0)
+        assert np.all(first == np.float32(0.25))
+        assert acc.size == CHUNK
+
+
+class TestVADBuffer:
+    def test_peek_is_zero_copy_view(self):
+        vad = _vad()
+        for _ in range(3):
+            vad.process_chunk(_speech())
+        audio, duration = vad.peek_buffer()
+        again, _ = vad.peek_buffer()
+        assert np.shares_memory(audio, again)
+        assert len(audio) == 3 * CHUNK
+        assert duration == pytest.approx(3 * CHUNK / 16000)
+
+    def test_peek_view_is_stable_while_speech_continues(self):
+        vad = _vad()
+        vad.process_chunk(_speech(0.5))
+        audio, _ = vad.peek_buffer()
+        snapshot = audio.copy()
+        for _ in range(400):  # 超过初始容量，触发扩容
+            vad.process_chunk(_speech(0.9))
+        assert np.array_equal(audio, snapshot)
+
+    def test_segment_flushed_after_silence(self):
+        vad = _vad()
+        for _ in range(5):
+            assert vad.process_chunk(_speech()) is None
+        results = [vad.process_chunk(_silence()) for _ in range(3)]
+        assert results[:2] == [None, None]
+        segment = results[2]
+        assert len(segment) == 8 * CHUNK
+        assert vad.peek_buffer() is None
+        assert vad._speech_samples == 0
+
+    def test_low_density_segment_is_discarded(self):
+        vad = _vad()
+        vad.update_settings({"silence_duration": 1.0})
+        vad.process_chunk(_speech())
+        for _ in range(8):
+            vad.process_chunk(_silence())
+        vad._is_speaking = True
+        assert vad.flush() is None
+
+    def test_flushed_segment_not_clobbered_by_next_utterance(self):
+        vad = _vad()
+        for _ in range(5):
+            vad.process_chunk(_speech(0.5))
+        first = vad.force_flush()
+        for _ in range(5):
+            vad.process_chunk(_speech(0.9))
+        assert np.all(first == np.float32(0.5))
+
+
+class TestSileroRunner:
+    @pytest.fixture
+    def model_path(self):
+        pytest.importorskip("onnxruntime")
+        from local_asr.model_manager import silero_onnx_path
+
+        path = silero_onnx_path()
+        if not path.is_file():
+            pytest.skip("Silero ONNX model not available")
+        return str(path)
+
+    @staticmethod
+    def _audio() -> np.ndarray:
+        t = np.arange(16000 * 2) / 16000.0
+        tone = 0.3 * np.sin(2 * np.pi * 220 * t) * (t > 0.8)
+        noise = 0.01 * np.random.default_rng(0).standard_normal(len(t))
+        return (tone + noise).astype(np.float32)
+
+    def test_io_binding_matches_session_run(self, model_path):
+        from local_asr.vad_processor import _SileroOnnxVAD
+
+        audio = self._audio()
+        bound = _SileroOnnxVAD(model_path, use_io_binding=True)
+        plain = _SileroOnnxVAD(model_path, use_io_binding=False)
+        assert bound.uses_io_binding and not plain.uses_io_binding
+        for offset in range(0, len(audio) - CHUNK + 1, CHUNK):
+            chunk = audio[offset:offset + CHUNK]
+            assert bound.probability(chunk, 16000) == pytest.approx(plain.probability(chunk, 16000), abs=1e-6)
+
+    def test_reset_states_restores_initial_output(self, model_path):
+        from local_asr.vad_processor import _SileroOnnxVAD
+
+        audio = self._audio()
+        vad = _SileroOnnxVAD(model_path)
+        first = [vad.probability(audio[i:i + CHUNK], 16000) for i in range(0, 8 * CHUNK, CHUNK)]
+        vad.reset_states()
+        again = [vad.probability(audio[i:i + CHUNK], 16000) for i in range(0, 8 * CHUNK, CHUNK)]
+        assert again == pytest.approx(first, abs=1e-6)
+
+    def test_silence_state_keeps_context(self, model_path):
+        from local_asr.vad_processor import _SileroOnnxVAD
+
+        audio = self._audio()
+        vad = _SileroOnnxVAD(model_path)
+        vad.probability(audio[-CHUNK:], 16000)
+        context = vad._input.copy()
+        vad.reset_to_silence_state()
+        assert np.array_equal(vad._input, context)
+
+        warmed = _SileroOnnxVAD(model_path)
+        zeros = np.zeros(CHUNK, dtype=np.float32)
+        for _ in range(64):
+            warmed.probability(zeros, 16000)
+        assert np.allclose(vad._state, warmed._state, atol=1e-5)
+
+    def test_short_chunk_is_zero_padded(self, model_path):
+        from local_asr.vad_processor import _SileroOnnxVAD
+
+        chunk = self._audio()[-CHUNK:]
+        padded = _SileroOnnxVAD(model_path).probability(np.pad(chunk[:300], (0, CHUNK - 300)), 16000)
+        short = _SileroOnnxVAD(model_path).probability(chunk[:300], 16000)
+        assert short == pytest.approx(padded, abs=1e-6)
+
+
+class _FakeSilero:
+    def __init__(self, probability: float = 0.9):
+        self.value = probability
+        self.runs = 0
+        self.skipped = 0
+        self.silence_resets = 0
+
+    def probability(self, audio_chunk, sample_rate):
+        self.runs += 1
+        return self.value
+
+    def skip(self, audio_chunk, sample_rate):
+        self.skipped += 1
+
+    def reset_to_silence_state(self):
+        self.silence_resets += 1
+
+
+class TestCascadeMode:
+    @pytest.fixture
+    def vad(self):
+        vad = VADProcessor(min_speech_duration=0.1, pre_speech_duration=0.0)
+        vad.update_settings({"vad_mode": "cascade", "cascade_silence_dbfs": -50})
+        vad._silero = _FakeSilero()
+        return vad
+
+    def test_digital_silence_skips_model(self, vad):
+        for _ in range(10):
+            vad.process_chunk(_silence())
+        assert vad._silero.runs == 0
+        assert vad._silero.skipped == 10
+        assert vad.last_confidence == 0.0
+
+    def test_low_frequency_hum_skips_model(self, vad):
+        t = np.arange(CHUNK) / 16000.0
+        hum = (10 ** (-45 / 20) * np.sqrt(2) * np.sin(2 * np.pi * 50 * t)).astype(np.float32)
+        vad.process_chunk(hum)
+        assert vad.silero_skips == 1 and vad._silero.runs == 0
+
+    def test_broadband_noise_above_floor_runs_model(self, vad):
+        noise = (10 ** (-45 / 20) * np.random.default_rng(0).standard_normal(CHUNK)).astype(np.float32)
+        vad._silero.value = 0.1
+        vad.process_chunk(noise)
+        assert vad._silero.runs == 1
+
+    def test_model_runs_on_every_chunk_while_speaking(self, vad):
+        vad.process_chunk(_speech())
+        assert vad.is_speaking
+        for _ in range(2):
+            vad.process_chunk(_silence())
+        assert vad._silero.runs == 3
+        assert vad.silero_skips == 0
+
+    def test_state_reset_to_silence_after_skipped_stretch(self, vad):
+        vad.process_chunk(_silence())
+        vad.process_chunk(_speech())
+        assert vad._silero.silence_resets == 0
+        vad._is_speaking = False
+        for _ in range(vad._cascade_reset_chunks):
+            vad.process_chunk(_silence())
+        vad.process_chunk(_speech())
+        assert vad._silero.silence_resets == 1
+
+    def test_uses_silero_threshold(self, vad):
+        vad.update_settings({"vad_threshold": 0.95})
+        vad.process_chunk(_speech())
+        assert not vad.is_speaking
+
+
+class TestAdaptiveEndpoint:
+    @pytest.fixture
+    def vad(self):
+        vad = VADProcessor(min_speech_duration=0.1, pre_speech_duration=0.0)
+        vad.update_settings({"vad_mode": "energy", "silence_duration": 0.8, "adaptive_endpoint": True})
+        return vad
+
+    @staticmethod
+    def _feed(vad, confidences):
+        segments = []
+        for confidence in confidences:
+            segment = vad.process_chunk(_speech(), confidence)
+            if segment is not None:
+                segments.append(segment)
+        return segments
+
+    def test_disabled_uses_fixed_silence(self, vad):
+        vad.update_settings({"adaptive_endpoint": False})
+        self._feed(vad, [0.9, 0.0, 0.9, 0.0, 0.9, 0.0, 0.9])
+        assert vad.endpoint_silence_chunks() == vad._silence_limit
+
+    def test_fixed_until_enough_pauses(self, vad):
+        self._feed(vad, [0.9, 0.0, 0.9])
+        assert vad.endpoint_silence_chunks() == vad._silence_limit
+
+    def test_short_pauses_shorten_hangover(self, vad):
+        self._feed(vad, [0.9, 0.9, 0.0] * 6 + [0.9])
+        limit = vad.endpoint_silence_chunks()
+        assert limit < vad._silence_limit
+        segments = self._feed(vad, [0.0] * limit)
+        assert len(segments) == 1
+
+    def test_hovering_confidence_extends_hangover(self, vad):
+        self._feed(vad, [0.9, 0.9, 0.0] * 6 + [0.9])
+        segments = self._feed(vad, [0.1, 0.1, 0.1, 0.1, 0.45] + [0.1] * vad._silence_limit)
+        assert segments == []
+        assert vad.endpoint_silence_chunks() > vad._silence_limit
+
+    def test_reset_forgets_pause_history(self, vad):
+        self._feed(vad, [0.9, 0.9, 0.0] * 6 + [0.9])
+        vad.reset()
+        assert vad.endpoint_silence_chunks() == vad._silence_limit
+
+
+class TestSplitLongSegment:
+    def test_accumulator_split_keeps_overlap(self):
+        acc = _SpeechAccumulator(initial_samples=CHUNK, initial_chunks=1)
+        for index in range(6):
+            acc.append(np.full(CHUNK, index, dtype=np.float32), float(index))
+        head = acc.split(4, 3)
+        assert head[::CHUNK].tolist() == [0, 1, 2, 3]
+        assert not head.flags.writeable
+        assert acc.audio()[::CHUNK].tolist() == [3, 4, 5]
+        assert acc.confidences().tolist() == [3, 4, 5]
+        acc.append(np.full(CHUNK, 9, dtype=np.float32), 9.0)
+        assert head[::CHUNK].tolist() == [0, 1, 2, 3]
+
+    def test_cuts_at_lowest_confidence(self):
+        vad = _vad()
+        confidences = [0.9] * 20 + [0.8, 0.7, 0.5, 0.5, 0.8] + [0.9] * 6
+        for value in confidences:
+            vad.process_chunk(_speech(value), value)
+        head = vad.split_long_segment(search_duration=0.5, overlap_duration=0.064)
+        # 三块平滑后最低点在第 22 块；保留其后的块与 2 块重叠
+        assert len(head) == 23 * CHUNK
+        assert vad._speech.chunks == len(confidences) - 23 + 2
+        assert vad.is_speaking
+
+    def test_continuation_skips_density_filter(self):
+        vad = _vad()
+        for _ in range(20):
+            vad.process_chunk(_speech(), 0.9)
+        assert vad.split_long_segment(0.2, 0.032) is not None
+        segment = None
+        for _ in range(vad._silence_limit):
+            segment = vad.process_chunk(_silence(), 0.0) if segment is None else segment
+        assert segment is not None
+
+    def test_not_speaking_returns_none(self):
+        assert _vad().split_long_segment(1.0, 0.2) is None
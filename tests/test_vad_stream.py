@@ -0,0 +1,116 @@
+"""Tests for vad_stream."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from vad_stream import VADStream
+
+CHUNK = 512
+
+
+class _LevelProcessor:
+    """Confidence 0.9 for loud chunks, 0.0 otherwise; counts model runs."""
+
+    def __init__(self):
+        self.runs = 0
+        self.resets = 0
+        self.last_confidence = 0.0
+        self.is_speaking = False
+
+    def process_chunk(self, chunk, confidence=None):
+        self.runs += 1
+        self.last_confidence = 0.9 if float(np.max(np.abs(chunk))) > 0.1 else 0.0
+        self.is_speaking = self.last_confidence > 0.5
+
+    def reset(self):
+        self.resets += 1
+
+
+def _audio(level: float, chunks: int) -> np.ndarray:
+    return np.full(chunks * CHUNK, level, dtype=np.float32)
+
+
+class TestVADStream:
+    def test_push_runs_processor_once_per_chunk(self):
+        processor = _LevelProcessor()
+        stream = VADStream(processor)
+        assert stream.push(_audio(0.0, 1)[:300]) == []
+        results = stream.push(np.concatenate([_audio(0.0, 1)[:212], _audio(0.5, 1), _audio(0.5, 1)[:300]]))
+        assert processor.runs == 2
+        assert [r.index for r in results] == [0, 1]
+        assert [r.confidence for r in results] == [0.0, 0.9]
+        assert [r.is_speaking for r in results] == [False, True]
+        assert all(len(r.samples) == CHUNK for r in results)
+        assert stream.chunker.pending.size == 300
+
+    def test_listeners_receive_chunks_and_errors_are_isolated(self):
+        stream = VADStream(_LevelProcessor())
+        seen = []
+
+        def broken(_chunk):
+            raise RuntimeError("boom")
+
+        stream.subscribe(broken)
+        stream.subscribe(seen.append)
+        stream.push(_audio(0.5, 3))
+        assert [c.index for c in seen] == [0, 1, 2]
+        assert stream.listener_errors == 3
+
+        stream.unsubscribe(broken)
+        stream.unsubscribe(broken)
+        assert stream.listeners == [seen.append]
+
+    def test_reset_clears_processor_and_partial_chunk(self):
+        processor = _LevelProcessor()
+        stream = VADStream(processor)
+        stream.push(_audio(0.5, 1)[:100])
+        stream.reset()
+        assert processor.resets == 1
+        assert stream.chunker.pending.size == 0
+
+
+class TestLocalRecognizerFollower:
+    def _recognizer(self):
+        from speech_recognizers.local_speech_recognizer import LocalSpeechRecognizer
+
+        recognizer = LocalSpeechRecognizer(MagicMock())
+        recognizer._enqueue_transcribe = MagicMock()
+        recognizer._running = True
+        return recognizer
+
+    def test_follower_reuses_stream_confidences(self, monkeypatch):
+        import config
+
+        monkeypatch.setattr(config, "LOCAL_SPECULATIVE_FINAL", False)
+        recognizer = self._recognizer()
+        stream = VADStream(_LevelProcessor())
+        assert recognizer.attach_vad_stream(stream)
+
+        stream.push(_audio(0.5, 40))
+        stream.push(_audio(0.0, 60))
+        with recognizer._lock:
+            recognizer._drain_queue_locked()
+
+        # 分段完全由共享流的置信度驱动，识别器自己的模型从未加载
+        assert recognizer._vad._silero is None
+        assert recognizer._vad.silero_runs == 0
+        finals = [
+            call for call in recognizer._enqueue_transcribe.call_args_list
+            if call.kwargs.get("is_final")
+        ]
+        assert len(finals) == 1
+
+    def test_direct_audio_ignored_while_attached(self):
+        recognizer = self._recognizer()
+        recognizer.attach_vad_stream(VADStream(_LevelProcessor()))
+        recognizer.send_audio_frame(np.zeros(CHUNK, dtype=np.int16).tobytes())
+        assert recognizer._audio_queue.qsize() == 0
+
+    def test_rejects_mismatched_stream(self):
+        recognizer = self._recognizer()
+        stream = VADStream(_LevelProcessor(), sample_rate=48000)
+        assert not recognizer.attach_vad_stream(stream)
+        assert stream.listeners == []
@@ -19,6 +19,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
 from audio_runtime_guard import hold_portaudio, _suppress_stderr
+from latency_trace import latency_tracer
 from text_processor import sanitize_text_fancy_style
 from udp_port_check import (
     get_non_vrchat_udp_port_occupants,
@@ -184,6 +185,7 @@ def _vad_config_dict() -> dict:
         'min_speech_duration': getattr(config, 'LOCAL_VAD_MIN_SPEECH_DURATION', 1.0),
         'max_speech_duration': getattr(config, 'LOCAL_VAD_MAX_SPEECH_DURATION', 30.0),
         'silence_duration': getattr(config, 'LOCAL_VAD_SILENCE_DURATION', 0.8),
+        'adaptive_endpoint': bool(getattr(config, 'LOCAL_VAD_ADAPTIVE_ENDPOINT', False)),
         'pre_speech_duration': getattr(config, 'LOCAL_VAD_PRE_SPEECH_DURATION', 0.2),
     }
 
@@ -469,7 +471,7 @@ def update_config(config_data):
                 config.VAD_ENABLED = bool(vad['enabled'])
             if 'mode' in vad:
                 mode = str(vad['mode'] or 'silero')
-                config.LOCAL_VAD_MODE = mode if mode in ('silero', 'energy') else 'silero'
+                config.LOCAL_VAD_MODE = mode if mode in ('silero', 'cascade', 'energy') else 'silero'
             if 'threshold' in vad:
                 config.LOCAL_VAD_THRESHOLD = float(vad['threshold'])
             if 'min_speech_duration' in vad:
@@ -478,6 +480,8 @@ def update_config(config_data):
                 config.LOCAL_VAD_MAX_SPEECH_DURATION = float(vad['max_speech_duration'])
             if 'silence_duration' in vad:
                 config.LOCAL_VAD_SILENCE_DURATION = float(vad['silence_duration'])
+            if 'adaptive_endpoint' in vad:
+                config.LOCAL_VAD_ADAPTIVE_ENDPOINT = bool(vad['adaptive_endpoint'])
             if 'pre_speech_duration' in vad:
                 config.LOCAL_VAD_PRE_SPEECH_DURATION = max(0.0, float(vad['pre_speech_duration']))
 
@@ -635,7 +639,7 @@ def update_config(config_data):
                 config.LOCAL_ASR_ENGINE = _eng
             if 'vad_mode' in local_asr and 'vad' not in config_data:
                 mode = str(local_asr['vad_mode'] or 'silero')
-                config.LOCAL_VAD_MODE = mode if mode in ('silero', 'energy') else 'silero'
+                config.LOCAL_VAD_MODE = mode if mode in ('silero', 'cascade', 'energy') else 'silero'
             if 'vad_threshold' in local_asr and 'vad' not in config_data:
                 config.LOCAL_VAD_THRESHOLD = float(local_asr['vad_threshold'])
             if 'min_speech_duration' in local_asr and 'vad' not in config_data:
@@ -794,6 +798,43 @@ def get_local_asr_status():
     })
 
 
+@app.route('/api/latency', methods=['GET'])
+def get_latency_summary():
+    """获取端到端延迟统计（各阶段 p50/p95 与最近若干句的明细）。"""
+    try:
+        limit = int(request.args.get('recent', 20))
+    except (TypeError, ValueError):
+        limit = 20
+    return jsonify({
+        'success': True,
+        'summary': latency_tracer.summary(),
+        'recent': latency_tracer.recent(limit),
+        'asr_scheduler': _local_asr_scheduler_stats(),
+    })
+
+
+def _local_asr_scheduler_stats():
+    """本地识别调度器的排队等待与抢占统计；未使用本地识别时为 None。"""
+    from app_state import get_state
+
+    state = get_state()
+    recognizer = getattr(state, 'recognition_instance', None) if state is not None else None
+    get_stats = getattr(recognizer, 'get_scheduler_stats', None)
+    if get_stats is None:
+        return None
+    try:
+        return get_stats()
+    except Exception:
+        return None
+
+
+@app.route('/api/latency/reset', methods=['POST'])
+def reset_latency_summary():
+    """清空延迟统计。"""
+    latency_tracer.reset()
+    return jsonify({'success': True})
+
+
 @app.route('/api/local-asr/download', methods=['POST'])
 def download_local_asr():
     """后台下载本地 ASR 模型与运行时。"""
@@ -1390,6 +1431,7 @@ def get_defaults():
             'min_speech_duration': 1.0,
             'max_speech_duration': 30.0,
             'silence_duration': 0.8,
+            'adaptive_endpoint': False,
             'pre_speech_duration': 0.2,
         },
         'translation': {
@@ -238,7 +238,7 @@ const translations = {
         'label.vadEnabled': '启用 VAD',
         'hint.vadEnabled': '总开关，同时控制在线 API 与本地识别。在线 API：静音时暂停发送音频以省流；本地识别：用于自动分段。',
         'label.vadMode': 'VAD 模式（本地识别）',
-        'hint.vadMode': '本地识别使用的 VAD 算法；在线 API 门控固定使用 Silero。',
+        'hint.vadMode': '本地识别使用的 VAD 算法；在线 API 门控同样使用所选的 Silero 或 Silero + 静音预筛，选能量检测时门控使用 Silero。',
         'label.vadThreshold': 'VAD 阈值（0.0-1.0）',
         'hint.vadThreshold': '值越大越严格，越不容易把噪声判为语音',
         'subsection.websocket': 'WebSocket保活设置 - 仅Qwen后端',
@@ -295,6 +295,7 @@ const translations = {
         'option.cpu': 'CPU',
         'option.cuda': 'CUDA',
         'option.localVadSilero': 'Silero',
+        'option.localVadCascade': 'Silero + 静音预筛',
         'option.localVadEnergy': '能量检测',
         'option.localVadDisabled': '禁用',
         'label.localAsrEngine': '本地识别引擎',
@@ -305,6 +306,8 @@ const translations = {
         'label.localMinSpeechDuration': '最短语音时长（秒）',
         'label.localMaxSpeechDuration': '单段最长语音采集（秒）',
         'label.localSilenceDuration': '静音持续时间（秒）',
+        'label.vadAdaptiveEndpoint': '自适应句尾判定',
+        'hint.vadAdaptiveEndpoint': '按说话习惯自动调整静音等待：说话流利时提前断句，犹豫拖音时多等一会。静音持续时间作为上限参考。',
         'label.localPreSpeechDuration': '起声预缓冲（秒）',
         'label.localIncrementalAsr': '启用增量识别',
         'label.localInterimInterval': '中间结果间隔（秒）',
@@ -607,7 +610,7 @@ const translations = {
         'label.vadEnabled': 'Enable VAD',
         'hint.vadEnabled': 'Master switch for both online API and local recognition. Online API: pauses sending audio during silence to save bandwidth; local: used for automatic segmentation.',
         'label.vadMode': 'VAD Mode (local recognition)',
-        'hint.vadMode': 'VAD algorithm used by local recognition; online API gating always uses Silero.',
+        'hint.vadMode': 'VAD algorithm used by local recognition; online API gating also uses the selected Silero or Silero + silence pre-filter, and uses Silero when Energy is selected.',
         'label.vadThreshold': 'VAD Threshold (0.0-1.0)',
         'hint.vadThreshold': 'Higher values are stricter, less likely to treat noise as speech',
         'subsection.websocket': 'WebSocket Keep-alive Settings - Qwen backend only',
@@ -664,6 +667,7 @@ const translations = {
         'option.cpu': 'CPU',
         'option.cuda': 'CUDA',
         'option.localVadSilero': 'Silero',
+        'option.localVadCascade': 'Silero + silence pre-filter',
         'option.localVadEnergy': 'Energy',
         'option.localVadDisabled': 'Disabled',
         'label.localAsrEngine': 'Local ASR Engine',
@@ -674,6 +678,8 @@ const translations = {
         'label.localMinSpeechDuration': 'Min Speech Duration (s)',
         'label.localMaxSpeechDuration': 'Max speech per utterance (s)',
         'label.localSilenceDuration': 'Silence Duration (s)',
+        'label.vadAdaptiveEndpoint': 'Adaptive End-of-Speech',
+        'hint.vadAdaptiveEndpoint': 'Adjusts the silence wait to how you speak: ends sentences sooner when speech is fluent, waits longer on hesitation. Silence Duration is used as the reference.',
         'label.localPreSpeechDuration': 'Pre-speech Buffer (s)',
         'label.localIncrementalAsr': 'Enable Incremental ASR',
         'label.localInterimInterval': 'Interim Interval (s)',
@@ -968,7 +974,7 @@ const translations = {
         'label.vadEnabled': 'VAD を有効化',
         'hint.vadEnabled': 'オンライン API とローカル認識の両方を制御する総合スイッチ。オンライン API：無音時に音声送信を停止して通信量を節約。ローカル：自動分割に使用。',
         'label.vadMode': 'VAD モード（ローカル認識）',
-        'hint.vadMode': 'ローカル認識で使う VAD アルゴリズム。オンライン API のゲーティングは常に Silero を使用します。',
+        'hint.vadMode': 'ローカル認識で使う VAD アルゴリズム。オンライン API のゲーティングも選択した Silero または Silero + 無音プレフィルタを使い、エネルギー検出選択時は Silero を使用します。',
         'label.vadThreshold': 'VAD しきい値（0.0-1.0）',
         'hint.vadThreshold': '大きいほど厳しくなり、ノイズを音声と誤判定しにくくなります',
         'subsection.websocket': 'WebSocket キープアライブ設定 - Qwen バックエンドのみ',
@@ -1025,6 +1031,7 @@ const translations = {
         'option.cpu': 'CPU',
         'option.cuda': 'CUDA',
         'option.localVadSilero': 'Silero',
+        'option.localVadCascade': 'Silero + 無音プレフィルタ',
         'option.localVadEnergy': 'エネルギー検出',
         'option.localVadDisabled': '無効',
         'label.localAsrEngine': 'ローカル認識エンジン',
@@ -1035,6 +1042,8 @@ const translations = {
         'label.localMinSpeechDuration': '最短発話長（秒）',
         'label.localMaxSpeechDuration': '1発話あたり最長（秒）',
         'label.localSilenceDuration': '無音継続時間（秒）',
+        'label.vadAdaptiveEndpoint': '適応的な文末判定',
+        'hint.vadAdaptiveEndpoint': '話し方に合わせて無音待ち時間を自動調整します。流暢なときは早めに区切り、言いよどみ時は長めに待ちます。無音継続時間を基準にします。',
         'label.localPreSpeechDuration': '発話前バッファ（秒）',
         'label.localIncrementalAsr': '増量認識を有効化',
         'label.localInterimInterval': '中間結果の間隔（秒）',
@@ -1325,7 +1334,7 @@ const translations = {
         'label.vadEnabled': 'VAD 사용',
         'hint.vadEnabled': '온라인 API와 로컬 인식을 모두 제어하는 메인 스위치. 온라인 API: 무음 시 오디오 전송을 멈춰 대역폭 절약; 로컬: 자동 분할에 사용.',
         'label.vadMode': 'VAD 모드(로컬 인식)',
-        'hint.vadMode': '로컬 인식에 사용하는 VAD 알고리즘이며, 온라인 API 게이팅은 항상 Silero를 사용합니다.',
+        'hint.vadMode': '로컬 인식에 사용하는 VAD 알고리즘이며, 온라인 API 게이팅도 선택한 Silero 또는 Silero + 무음 사전 필터를 사용하고, 에너지 검출을 선택하면 Silero를 사용합니다.',
         'label.vadThreshold': 'VAD 임계값 (0.0-1.0)',
         'hint.vadThreshold': '값이 클수록 엄격해져 잡음을 음성으로 오인하기 어렵습니다',
         'subsection.websocket': 'WebSocket Keep-alive 설정 - Qwen 백엔드 전용',
@@ -1382,6 +1391,7 @@ const translations = {
         'option.cpu': 'CPU',
         'option.cuda': 'CUDA',
         'option.localVadSilero': 'Silero',
+        'option.localVadCascade': 'Silero + 무음 사전 필터',
         'option.localVadEnergy': '에너지 검출',
         'option.localVadDisabled': '사용 안 함',
         'label.localAsrEngine': '로컬 인식 엔진',
@@ -1392,6 +1402,8 @@ const translations = {
         'label.localMinSpeechDuration': '최소 발화 길이(초)',
         'label.localMaxSpeechDuration': '발화당 최대(초)',
         'label.localSilenceDuration': '무음 지속 시간(초)',
+        'label.vadAdaptiveEndpoint': '적응형 문장 끝 판정',
+        'hint.vadAdaptiveEndpoint': '말하는 습관에 맞춰 무음 대기 시간을 자동 조절합니다. 유창할 때는 빨리 끊고, 머뭇거릴 때는 더 기다립니다. 무음 지속 시간을 기준으로 합니다.',
         'label.localPreSpeechDuration': '발화 전 버퍼(초)',
         'label.localIncrementalAsr': '증분 인식 사용',
         'label.localInterimInterval': '중간 결과 간격(초)',
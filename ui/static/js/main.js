@@ -142,6 +142,7 @@ function getVadConfigFromForm() {
         min_speech_duration: parseFloat(document.getElementById('vad-min-speech-duration')?.value || '1'),
         max_speech_duration: parseFloat(document.getElementById('vad-max-speech-duration')?.value || '30'),
         silence_duration: parseFloat(document.getElementById('vad-silence-duration')?.value || '0.8'),
+        adaptive_endpoint: document.getElementById('vad-adaptive-endpoint')?.checked ?? false,
         pre_speech_duration: parseFloat(document.getElementById('vad-pre-speech-duration')?.value || '0.2'),
     };
 }
@@ -175,6 +176,7 @@ function resolveVadConfig(config = {}) {
             vad.silence_duration ??
             legacyLocalAsr.silence_duration ??
             ((legacyAsr.vad_silence_duration_ms ?? 800) / 1000),
+        adaptive_endpoint: vad.adaptive_endpoint ?? false,
         pre_speech_duration:
             vad.pre_speech_duration ??
             legacyLocalAsr.pre_speech_duration ??
@@ -202,6 +204,9 @@ function applyVadConfig(config) {
     if (document.getElementById('vad-silence-duration')) {
         document.getElementById('vad-silence-duration').value = vad.silence_duration ?? 0.8;
     }
+    if (document.getElementById('vad-adaptive-endpoint')) {
+        document.getElementById('vad-adaptive-endpoint').checked = vad.adaptive_endpoint ?? false;
+    }
     if (document.getElementById('vad-pre-speech-duration')) {
         document.getElementById('vad-pre-speech-duration').value = vad.pre_speech_duration ?? 0.2;
     }
@@ -2622,6 +2627,7 @@ function loadDefaultConfig() {
         min_speech_duration: 1.0,
         max_speech_duration: 30.0,
         silence_duration: 0.8,
+        adaptive_endpoint: false,
         pre_speech_duration: 0.2,
     });
 
@@ -0,0 +1,105 @@
+"""
+共享 VAD 引擎：采集侧唯一运行 VAD 模型的地方。
+
+把采集帧切成 512 采样（16kHz 下 32ms）的块，每块只调用一次
+VADProcessor.process_chunk，产出逐块的 (音频, 置信度, 说话状态) 流：
+
+- 在线发送门控读取 ``is_speaking`` 决定是否把音频发往 ASR；
+- 本地识别器订阅逐块流，用同一串置信度驱动自己的分段状态机
+  （``VADProcessor.process_chunk(chunk, confidence=...)``），不再重复跑 Silero。
+
+两边使用同一套 VAD 参数和同一串置信度，状态机是同一份代码，因此说话
+起止边界一致。订阅回调在推送方线程（事件循环）内同步调用，必须廉价、
+不阻塞；跨线程消费者自行入队。
+"""
+
+from __future__ import annotations
+
+from typing import Callable, List, NamedTuple
+
+import numpy as np
+
+from audio_frame import FixedChunker
+
+# Silero 16kHz 固定窗口
+VAD_CHUNK_SAMPLES = 512
+
+
+class VADChunk(NamedTuple):
+    """逐块 VAD 结果。samples 为 float32，之后不会被改写，可跨线程持有。"""
+
+    index: int
+    samples: np.ndarray
+    confidence: float
+    is_speaking: bool
+
+
+class VADStream:
+    """包装唯一的 VADProcessor，对外发布逐块 VAD 结果。
+
+    Parameters
+    ----------
+    processor : VADProcessor
+        实际运行 VAD 的处理器（门控与本地识别共用）。
+    sample_rate : int
+        输入采样率 (Hz)。
+    chunk_samples : int
+        每块采样数。
+    """
+
+    def __init__(self, processor, sample_rate: int = 16000, chunk_samples: int = VAD_CHUNK_SAMPLES):
+        self.processor = processor
+        self.sample_rate = int(sample_rate)
+        self.chunk_samples = int(chunk_samples)
+        self.chunker = FixedChunker(self.chunk_samples)
+        # False：不做在线发送门控，音频由订阅者（本地识别器）随逐块流直接消费
+        self.gating = True
+        self._listeners: List[Callable[[VADChunk], None]] = []
+        self.chunks = 0
+        self.listener_errors = 0
+
+    @property
+    def is_speaking(self) -> bool:
+        return self.processor.is_speaking
+
+    @property
+    def last_confidence(self) -> float:
+        return self.processor.last_confidence
+
+    @property
+    def listeners(self) -> List[Callable[[VADChunk], None]]:
+        return list(self._listeners)
+
+    def subscribe(self, listener: Callable[[VADChunk], None]) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[VADChunk], None]) -> None:
+        try:
+            self._listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def push(self, samples: np.ndarray) -> List[VADChunk]:
+        """送入一段音频，返回本次凑满的块的 VAD 结果（同时通知订阅者）。"""
+        results = []
+        for chunk in self.chunker.push(samples):
+            self.processor.process_chunk(chunk)
+            result = VADChunk(
+                index=self.chunks,
+                samples=chunk,
+                confidence=float(self.processor.last_confidence),
+                is_speaking=bool(self.processor.is_speaking),
+            )
+            self.chunks += 1
+            for listener in self._listeners:
+                try:
+                    listener(result)
+                except Exception:
+                    self.listener_errors += 1
+            results.append(result)
+        return results
+
+    def reset(self) -> None:
+        """闭麦时调用：清空 VAD 状态与不足一块的尾部。"""
+        self.processor.reset()
+        self.chunker.reset()